@@ -5,21 +5,54 @@ Journal - Reflection rhythm system.
 Usage:
     journal.py              # Interactive menu
     journal.py day          # Create daily entry
+    journal.py day --lookback  # Show this day in earlier years, then create daily entry
+    journal.py lookback     # Entries from this day and ISO week in earlier years
     journal.py week review  # Create weekly review
     journal.py month review # Create monthly review (last completed month)
+    journal.py week review --batch FILE.jsonl   # Create weekly reviews without prompts
+    journal.py month review --batch FILE.jsonl  # Create monthly reviews without prompts
+    journal.py site OUTDIR  # Build/update a static HTML site of the archive
+    journal.py related      # Earlier entries with themes similar to this week
+    journal.py timeline     # Page through summary bullets, newest first
+    journal.py trends WORD... # Frequency of words per month
+    journal.py trends --top N # Each month's N most frequent words
+    journal.py backup DEST  # Incrementally mirror the journal into DEST
+    journal.py metrics      # Command latency percentiles and trends
+    journal.py normalize    # Show rewrites of old files into the canonical format
+    journal.py normalize --apply  # Rewrite them in place
+    journal.py doctor       # Check the archive, printing a JSON report
+    journal.py show week    # Print the week's aggregated review without prompting
+    journal.py show month   # Print the month's aggregated review (last completed month)
+    journal.py status       # One line for shell prompts: are today's entry and reviews done?
 
 Options:
     --date YYYY-MM-DD       Target a specific date instead of the default
+    --jobs N                Worker processes for site/normalize/doctor (default: all cores)
+    --top N                 Number of results for related/trends
+    --overwrite             Replace existing reviews in --batch mode (default: skip)
+    --prometheus FILE       Also write metrics in Prometheus textfile format
+    --output FILE           Write the doctor report to FILE instead of stdout
 """
 
 import sys
+
+# `status` runs from shell prompts every few seconds, so it is answered before
+# anything else is imported (run as `python3 -S journal.py status` to also skip
+# site-packages)
+if __name__ == "__main__" and sys.argv[1:] == ["status"]:
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from journal.status import status_line
+    print(status_line())
+    sys.exit(0)
+
 from datetime import datetime
 from pathlib import Path
 
 # Add parent dir to path for local development
 sys.path.insert(0, str(Path(__file__).parent))
 
-from journal import commands
+from journal import commands, instrument, metrics, status, ui
 
 
 def parse_date_flag(args):
@@ -49,18 +82,202 @@ def parse_date_flag(args):
     return remaining, target_date
 
 
+def parse_flag(args, flag, convert=str):
+    """Extract `flag VALUE` from args, returning (remaining_args, value).
+
+    The value is passed through convert; value is None if the flag is absent.
+    """
+    if flag not in args:
+        return args, None
+
+    idx = args.index(flag)
+
+    if idx + 1 >= len(args):
+        print(f"Error: {flag} requires a value.")
+        sys.exit(1)
+
+    try:
+        value = convert(args[idx + 1])
+    except ValueError:
+        print(f"Error: Invalid value '{args[idx + 1]}' for {flag}.")
+        sys.exit(1)
+
+    return args[:idx] + args[idx + 2:], value
+
+
+def usage_error(message):
+    """Print an error with the usage text and exit."""
+    print(f"Error: {message}")
+    print(__doc__)
+    sys.exit(1)
+
+
+def run_site(args, target_date=None):
+    """journal.py site OUTDIR [--jobs N]"""
+    args, jobs = parse_flag(args, "--jobs", int)
+    if len(args) != 1:
+        usage_error("site requires an output directory.")
+    commands.site(Path(args[0]).expanduser(), jobs=jobs)
+
+
+def run_related(args, target_date=None):
+    """journal.py related [--top N]"""
+    args, top = parse_flag(args, "--top", int)
+    if args:
+        usage_error(f"Unexpected arguments: {' '.join(args)}")
+    kwargs = {"target_date": target_date}
+    if top is not None:
+        kwargs["top"] = top
+    commands.related(**kwargs)
+
+
+def run_trends(args, target_date=None):
+    """journal.py trends WORD... | journal.py trends --top N"""
+    args, top = parse_flag(args, "--top", int)
+    kwargs = {"words": args}
+    if top is not None:
+        kwargs["top"] = top
+    commands.trends(**kwargs)
+
+
+def run_backup(args, target_date=None):
+    """journal.py backup DEST"""
+    if len(args) != 1:
+        usage_error("backup requires a destination directory.")
+    commands.backup(Path(args[0]).expanduser())
+
+
+def run_metrics(args, target_date=None):
+    """journal.py metrics [--prometheus FILE]"""
+    args, prometheus = parse_flag(args, "--prometheus")
+    if args:
+        usage_error(f"Unexpected arguments: {' '.join(args)}")
+    commands.metrics(Path(prometheus).expanduser() if prometheus else None)
+
+
+def run_normalize(args, target_date=None):
+    """journal.py normalize [--apply] [--jobs N]"""
+    args, jobs = parse_flag(args, "--jobs", int)
+    apply = "--apply" in args
+    args = [a for a in args if a != "--apply"]
+    if args:
+        usage_error(f"Unexpected arguments: {' '.join(args)}")
+    commands.normalize(apply=apply, jobs=jobs)
+
+
+def run_doctor(args, target_date=None):
+    """journal.py doctor [--output FILE] [--jobs N]"""
+    args, jobs = parse_flag(args, "--jobs", int)
+    args, output = parse_flag(args, "--output")
+    if args:
+        usage_error(f"Unexpected arguments: {' '.join(args)}")
+    issues = commands.doctor(Path(output).expanduser() if output else None, jobs=jobs)
+    if issues:
+        sys.exit(1)
+
+
+def run_show(args, target_date=None):
+    """journal.py show week|month"""
+    if len(args) != 1 or args[0].lower() not in ("week", "month"):
+        usage_error("show requires 'week' or 'month'.")
+    commands.show(args[0].lower(), target_date=target_date)
+
+
+def run_status(args, target_date=None):
+    """journal.py status (with --date; a bare `status` is answered at startup)"""
+    if args:
+        usage_error(f"Unexpected arguments: {' '.join(args)}")
+    print(status.status_line(target_date))
+
+
+# Commands that take their own arguments
+ARG_COMMANDS = {
+    "site": run_site,
+    "related": run_related,
+    "trends": run_trends,
+    "backup": run_backup,
+    "metrics": run_metrics,
+    "normalize": run_normalize,
+    "doctor": run_doctor,
+    "show": run_show,
+    "status": run_status,
+}
+
+
 def main():
     args = sys.argv[1:]
 
     # Extract --date flag before processing commands
     args, target_date = parse_date_flag(args)
 
+    label = command_label(args)
+
+    # $JOURNAL_IO_STATS=1 prints filesystem-operation counts for the command
+    with instrument.report_if_enabled(label):
+        if label == "metrics":
+            run_command(args, target_date=target_date)
+            return
+        with metrics.recording(label):
+            run_command(args, target_date=target_date)
+
+
+def command_label(args):
+    """Name a command line for reports and metrics, leaving out its arguments."""
+    if not args:
+        return "menu"
+    if args[0].lower() in ARG_COMMANDS:
+        return args[0].lower()
+    words = []
+    for arg in args:
+        if arg.startswith("--"):
+            break
+        words.append(arg.lower())
+    if "--batch" in args:
+        words.append("batch")
+    return " ".join(words)
+
+
+def run_batch(args, batch_file):
+    """journal.py week|month review --batch FILE.jsonl [--overwrite]"""
+    overwrite = "--overwrite" in args
+    cmd = " ".join(a for a in args if a != "--overwrite").lower()
+
+    batch_map = {
+        "week review": commands.week_review_batch,
+        "month review": commands.month_review_batch,
+    }
+    if cmd not in batch_map:
+        usage_error(f"--batch is not supported for '{cmd}'.")
+
+    try:
+        batch_map[cmd](batch_file, overwrite=overwrite)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def run_command(args, target_date=None):
+    """Dispatch a command line (with --date already removed)."""
+    # Non-interactive batch reviews
+    args, batch_file = parse_flag(args, "--batch")
+    if batch_file is not None:
+        run_batch(args, Path(batch_file).expanduser())
+        return
+
     if not args:
         # Interactive menu mode
         run_interactive_menu(target_date=target_date)
         return
 
+    # Commands that take their own arguments
+    name = args[0].lower()
+    if name in ARG_COMMANDS:
+        ARG_COMMANDS[name](args[1:], target_date=target_date)
+        return
+
     # Subcommand mode
+    lookback = "--lookback" in args
+    args = [a for a in args if a != "--lookback"]
     cmd = " ".join(args).lower()
 
     command_map = {
@@ -68,12 +285,19 @@ def main():
         "daily": commands.day,  # alias
         "week review": commands.week_review,
         "month review": commands.month_review,
+        "timeline": commands.timeline,
+        "lookback": commands.lookback,
     }
 
+    if lookback and command_map.get(cmd) is not commands.day:
+        usage_error("--lookback is only supported for 'day'.")
+
     if cmd in command_map:
         kwargs = {}
         if target_date is not None:
             kwargs["target_date"] = target_date
+        if lookback:
+            kwargs["lookback"] = True
         command_map[cmd](**kwargs)
     else:
         print(f"Unknown command: {cmd}")
@@ -98,7 +322,7 @@ def run_interactive_menu(target_date=None):
         print("0. Exit")
         print()
 
-        choice = input("Select an option (0-3): ").strip()
+        choice = ui.prompt("Select an option (0-3): ")
 
         if choice == "0":
             print("Goodbye!")
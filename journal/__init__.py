@@ -2,12 +2,16 @@
 Journal system - personal productivity through weekly planning and daily reflection.
 """
 
-from . import config
-from . import models
-from . import parser
-from . import templates
-from . import io
-from . import ui
-from . import commands
+__all__ = [
+    "config", "cache", "models", "references", "parser", "archive", "text",
+    "templates", "io", "ui", "commands", "dates", "status", "metrics", "instrument",
+]
 
-__all__ = ["config", "models", "parser", "templates", "io", "ui", "commands"]
+
+def __getattr__(name):
+    # Submodules are imported on first use, so `status` (run from shell
+    # prompts every few seconds) doesn't load the parser, templates or UI
+    if name in __all__:
+        from importlib import import_module
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,90 @@
+"""
+Archive scanning.
+Enumerates journal files under JOURNAL_DIR by kind and date.
+"""
+
+import os
+import re
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from . import config, metrics
+from .models import ArchiveEntry
+
+
+KINDS = ("daily", "review", "monthly")
+
+# daily-YYYY-MM-DD.md, review-YYYY-MM-DD.md, monthly-YYYY-MM.md
+FILENAME_PATTERN = re.compile(
+    r"^(?:(daily|review)-(\d{4})-(\d{2})-(\d{2})|(monthly)-(\d{4})-(\d{2}))\.md$"
+)
+
+
+def parse_filename(name: str) -> tuple[str, date] | None:
+    """Get (kind, date) from a journal file name, or None if it isn't one."""
+    match = FILENAME_PATTERN.match(name)
+    if not match:
+        return None
+    try:
+        if match.group(1):
+            kind = match.group(1)
+            d = date(int(match.group(2)), int(match.group(3)), int(match.group(4)))
+        else:
+            kind = match.group(5)
+            d = date(int(match.group(6)), int(match.group(7)), 1)
+    except ValueError:
+        return None
+    return kind, d
+
+
+@metrics.timed("scan")
+def _numbered_dirs(parent: Path, width: int) -> list[str]:
+    """Names of subdirectories that are all digits of the given width."""
+    try:
+        with os.scandir(parent) as it:
+            return [
+                e.name for e in it
+                if len(e.name) == width and e.name.isdigit() and e.is_dir()
+            ]
+    except OSError:
+        return []
+
+
+def iter_months(reverse: bool = False) -> Iterator[tuple[int, int, Path]]:
+    """Yield (year, month, directory) for each month directory in date order."""
+    root = config.JOURNAL_DIR
+    for year in sorted(_numbered_dirs(root, 4), reverse=reverse):
+        year_dir = root / year
+        for month in sorted(_numbered_dirs(year_dir, 2), reverse=reverse):
+            yield int(year), int(month), year_dir / month
+
+
+@metrics.timed("scan")
+def month_entries(month_dir: Path, reverse: bool = False) -> list[ArchiveEntry]:
+    """Journal files in one month directory, ordered by date then kind."""
+    entries = []
+    try:
+        with os.scandir(month_dir) as it:
+            for e in it:
+                parsed = parse_filename(e.name)
+                if parsed:
+                    entries.append(ArchiveEntry(parsed[0], parsed[1], Path(e.path)))
+    except OSError:
+        return []
+    # Monthly reviews sort after everything else in their month
+    entries.sort(
+        key=lambda e: (e.kind == "monthly", e.date, KINDS.index(e.kind)),
+        reverse=reverse,
+    )
+    return entries
+
+
+def iter_entries(reverse: bool = False, kinds: tuple[str, ...] = KINDS) -> Iterator[ArchiveEntry]:
+    """
+    Yield journal files in date order (newest first if reverse).
+    Directories are listed one month at a time, so stopping early skips the rest.
+    """
+    for _, _, month_dir in iter_months(reverse=reverse):
+        for entry in month_entries(month_dir, reverse=reverse):
+            if entry.kind in kinds:
+                yield entry
@@ -0,0 +1,36 @@
+"""
+Persistent caches.
+Small JSON documents kept under JOURNAL_DIR/.cache so they live on the same
+(encrypted) volume as the entries they are derived from.
+"""
+
+import json
+from pathlib import Path
+from . import config, io
+
+
+CACHE_DIRNAME = ".cache"
+
+
+def cache_dir() -> Path:
+    """Directory holding all persistent caches."""
+    return config.JOURNAL_DIR / CACHE_DIRNAME
+
+
+def cache_path(name: str) -> Path:
+    """Path of the named cache file."""
+    return cache_dir() / f"{name}.json"
+
+
+def load(name: str) -> dict:
+    """Load a named cache, returning an empty dict if it is missing or unreadable."""
+    try:
+        data = json.loads(cache_path(name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save(name: str, data: dict) -> None:
+    """Atomically replace a named cache with data."""
+    io.write_atomic(cache_path(name), json.dumps(data, separators=(",", ":")))
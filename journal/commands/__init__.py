@@ -2,6 +2,21 @@
 
 from .day import run as day
 from .week_review import run as week_review
+from .week_review import run_batch as week_review_batch
 from .month_review import run as month_review
+from .month_review import run_batch as month_review_batch
+from .site import run as site
+from .related import run as related
+from .timeline import run as timeline
+from .trends import run as trends
+from .backup import run as backup
+from .metrics import run as metrics
+from .normalize import run as normalize
+from .doctor import run as doctor
+from .lookback import run as lookback
+from .show import run as show
 
-__all__ = ["day", "week_review", "month_review"]
+__all__ = [
+    "day", "week_review", "week_review_batch", "month_review", "month_review_batch", "site", "related", "timeline", "trends",
+    "backup", "metrics", "normalize", "doctor", "lookback", "show",
+]
@@ -0,0 +1,102 @@
+"""Cache refreshing while the editor is open."""
+
+import os
+import sys
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import date
+from journal import cache, config, references
+from . import lookback, related, trends
+
+
+# Set $JOURNAL_BACKGROUND=0 to keep the editor window idle
+ENV_VAR = "JOURNAL_BACKGROUND"
+
+
+def enabled() -> bool:
+    """Whether caches are refreshed while the editor is open (default on)."""
+    return os.environ.get(ENV_VAR, "1") not in ("", "0")
+
+
+def _lower_priority() -> None:
+    """Renice the calling thread; on Linux each thread has its own nice value."""
+    if sys.platform.startswith("linux"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError:
+            pass
+
+
+def tasks(target_date: date, cancelled: Callable[[], bool] = lambda: False) -> list[tuple[str, Callable[[], object]]]:
+    """
+    Refresh jobs for the editor window, most useful first.
+
+    The week's daily entries are always pre-parsed into their week's file of
+    the expansion cache (see references.journal_texts) for the upcoming
+    weekly review; other indexes are refreshed only if they
+    already exist, so nothing is built that the user hasn't asked for. The
+    archive-wide refreshes check cancelled before each file or directory.
+    """
+    week = config.get_week_dates(target_date)
+    jobs = [("daily texts", lambda: references.journal_texts(week))]
+    if cache.cache_path(lookback.CACHE_NAME).exists():
+        jobs.append(("lookback index", lambda: lookback.load_index(cancelled=cancelled)))
+    if cache.cache_path(trends.CACHE_NAME).exists():
+        jobs.append(("trends", lambda: trends.monthly_totals(cancelled=cancelled)))
+    if cache.cache_path(related.CACHE_NAME).exists():
+        def refresh_related():
+            index = related.TermIndex.load()
+            index.refresh(cancelled=cancelled)
+            if index.changed:
+                index.save()
+        jobs.append(("related index", refresh_related))
+    return jobs
+
+
+class Worker(threading.Thread):
+    """
+    Runs refresh tasks one at a time at low priority until done or stopped.
+
+    Stopping takes effect between tasks, and within the archive-wide tasks
+    between files, so closing the editor never waits for a whole rescan.
+    Every cache is replaced atomically and holds only fully updated files,
+    so a stop (or a crash) leaves each one consistent.
+    """
+
+    def __init__(self, target_date: date):
+        super().__init__(name="journal-background", daemon=True)
+        self.target_date = target_date
+        self.stop_event = threading.Event()
+        self.done = []
+        self.errors = []
+
+    def run(self):
+        _lower_priority()
+        for name, task in tasks(self.target_date, self.stop_event.is_set):
+            if self.stop_event.is_set():
+                return
+            try:
+                task()
+                self.done.append(name)
+            except Exception as e:
+                self.errors.append(f"{name}: {e}")
+
+    def stop(self) -> None:
+        """Ask the worker to stop after its current task and wait for it."""
+        self.stop_event.set()
+        self.join()
+
+
+@contextmanager
+def refreshing(target_date: date):
+    """Refresh caches in a background thread for the duration of the block."""
+    if not enabled():
+        yield None
+        return
+    worker = Worker(target_date)
+    worker.start()
+    try:
+        yield worker
+    finally:
+        worker.stop()
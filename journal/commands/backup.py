@@ -0,0 +1,105 @@
+"""Incremental backup command."""
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from journal import config, io
+
+
+MANIFEST_NAME = ".backup-manifest.json"
+DELETIONS_LOG = ".backup-deletions.log"
+
+# Copies are I/O bound, so threads overlap them well
+COPY_WORKERS = 8
+
+
+def scan_source(root: Path) -> dict[str, os.stat_result]:
+    """
+    Stat every file under root, skipping dotfiles and dot-directories such as
+    .cache and the metrics log (which changes on every command), and temp files.
+    """
+    found = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith(".") or name.endswith(".tmp"):
+                continue
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            found[rel] = os.stat(path)
+    return found
+
+
+def copy_atomic(src: Path, dest: Path) -> None:
+    """Copy src to dest (with its mtime) through a temp file renamed into place."""
+    config.ensure_dir(dest)
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def backup(dest: Path) -> dict:
+    """
+    Mirror JOURNAL_DIR into dest, copying only new or changed files.
+
+    dest/.backup-manifest.json holds [size, mtime_ns, sha256] per file from the
+    previous run. Files whose size and mtime match are skipped on stat alone;
+    the rest are hashed and copied only if their content changed. Files gone
+    from the journal are logged to dest/.backup-deletions.log and dropped from
+    the manifest, but their backup copies are kept.
+    """
+    root = config.JOURNAL_DIR
+    manifest_path = dest / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+
+    current = {}
+    to_copy = []
+    for rel, st in scan_source(root).items():
+        old = manifest.get(rel)
+        if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+            current[rel] = old
+            continue
+        digest = io.file_hash(root / rel)
+        current[rel] = [st.st_size, st.st_mtime_ns, digest]
+        if not old or old[2] != digest or not (dest / rel).exists():
+            to_copy.append(rel)
+
+    if to_copy:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            list(pool.map(lambda rel: copy_atomic(root / rel, dest / rel), to_copy))
+
+    deleted = sorted(manifest.keys() - current.keys())
+    if deleted:
+        stamp = datetime.now().isoformat(timespec="seconds")
+        with open(dest / DELETIONS_LOG, "a", encoding="utf-8") as f:
+            for rel in deleted:
+                f.write(f"{stamp}\t{rel}\n")
+
+    if to_copy or deleted or current != manifest:
+        io.write_atomic(manifest_path, json.dumps(current, separators=(",", ":")))
+
+    return {
+        "copied": len(to_copy),
+        "unchanged": len(current) - len(to_copy),
+        "deleted": len(deleted),
+    }
+
+
+def run(dest: Path):
+    """Back up the journal directory to dest."""
+    start = time.perf_counter()
+    counts = backup(dest)
+    elapsed = time.perf_counter() - start
+    print(f"Backup: {counts['copied']} copied, {counts['unchanged']} unchanged, "
+          f"{counts['deleted']} deleted (recorded) in {elapsed:.2f}s.")
@@ -1,7 +1,9 @@
 """Base utilities for commands."""
 
+import json
+from datetime import date
 from pathlib import Path
-from journal import ui
+from journal import archive, metrics, parser, ui
 
 
 def run_with_existing_check(filepath: Path, file_type: str, create_fn):
@@ -13,9 +15,102 @@ def run_with_existing_check(filepath: Path, file_type: str, create_fn):
         file_type: Human-readable description for prompts
         create_fn: Callable that creates the file content and writes it
     """
-    if filepath.exists():
+    with metrics.phase("scan"):
+        exists = filepath.exists()
+    if exists:
         action = ui.handle_existing_file(filepath, file_type)
         if action != 'recreate':
             return
 
     create_fn()
+
+
+class FileSource:
+    """Existence checks and parsing straight from the filesystem."""
+
+    @metrics.timed("scan")
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def parse(self, path: Path):
+        return parser.parse_file(path)
+
+    def added(self, path: Path) -> None:
+        """Note that a file was written."""
+
+
+class ArchiveSnapshot(FileSource):
+    """
+    One scan of the archive shared by many commands in a batch.
+
+    Existence checks are answered from a single directory walk, and each
+    file is parsed at most once.
+    """
+
+    def __init__(self):
+        self.paths = {entry.path for entry in archive.iter_entries()}
+        self._parsed = {}
+
+    def exists(self, path: Path) -> bool:
+        return path in self.paths
+
+    def parse(self, path: Path):
+        if path not in self._parsed:
+            self._parsed[path] = parser.parse_file(path) if path in self.paths else None
+        return self._parsed[path]
+
+    def added(self, path: Path) -> None:
+        self.paths.add(path)
+        self._parsed.pop(path, None)
+
+
+def load_batch(batch_file: Path) -> list[dict]:
+    """
+    Read batch review requests, one JSON object per line:
+
+        {"date": "YYYY-MM-DD", "reflection": "...", "summary": ["...", ...]}
+
+    An optional boolean "overwrite" overrides the batch-wide overwrite rule.
+    A null reflection or summary counts as empty. Blank lines are ignored.
+    Raises ValueError naming the offending line.
+    """
+    items = []
+    with open(batch_file, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                if not isinstance(item, dict):
+                    raise ValueError("expected a JSON object")
+                reflection = item.get("reflection") or ""
+                if not isinstance(reflection, str):
+                    raise ValueError("reflection must be a string")
+                summary = item.get("summary") or []
+                if not isinstance(summary, list) or not all(isinstance(b, str) for b in summary):
+                    raise ValueError("summary must be a list of bullets (strings)")
+                overwrite = item.get("overwrite")
+                if overwrite is not None and not isinstance(overwrite, bool):
+                    raise ValueError("overwrite must be true or false")
+                items.append({
+                    "date": date.fromisoformat(item["date"]),
+                    "reflection": reflection.strip(),
+                    "summary": [b.strip() for b in summary if b.strip()],
+                    "overwrite": overwrite,
+                })
+            except KeyError:
+                raise ValueError(f"{batch_file}:{lineno}: missing \"date\"")
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"{batch_file}:{lineno}: {e}")
+    return items
+
+
+def should_write(filepath: Path, file_type: str, source: FileSource, overwrite: bool) -> bool:
+    """Non-interactive stand-in for handle_existing_file: replace only if allowed."""
+    if not source.exists(filepath):
+        return True
+    if overwrite:
+        print(f"{file_type} already exists, replacing: {filepath}")
+        return True
+    print(f"{file_type} already exists, skipping: {filepath}")
+    return False
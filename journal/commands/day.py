@@ -2,14 +2,21 @@
 
 from datetime import date
 from journal import config, parser, templates, ui, io
+from .background import refreshing
 from .base import run_with_existing_check
+from .lookback import lookback_lines
 
 
-def run(target_date: date = None):
-    """Create a daily journal entry."""
+def run(target_date: date = None, lookback: bool = False):
+    """Create a daily journal entry, optionally after showing earlier years' entries."""
     if target_date is None:
         target_date = date.today()
 
+    if lookback:
+        lines = lookback_lines(target_date)
+        if lines:
+            print("\n".join(lines) + "\n")
+
     filepath = config.daily_path(target_date)
 
     def create_daily_entry():
@@ -19,7 +26,9 @@ def run(target_date: date = None):
         io.write_file(filepath, content)
 
         print("\nOpening editor for journal entry...")
-        ui.open_in_editor(filepath, daily_entry=True, timer_minutes=15)
+        # Caches are refreshed at low priority while the editor is open
+        with refreshing(target_date):
+            ui.open_in_editor(filepath, daily_entry=True, timer_minutes=15)
 
         parsed = parser.parse_file(filepath)
         if parsed:
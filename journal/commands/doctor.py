@@ -0,0 +1,207 @@
+"""Archive health check command."""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from journal import archive, cache, config, io, parser, references
+from journal.commands.normalize import NormalizeError, canonical_text, split_front_matter
+
+
+CACHE_NAME = "doctor"
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+
+def expected_path(kind: str, d: date) -> Path:
+    """Where config would put a file of this kind and date."""
+    if kind == "daily":
+        return config.daily_path(d)
+    if kind == "review":
+        return config.review_path(d)
+    return config.monthly_path(d)
+
+
+def scan_tree() -> tuple[list[tuple[str, str, date]], list[dict]]:
+    """
+    Walk JOURNAL_DIR, skipping dotfiles and dot-directories such as .cache.
+
+    Returns (journal files as (rel, kind, date), misnamed-file issues). A file
+    is misnamed if its name isn't a journal file name or it isn't where
+    config would put it.
+    """
+    root = config.JOURNAL_DIR
+    files = []
+    issues = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            if name.startswith("."):
+                continue
+            path = Path(dirpath) / name
+            rel = path.relative_to(root).as_posix()
+            parsed = archive.parse_filename(name)
+            if parsed is None:
+                issues.append({"path": rel, "check": "misnamed", "detail": "not a journal file name"})
+                continue
+            kind, d = parsed
+            expected = expected_path(kind, d)
+            if expected != path:
+                issues.append({"path": rel, "check": "misnamed",
+                               "detail": f"expected {expected.relative_to(root).as_posix()}"})
+            files.append((rel, kind, d))
+    return files, issues
+
+
+def check_file(job: tuple) -> list[dict]:
+    """Checks needing a file's content. Runs in a worker process."""
+    path, rel, kind, journal_dir = job
+    config.JOURNAL_DIR = Path(journal_dir)
+
+    def issue(check, detail):
+        return {"path": rel, "check": check, "detail": detail}
+
+    try:
+        parsed = parser.parse_file(Path(path))
+    except Exception as e:
+        return [issue("unreadable", f"{type(e).__name__}: {e}")]
+    if parsed is None:
+        return [issue("unreadable", "parse_file could not read the file")]
+
+    issues = []
+    _, body = split_front_matter(parsed.raw_lines)
+    if parsed.canonical:
+        names = [name for name, _ in parser.iter_canonical_sections(body[1:]) if name]
+        repeated = sorted({name for name in names if names.count(name) > 1})
+        if repeated:
+            issues.append(issue("content-loss", f"repeated section(s): {', '.join(repeated)}"))
+    else:
+        try:
+            canonical_text(parsed.raw_lines)
+        except NormalizeError as e:
+            issues.append(issue("content-loss", str(e)))
+
+    if kind == "daily" and not parsed.get_section_text("journal"):
+        issues.append(issue("empty-journal", "journal section is missing or empty"))
+    if kind == "review":
+        # Read-only: workers run in parallel and must not save the expansion cache
+        drifted = references.find_drift(parsed.sections.get("daily_entries", []))
+        if drifted:
+            issues.append(issue("drift", "daily entries changed or missing since the review was written: "
+                                         + ", ".join(str(d) for d in drifted)))
+    return issues
+
+
+def check_archive(files: list[tuple[str, str, date]], today: date) -> list[dict]:
+    """
+    Checks across files, from their names alone: duplicates (two files for
+    one date, or two reviews for one week), reviews with nothing to review,
+    and weekly reviews in a finished month that has no monthly review.
+    """
+    root = config.JOURNAL_DIR
+    by_kind = {kind: {} for kind in archive.KINDS}
+    # Correctly named files first, so a misplaced copy is the one reported
+    for rel, kind, d in sorted(files, key=lambda f: (root / f[0] != expected_path(f[1], f[2]), f[0])):
+        key = config.get_sunday(d) if kind == "review" else d
+        by_kind[kind].setdefault(key, []).append(rel)
+
+    issues = []
+    for kind, found in by_kind.items():
+        for rels in found.values():
+            for rel in rels[1:]:
+                issues.append({"path": rel, "check": "duplicate",
+                               "detail": f"same {'week' if kind == 'review' else 'date'} as {rels[0]}"})
+
+    for sunday, rels in sorted(by_kind["review"].items()):
+        saturday = sunday + timedelta(days=6)
+        if not any(d in by_kind["daily"] for d in config.get_week_dates(sunday)):
+            issues.append({"path": rels[0], "check": "orphaned-review", "detail": "no daily entries that week"})
+
+        # Only months whose weeks have all ended are expected to have a review
+        year, month = config.week_owner(saturday)
+        if (date(year, month, 1) not in by_kind["monthly"]
+                and config.last_week_end_of_month(year, month) <= today):
+            issues.append({"path": rels[0], "check": "missing-monthly",
+                           "detail": f"no monthly review for {year}-{month:02d}"})
+
+    for first, rels in sorted(by_kind["monthly"].items()):
+        year, month = first.year, first.month
+        saturday = config.last_week_end_of_month(year, month)
+        weeks = []
+        while config.week_owner(saturday) == (year, month):
+            weeks.append(config.get_sunday(saturday))
+            saturday -= timedelta(days=7)
+        if not any(sunday in by_kind["review"] for sunday in weeks):
+            issues.append({"path": rels[0], "check": "orphaned-review", "detail": "no weekly reviews that month"})
+    return issues
+
+
+def diagnose(jobs: int | None = None, today: date | None = None) -> dict:
+    """
+    Check the archive and return a report.
+
+    Content checks run in a process pool for large archives and are skipped
+    for files whose size and mtime (and, for weekly reviews, those of the
+    week's dailies) match their last clean check, recorded in the "doctor"
+    cache. Name-based checks always run.
+    """
+    if today is None:
+        today = date.today()
+    root = config.JOURNAL_DIR
+    files, issues = scan_tree()
+
+    clean = cache.load(CACHE_NAME).get("clean", {})
+    stamps = {}
+    pending = []
+    for rel, _, _ in files:
+        st = (root / rel).stat()
+        stamps[rel] = [st.st_size, st.st_mtime_ns]
+    # A review's drift depends on its week's dailies
+    for rel, kind, d in files:
+        if kind == "review":
+            dailies = [config.daily_path(day).relative_to(root).as_posix() for day in config.get_week_dates(d)]
+            stamps[rel] = stamps[rel] + [stamps.get(daily) for daily in dailies]
+    for rel, kind, _ in files:
+        if clean.get(rel) != stamps[rel]:
+            pending.append((str(root / rel), rel, kind, str(root)))
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check_file, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+    else:
+        results = [check_file(job) for job in pending]
+
+    flagged = set()
+    for file_issues in results:
+        issues.extend(file_issues)
+        flagged.update(i["path"] for i in file_issues)
+
+    new_clean = {rel: stamp for rel, stamp in stamps.items() if rel not in flagged}
+    if new_clean != clean:
+        cache.save(CACHE_NAME, {"clean": new_clean})
+
+    issues.extend(check_archive(files, today))
+    issues.sort(key=lambda i: (i["path"], i["check"]))
+    return {
+        "files": len(files),
+        "checked": len(pending),
+        "skipped": len(files) - len(pending),
+        "issues": issues,
+    }
+
+
+def run(output: Path = None, jobs: int | None = None) -> int:
+    """Print (or write to output) a JSON report; returns the issue count."""
+    report = diagnose(jobs=jobs)
+    text = json.dumps(report, indent=2) + "\n"
+    if output is None:
+        print(text, end="")
+    else:
+        io.write_atomic(output, text)
+        print(f"Doctor: {len(report['issues'])} issue(s) in {report['files']} files "
+              f"({report['skipped']} unchanged since last clean check). Report: {output}")
+    return len(report["issues"])
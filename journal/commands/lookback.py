@@ -0,0 +1,160 @@
+"""On-this-day lookback command."""
+
+import os
+from collections.abc import Callable
+from datetime import date
+from journal import archive, cache, config, parser
+
+
+CACHE_NAME = "lookback"
+
+# Characters of each same-week entry shown
+PREVIEW_LENGTH = 72
+
+
+def day_key(d: date) -> str:
+    """Index key for a calendar day in any year."""
+    return f"{d.month:02d}-{d.day:02d}"
+
+
+def week_key(d: date) -> str:
+    """Index key for an ISO week in any year."""
+    return f"{d.isocalendar()[1]:02d}"
+
+
+def relevant_dirs(target: date, years: list[int]) -> set[str]:
+    """
+    Month directories (YYYY/MM) that can hold a past entry for the target's
+    day or ISO week: the same month in every year, plus the months the same
+    ISO week spans that year.
+    """
+    week = target.isocalendar()[1]
+    dirs = set()
+    for year in years:
+        dirs.add(f"{year}/{target.month:02d}")
+        try:
+            week_dates = [date.fromisocalendar(year, week, day) for day in range(1, 8)]
+        except ValueError:
+            # Not every year has an ISO week 53
+            continue
+        dirs.update(f"{d.year}/{d.month:02d}" for d in week_dates)
+    return dirs
+
+
+def load_index(dirs: set[str] | None = None, cancelled: Callable[[], bool] | None = None) -> dict:
+    """
+    The (month, day) and ISO week -> daily files index, refreshed for dirs.
+
+    The index is kept in the "lookback" cache with each month directory's
+    mtime; only directories in dirs (every month directory if None) are
+    stat'ed, and only those whose mtime changed are listed again.
+
+    cancelled is checked before each directory is listed; once it returns
+    True the directories not yet listed are left out of the saved index, to
+    be listed on the next refresh.
+    """
+    root = config.JOURNAL_DIR
+    index = cache.load(CACHE_NAME)
+    known = index.setdefault("dirs", {})
+    days = index.setdefault("days", {})
+    weeks = index.setdefault("weeks", {})
+
+    if dirs is None:
+        dirs = {f"{year}/{month:02d}" for year, month, _ in archive.iter_months()} | known.keys()
+
+    changed = set()
+    for rel in dirs:
+        try:
+            mtime_ns = os.stat(root / rel).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if known.get(rel) != mtime_ns:
+            changed.add(rel)
+            if mtime_ns is None:
+                known.pop(rel, None)
+            else:
+                known[rel] = mtime_ns
+    if not changed:
+        return index
+
+    for table in (days, weeks):
+        for key in list(table):
+            table[key] = [f for f in table[key] if f.rsplit("/", 1)[0] not in changed]
+            if not table[key]:
+                del table[key]
+
+    for rel in sorted(changed):
+        if cancelled and cancelled():
+            known.pop(rel, None)
+            continue
+        for entry in archive.month_entries(root / rel):
+            if entry.kind == "daily":
+                path = entry.path.relative_to(root).as_posix()
+                days.setdefault(day_key(entry.date), []).append(path)
+                weeks.setdefault(week_key(entry.date), []).append(path)
+
+    cache.save(CACHE_NAME, index)
+    return index
+
+
+def _date_of(rel: str) -> date:
+    return archive.parse_filename(rel.rsplit("/", 1)[1])[1]
+
+
+def lookback(target: date) -> tuple[list[date], list[date]]:
+    """
+    Dates of earlier-year daily entries on the target's day, and in its ISO
+    week (excluding those same-day entries), newest first.
+    """
+    years = [int(y) for y in archive._numbered_dirs(config.JOURNAL_DIR, 4) if int(y) < target.year]
+    if not years:
+        return [], []
+    index = load_index(relevant_dirs(target, years))
+
+    same_day = sorted((_date_of(rel) for rel in index["days"].get(day_key(target), [])
+                       if _date_of(rel).year < target.year), reverse=True)
+    same_week = sorted((_date_of(rel) for rel in index["weeks"].get(week_key(target), [])
+                        if _date_of(rel).isocalendar()[0] < target.isocalendar()[0]
+                        and _date_of(rel) not in same_day), reverse=True)
+    return same_day, same_week
+
+
+def lookback_lines(target: date) -> list[str]:
+    """Lines showing what was written on this day and week in earlier years."""
+    same_day, same_week = lookback(target)
+    lines = []
+
+    def journal_text(d):
+        parsed = parser.parse_file(config.daily_path(d), sections={"journal"})
+        return parsed.get_section_text("journal") if parsed else ""
+
+    if same_day:
+        lines.append(f"=== On this day ({target.strftime('%B %d')}) ===")
+        for d in same_day:
+            lines += ["", f"--- {d.strftime('%A, %B %d, %Y')} ---", journal_text(d) or "(empty)"]
+
+    if same_week:
+        if lines:
+            lines.append("")
+        lines.append(f"=== This week (ISO week {target.isocalendar()[1]}) in earlier years ===")
+        year = None
+        for d in same_week:
+            if d.isocalendar()[0] != year:
+                year = d.isocalendar()[0]
+                lines += ["", f"{year}:"]
+            preview = " ".join(journal_text(d).split())
+            if len(preview) > PREVIEW_LENGTH:
+                preview = preview[:PREVIEW_LENGTH - 3] + "..."
+            lines.append(f"  {d.strftime('%a %b %d')}: {preview or '(empty)'}")
+    return lines
+
+
+def run(target_date: date = None):
+    """Show entries from this day and week in earlier years."""
+    if target_date is None:
+        target_date = date.today()
+    lines = lookback_lines(target_date)
+    if not lines:
+        print(f"  (No entries from earlier years around {target_date.strftime('%B %d')})")
+        return
+    print("\n".join(lines))
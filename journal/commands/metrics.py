@@ -0,0 +1,31 @@
+"""Command latency metrics command."""
+
+from pathlib import Path
+from journal import io, metrics
+
+
+def run(prometheus: Path = None):
+    """Summarize recorded command latencies, optionally exporting them."""
+    records = metrics.read_records()
+    summary = metrics.summarize(records)
+
+    if prometheus is not None:
+        archive_files = records[-1].get("archive") if records else None
+        io.write_atomic(prometheus, metrics.prometheus_text(summary, archive_files))
+        print(f"Wrote Prometheus metrics to: {prometheus}")
+
+    if not summary:
+        print("  (No metrics recorded yet)")
+        return
+
+    print(f"=== Command latency ({len(records)} runs, excluding editor and prompts) ===\n")
+    print(f"{'command':<20} {'runs':>5} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}  {'ms/1k files':>11}  last run")
+    for command, s in summary.items():
+        trend = f"{s['trend']:+.1f}" if s["trend"] is not None else "-"
+        print(f"{command:<20} {s['count']:>5} {s['p50']:>8.1f} {s['p90']:>8.1f} {s['p99']:>8.1f}  {trend:>11}  {s['last']}")
+
+    print("\n=== Median phase times (ms) ===\n")
+    for command, s in summary.items():
+        if s["phases"]:
+            phases = ", ".join(f"{p} {ms:.1f}" for p, ms in s["phases"].items())
+            print(f"{command:<20} {phases}")
@@ -2,8 +2,9 @@
 
 import calendar
 from datetime import date, timedelta
-from journal import config, parser, templates, ui, io
-from .base import run_with_existing_check
+from pathlib import Path
+from journal import config, templates, ui, io
+from .base import ArchiveSnapshot, FileSource, load_batch, run_with_existing_check, should_write
 
 
 def get_month_dates(d: date) -> list[date]:
@@ -13,12 +14,15 @@ def get_month_dates(d: date) -> list[date]:
     return [date(year, month, day) for day in range(1, num_days + 1)]
 
 
-def find_weekly_reviews_for_month(d: date) -> list[tuple[date, any]]:
+def find_weekly_reviews_for_month(d: date, source: FileSource = None) -> list[tuple[date, any]]:
     """Find all weekly review files for the month containing date d.
 
     A week that straddles a month boundary counts toward whichever month owns
     most of its days, so no weekly review appears in two monthly reviews.
     """
+    if source is None:
+        source = FileSource()
+
     reviews = []
     month_dates = get_month_dates(d)
 
@@ -33,41 +37,74 @@ def find_weekly_reviews_for_month(d: date) -> list[tuple[date, any]]:
             # Review is on Saturday of that week
             saturday = sunday + timedelta(days=6)
             review_file = config.review_path(saturday)
-            if review_file.exists():
+            if source.exists(review_file):
                 reviews.append((sunday, review_file))
 
     return sorted(reviews, key=lambda x: x[0])
 
 
-def find_daily_entries_for_month(d: date) -> list[any]:
+def find_daily_entries_for_month(d: date, source: FileSource = None) -> list[any]:
     """Find all daily entry files for the month containing date d."""
+    if source is None:
+        source = FileSource()
+
     entries = []
     for day in get_month_dates(d):
         daily_file = config.daily_path(day)
-        if daily_file.exists():
+        if source.exists(daily_file):
             entries.append(daily_file)
     return entries
 
 
-def collect_weekly_reflections(d: date) -> list[tuple[date, str]]:
-    """Collect 'how did this week go' reflections from each weekly review in the month."""
-    weekly_reviews = find_weekly_reviews_for_month(d)
+def parse_weekly_reviews(weekly_reviews: list[tuple[date, any]], source: FileSource = None) -> list[tuple[date, any]]:
+    """Parse each (sunday, review_file) once, returning (sunday, parsed) pairs."""
+    if source is None:
+        source = FileSource()
 
-    reflections = []
+    parsed_reviews = []
     for sunday, review_file in weekly_reviews:
-        parsed = parser.parse_file(review_file)
+        parsed = source.parse(review_file)
         if parsed:
-            reflection = parsed.get_section_text("weekly_reflection")
-            if reflection:
-                reflections.append((sunday, reflection))
+            parsed_reviews.append((sunday, parsed))
+    return parsed_reviews
+
+
+def collect_weekly_reflections(d: date, parsed_reviews: list[tuple[date, any]] = None) -> list[tuple[date, str]]:
+    """Collect 'how did this week go' reflections from each weekly review in the month."""
+    if parsed_reviews is None:
+        parsed_reviews = parse_weekly_reviews(find_weekly_reviews_for_month(d))
+
+    reflections = []
+    for sunday, parsed in parsed_reviews:
+        reflection = parsed.get_section_text("weekly_reflection")
+        if reflection:
+            reflections.append((sunday, reflection))
 
     return reflections
 
 
-def calculate_consistency(d: date) -> dict:
+def collect_weekly_summaries(d: date, parsed_reviews: list[tuple[date, any]] = None) -> list[tuple[date, list[str]]]:
+    """Collect summary bullets from each weekly review in the month."""
+    if parsed_reviews is None:
+        parsed_reviews = parse_weekly_reviews(find_weekly_reviews_for_month(d))
+
+    summaries = []
+    for sunday, parsed in parsed_reviews:
+        summary = parsed.get_list_items("weekly_summary")
+        if summary:
+            summaries.append((sunday, summary))
+
+    return summaries
+
+
+def calculate_consistency(d: date, weekly_reviews: list[tuple[date, any]] = None,
+                          source: FileSource = None) -> dict:
     """Calculate consistency metrics for the month."""
-    daily_count = len(find_daily_entries_for_month(d))
-    weekly_review_count = len(find_weekly_reviews_for_month(d))
+    if weekly_reviews is None:
+        weekly_reviews = find_weekly_reviews_for_month(d, source)
+
+    daily_count = len(find_daily_entries_for_month(d, source))
+    weekly_review_count = len(weekly_reviews)
 
     return {
         "daily_entries": daily_count,
@@ -91,15 +128,19 @@ def run(target_date: date = None):
     def create_monthly_review():
         print(f"\n=== Monthly Review for {month_name} ===\n")
 
+        # Scan and parse the month's weekly reviews once for every section below
+        weekly_reviews = find_weekly_reviews_for_month(target_date)
+        parsed_reviews = parse_weekly_reviews(weekly_reviews)
+
         # Consistency
-        consistency = calculate_consistency(target_date)
+        consistency = calculate_consistency(target_date, weekly_reviews)
         print("=== Consistency ===")
         print(f"Daily entries: {consistency['daily_entries']}")
         print(f"Weekly reviews: {consistency['weekly_reviews']}")
 
         # Weekly reflections grouped by week
         print("\n=== Weekly reflections ===")
-        weekly_reflections = collect_weekly_reflections(target_date)
+        weekly_reflections = collect_weekly_reflections(target_date, parsed_reviews)
         if weekly_reflections:
             for sunday, reflection in weekly_reflections:
                 print(f"\nWeek ending {(sunday + timedelta(days=6)).strftime('%B %d')}:")
@@ -109,18 +150,12 @@ def run(target_date: date = None):
 
         # Weekly summaries
         print("\n=== Weekly summaries ===")
-        weekly_reviews = find_weekly_reviews_for_month(target_date)
-        weekly_review_summaries = []
-
-        for sunday, review in weekly_reviews:
-            parsed = parser.parse_file(review)
-            if parsed:
-                summary = parsed.get_list_items("weekly_summary")
-                if summary:
-                    weekly_review_summaries.append((sunday, summary))
-                    print(f"\nWeek ending {(sunday + timedelta(days=6)).strftime('%B %d')}:")
-                    for bullet in summary:
-                        print(f"  - {bullet}")
+        weekly_review_summaries = collect_weekly_summaries(target_date, parsed_reviews)
+
+        for sunday, summary in weekly_review_summaries:
+            print(f"\nWeek ending {(sunday + timedelta(days=6)).strftime('%B %d')}:")
+            for bullet in summary:
+                print(f"  - {bullet}")
 
         if not weekly_review_summaries:
             print("  (No weekly summaries found)")
@@ -129,7 +164,7 @@ def run(target_date: date = None):
         if weekly_reviews:
             print(f"\n--- Weekly Reviews ---")
             print(f"Found {len(weekly_reviews)} weekly reviews")
-            choice = input("Enter week number to open review (1-N), or press Enter to continue: ").strip()
+            choice = ui.prompt("Enter week number to open review (1-N), or press Enter to continue: ")
 
             if choice.isdigit():
                 week_index = int(choice) - 1
@@ -143,7 +178,7 @@ def run(target_date: date = None):
 
         # Prompt for monthly reflection
         print("\n=== Monthly Reflection ===")
-        monthly_reflection = input("How did this month go? ").strip()
+        monthly_reflection = ui.prompt("How did this month go? ")
 
         # Build the monthly review content using template
         content = templates.monthly_review_template(
@@ -160,3 +195,42 @@ def run(target_date: date = None):
         print(f"\nMonthly review saved to: {filepath}")
 
     run_with_existing_check(filepath, "Monthly review", create_monthly_review)
+
+
+def run_batch(batch_file: Path, overwrite: bool = False, source: FileSource = None):
+    """
+    Create monthly reviews from a JSONL batch without prompting.
+
+    Each line's date selects the month it falls in. Existing reviews are
+    skipped unless overwrite (or the line's own "overwrite") is set. All
+    reviews share one archive scan.
+    """
+    items = load_batch(batch_file)
+    if source is None:
+        source = ArchiveSnapshot()
+
+    pending = {}
+    for item in items:
+        target_date = item["date"].replace(day=1)
+        filepath = config.monthly_path(target_date)
+        replace = overwrite if item["overwrite"] is None else bool(item["overwrite"])
+        if not should_write(filepath, "Monthly review", source, replace):
+            continue
+
+        weekly_reviews = find_weekly_reviews_for_month(target_date, source)
+        parsed_reviews = parse_weekly_reviews(weekly_reviews, source)
+
+        content = templates.monthly_review_template(
+            d=target_date,
+            consistency=calculate_consistency(target_date, weekly_reviews, source),
+            weekly_reflections=collect_weekly_reflections(target_date, parsed_reviews),
+            weekly_summaries=collect_weekly_summaries(target_date, parsed_reviews),
+            monthly_summary=item["summary"],
+            monthly_reflection=item["reflection"],
+        )
+        pending[filepath] = content
+        source.added(filepath)
+
+    # Reviews don't depend on each other, so they are written together
+    counts = io.write_files(pending)
+    print(f"Batch: {counts['written']} monthly review(s) written, {counts['skipped']} unchanged.")
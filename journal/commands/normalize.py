@@ -0,0 +1,145 @@
+"""Archive canonicalization command."""
+
+import difflib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from journal import archive, io, parser, references
+
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+
+class NormalizeError(Exception):
+    """A file can't be rewritten without changing how it parses."""
+
+
+def split_front_matter(lines: list[str]) -> tuple[list[str], list[str]]:
+    """Split raw lines into (front matter including fences, body)."""
+    if lines and lines[0].strip() == "---":
+        for i in range(1, len(lines)):
+            if lines[i].strip() == "---":
+                return lines[:i + 1], lines[i + 1:]
+    return [], lines
+
+
+def _comparable(sections) -> dict[str, list[str]]:
+    return {name: [line.rstrip("\n") for line in content] for name, content in sections}
+
+
+def canonical_text(raw_lines: list[str]) -> str:
+    """
+    Rewrite a file's lines in the canonical template format.
+
+    Every line is kept as it is except the section headers the lenient
+    parser recognizes, which are rewritten as exact canonical headers (an
+    inline value moves to the line below), and the canonical marker is added
+    after any front matter. Separators stay, since the strict splitter skips
+    them too. Raises NormalizeError if a section appears twice (the lenient
+    parser keeps only the last) or if the result would not parse to the same
+    sections. Metadata lines are only kept before the first section; one
+    inside a section raises NormalizeError, as the strict splitter would
+    read it as content.
+    """
+    front, body = split_front_matter(raw_lines)
+    pairs = list(parser.iter_lenient_sections(body))
+
+    names = [name for name, _ in pairs if name]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise NormalizeError(f"repeated section(s): {', '.join(duplicates)}")
+
+    out = [line.rstrip("\n") for line in front]
+    out.append(parser.CANONICAL_MARKER)
+    section = None
+    for line in body:
+        stripped = line.strip()
+        if stripped.startswith(references.REFERENCE_PREFIX):
+            # The lenient parser keeps reference lines stripped
+            out.append(stripped)
+            continue
+        if parser.is_metadata(stripped) and section is not None:
+            # The strict splitter would read it as section content
+            raise NormalizeError(f"metadata line inside the {section} section: {stripped}")
+        if parser.is_separator(stripped) or parser.is_metadata(stripped):
+            out.append(line.rstrip("\n"))
+            continue
+        name = parser.header_name(stripped)
+        if name is None:
+            out.append(line.rstrip("\n"))
+            continue
+        section = name
+        out.append(f"## {parser.CANONICAL_HEADERS[name]}:")
+        inline_value = stripped.partition(":")[2].strip()
+        if inline_value:
+            out.append(inline_value)
+    text = "\n".join(out) + "\n"
+
+    expected = _comparable((n, c) for n, c in pairs if n)
+    actual = _comparable(
+        (n, c) for n, c in parser.iter_canonical_sections(text.splitlines(keepends=True)[len(front) + 1:]) if n
+    )
+    if actual != expected:
+        raise NormalizeError("rewritten file would parse differently")
+    return text
+
+
+def normalize_file(job: tuple) -> tuple[str, str, str]:
+    """
+    Normalize one file. Runs in a worker process.
+
+    Returns (path, status, diff) where status is "canonical", "rewritten",
+    "would rewrite" or "skipped: <reason>".
+    """
+    path, apply = job
+    raw = Path(path).read_text(encoding="utf-8", errors="ignore")
+    raw_lines = raw.splitlines(keepends=True)
+
+    _, body = split_front_matter(raw_lines)
+    if body and body[0].strip() == parser.CANONICAL_MARKER:
+        return path, "canonical", ""
+
+    try:
+        text = canonical_text(raw_lines)
+    except NormalizeError as e:
+        return path, f"skipped: {e}", ""
+
+    diff = "".join(difflib.unified_diff(
+        raw_lines, text.splitlines(keepends=True), fromfile=path, tofile=f"{path} (normalized)",
+    ))
+    if apply:
+        io.write_atomic(Path(path), text)
+        return path, "rewritten", diff
+    return path, "would rewrite", diff
+
+
+def normalize_archive(apply: bool = False, jobs: int | None = None) -> list[tuple[str, str, str]]:
+    """Normalize every journal file, in parallel for large archives."""
+    work = [(str(entry.path), apply) for entry in archive.iter_entries()]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(work) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(normalize_file, work, chunksize=max(1, len(work) // (jobs * 4))))
+    return [normalize_file(job) for job in work]
+
+
+def run(apply: bool = False, jobs: int | None = None):
+    """Show (or, with apply, make) the rewrites into canonical format."""
+    results = normalize_archive(apply=apply, jobs=jobs)
+
+    counts = {}
+    for path, status, diff in results:
+        if diff and not apply:
+            print(diff, end="")
+        if status.startswith("skipped"):
+            print(f"Skipped {path}: {status[len('skipped: '):]}")
+        key = "skipped" if status.startswith("skipped") else status
+        counts[key] = counts.get(key, 0) + 1
+
+    print(f"\nNormalize: {counts.get('rewritten', 0) + counts.get('would rewrite', 0)} "
+          f"{'rewritten' if apply else 'to rewrite'}, {counts.get('canonical', 0)} already canonical, "
+          f"{counts.get('skipped', 0)} skipped.")
+    if not apply and counts.get("would rewrite"):
+        print("Run with --apply to rewrite these files in place.")
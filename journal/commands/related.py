@@ -0,0 +1,273 @@
+"""Related entries command."""
+
+import base64
+import heapq
+import math
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from datetime import date, timedelta
+from journal import archive, cache, config, parser, text
+from journal.models import ArchiveEntry
+
+
+CACHE_NAME = "related"
+
+# Sections whose text makes up each entry's term vector
+SECTIONS = ("journal", "weekly_reflection")
+
+# Only the rarest query terms are used to gather candidates
+MAX_QUERY_TERMS = 24
+
+
+def _pack(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _unpack(encoded: str) -> array:
+    values = array("I")
+    values.frombytes(base64.b64decode(encoded))
+    return values
+
+
+class TermIndex:
+    """
+    Sparse term-frequency vectors and an inverted index for every daily entry
+    and weekly review.
+
+    Each document is a pair of parallel arrays (term ids, counts) sorted by
+    term id, and each term has a posting list of the ids of the documents
+    using it and a document frequency. Everything is cached under
+    JOURNAL_DIR/.cache and kept packed until used: a refresh touches only the
+    vectors and postings of files whose size or mtime changed, and a query
+    only the postings of its own terms. Ids of terms and documents that are
+    no longer used are freed and reused, so the vocabulary doesn't grow with
+    every edit. Inverse document frequencies are derived at query time, so
+    adding a document never invalidates the others.
+    """
+
+    def __init__(self):
+        self.vocab: list[str | None] = []
+        self.term_ids: dict[str, int] = {}
+        self.df = array("I")
+        # doc id -> rel path
+        self.paths: list[str | None] = []
+        # rel path -> {"id", "date", "kind", "mtime_ns", "size", "terms", "counts"}, arrays packed
+        self.docs: dict[str, dict] = {}
+        # term id -> packed doc ids, or a set of them once used
+        self._postings: dict[int, str | set[int]] = {}
+        self._free_terms: list[int] = []
+        self._free_docs: list[int] = []
+        self.changed = False
+
+    @classmethod
+    def load(cls) -> "TermIndex":
+        index = cls()
+        data = cache.load(CACHE_NAME)
+        if "postings" not in data:
+            # Caches from before postings were stored are rebuilt
+            return index
+        index.vocab = data["vocab"]
+        index.term_ids = {term: i for i, term in enumerate(index.vocab) if term is not None}
+        index._free_terms = [i for i, term in enumerate(index.vocab) if term is None]
+        index.df = _unpack(data["df"])
+        index.paths = data["paths"]
+        index._free_docs = [i for i, rel in enumerate(index.paths) if rel is None]
+        index.docs = data["docs"]
+        index._postings = {int(t): packed for t, packed in data["postings"].items()}
+        return index
+
+    def save(self) -> None:
+        postings = {
+            str(t): p if isinstance(p, str) else _pack(array("I", sorted(p)))
+            for t, p in self._postings.items()
+        }
+        cache.save(CACHE_NAME, {
+            "vocab": self.vocab, "df": _pack(self.df), "paths": self.paths,
+            "docs": self.docs, "postings": postings,
+        })
+
+    def vector(self, rel: str) -> tuple[array, array]:
+        """A document's (term ids, counts)."""
+        doc = self.docs[rel]
+        return _unpack(doc["terms"]), _unpack(doc["counts"])
+
+    def posting(self, term: int) -> set[int]:
+        """Ids of the documents using a term."""
+        p = self._postings.get(term)
+        if p is None:
+            return set()
+        if isinstance(p, str):
+            p = self._postings[term] = set(_unpack(p))
+        return p
+
+    def _term_id(self, term: str) -> int:
+        if term not in self.term_ids:
+            if self._free_terms:
+                t = self._free_terms.pop()
+                self.vocab[t] = term
+            else:
+                t = len(self.vocab)
+                self.vocab.append(term)
+                self.df.append(0)
+            self.term_ids[term] = t
+        return self.term_ids[term]
+
+    def _vectorize(self, entry: ArchiveEntry) -> tuple[array, array]:
+        parsed = parser.parse_file(entry.path)
+        words = []
+        if parsed:
+            for section in SECTIONS:
+                words += text.tokenize(parsed.get_section_text(section))
+        counts = sorted(Counter(self._term_id(w) for w in words).items())
+        return array("I", (t for t, _ in counts)), array("I", (c for _, c in counts))
+
+    def _add(self, rel: str, entry: ArchiveEntry, st, terms: array, counts: array) -> None:
+        if self._free_docs:
+            doc_id = self._free_docs.pop()
+            self.paths[doc_id] = rel
+        else:
+            doc_id = len(self.paths)
+            self.paths.append(rel)
+        self.docs[rel] = {
+            "id": doc_id, "date": entry.date.isoformat(), "kind": entry.kind,
+            "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+            "terms": _pack(terms), "counts": _pack(counts),
+        }
+        for t in terms:
+            if t in self._postings:
+                self.posting(t).add(doc_id)
+            else:
+                self._postings[t] = {doc_id}
+            self.df[t] += 1
+
+    def _remove(self, rel: str) -> None:
+        doc = self.docs.pop(rel)
+        for t in _unpack(doc["terms"]):
+            self.posting(t).discard(doc["id"])
+            self.df[t] -= 1
+            if not self.df[t]:
+                del self._postings[t]
+                del self.term_ids[self.vocab[t]]
+                self.vocab[t] = None
+                self._free_terms.append(t)
+        self.paths[doc["id"]] = None
+        self._free_docs.append(doc["id"])
+
+    def refresh(self, cancelled: Callable[[], bool] | None = None) -> None:
+        """
+        Bring vectors and postings up to date with the archive, rereading
+        changed files only. cancelled is checked before each file; once it
+        returns True the refresh stops, leaving every document either updated
+        or as it was (deleted files are only dropped after a full pass).
+        """
+        seen = set()
+        for entry in archive.iter_entries(kinds=("daily", "review")):
+            if cancelled and cancelled():
+                return
+            rel = entry.path.relative_to(config.JOURNAL_DIR).as_posix()
+            seen.add(rel)
+            st = entry.path.stat()
+            doc = self.docs.get(rel)
+            if doc and doc["mtime_ns"] == st.st_mtime_ns and doc["size"] == st.st_size:
+                continue
+            if doc:
+                self._remove(rel)
+            terms, counts = self._vectorize(entry)
+            self._add(rel, entry, st, terms, counts)
+            self.changed = True
+
+        for rel in self.docs.keys() - seen:
+            self._remove(rel)
+            self.changed = True
+
+    def idf(self, term: int) -> float:
+        return math.log(len(self.docs) / self.df[term]) if term < len(self.df) and self.df[term] else 0.0
+
+    def weights(self, terms: array, counts: array) -> dict[int, float]:
+        """TF-IDF weights (log-scaled term frequency) for a sparse vector."""
+        return {t: (1 + math.log(c)) * self.idf(t) for t, c in zip(terms, counts)}
+
+    def top_k(self, query: Counter, before: date, k: int) -> list[tuple[float, str]]:
+        """
+        Most similar documents dated before `before`, by cosine similarity.
+
+        Candidates come from the postings of the query's rarest terms, so only
+        documents sharing a distinctive word with the query are scored.
+        """
+        q = {t: (1 + math.log(c)) * self.idf(t) for t, c in query.items()}
+        q = {t: w for t, w in q.items() if w > 0}
+        q_norm = math.sqrt(sum(w * w for w in q.values()))
+        if not q_norm:
+            return []
+
+        cutoff = before.isoformat()
+        candidates = set()
+        for term in heapq.nlargest(MAX_QUERY_TERMS, q, key=q.get):
+            candidates.update(rel for rel in map(self.paths.__getitem__, self.posting(term))
+                              if self.docs[rel]["date"] < cutoff)
+
+        scores = []
+        for rel in candidates:
+            weights = self.weights(*self.vector(rel))
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            if norm:
+                dot = sum(w * weights.get(t, 0.0) for t, w in q.items())
+                scores.append((dot / (q_norm * norm), rel))
+
+        return heapq.nlargest(k, scores)
+
+
+def week_query(index: TermIndex, d: date) -> Counter:
+    """Combined term counts of every entry in the week containing d."""
+    sunday = config.get_sunday(d)
+    first, last = sunday.isoformat(), (sunday + timedelta(days=6)).isoformat()
+    query = Counter()
+    for rel, doc in index.docs.items():
+        if first <= doc["date"] <= last:
+            query.update(dict(zip(*index.vector(rel))))
+    return query
+
+
+def week_ending(doc: dict) -> date:
+    """Saturday of the week a document belongs to."""
+    return config.get_sunday(date.fromisoformat(doc["date"])) + timedelta(days=6)
+
+
+def find_related(d: date, k: int = 5) -> list[tuple[float, date, list[str]]]:
+    """
+    The k earlier weeks most similar to the week containing d.
+
+    Each is (best score of its entries, week-ending Saturday, its matching
+    entries' paths, most similar first).
+    """
+    index = TermIndex.load()
+    index.refresh()
+    if index.changed:
+        index.save()
+
+    query = week_query(index, d)
+    weeks = {}
+    for score, rel in index.top_k(query, config.get_sunday(d), len(index.docs)):
+        weeks.setdefault(week_ending(index.docs[rel]), []).append((score, rel))
+    ranked = sorted(weeks.items(), key=lambda item: item[1][0][0], reverse=True)
+    return [(hits[0][0], saturday, [rel for _, rel in hits]) for saturday, hits in ranked[:k]]
+
+
+def run(target_date: date = None, top: int = 5):
+    """Show earlier weeks related to this one."""
+    if target_date is None:
+        target_date = date.today()
+
+    saturday = config.get_sunday(target_date) + timedelta(days=6)
+    print(f"=== Related to week ending {saturday.strftime('%B %d, %Y')} ===\n")
+
+    results = find_related(target_date, top)
+    if not results:
+        print("  (No related entries found)")
+        return
+
+    for score, week_end, rels in results:
+        print(f"  {score:.2f}  Week ending {week_end.strftime('%B %d, %Y')}")
+        for rel in rels:
+            print(f"          {config.JOURNAL_DIR / rel}")
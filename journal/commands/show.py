@@ -0,0 +1,155 @@
+"""Read-only week and month views."""
+
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from journal import cache, config, io, parser, templates
+from .base import FileSource
+from .month_review import (
+    calculate_consistency, collect_weekly_reflections, collect_weekly_summaries,
+    find_weekly_reviews_for_month, get_month_dates, parse_weekly_reviews,
+)
+from .week_review import collect_daily_entries
+
+
+# Each view is cached on its own, as show/<period>-<date>
+CACHE_NAME = "show"
+
+# Bump to invalidate cached views when their layout changes
+VIEW_VERSION = 2
+
+# Only the most recently rendered views are kept
+MAX_CACHED_VIEWS = 64
+
+PERIODS = ("week", "month")
+
+
+def view_date(period: str, target_date: date) -> date:
+    """The date a view is rendered for: the week's Saturday or the month's first."""
+    if period == "week":
+        return config.get_sunday(target_date) + timedelta(days=6)
+    return target_date.replace(day=1)
+
+
+def input_paths(period: str, d: date) -> list[Path]:
+    """Every file a view is built from, whether or not it exists yet."""
+    if period == "week":
+        return [config.daily_path(day) for day in config.get_week_dates(d)] + [config.review_path(d)]
+    sundays = sorted({config.get_sunday(day) for day in get_month_dates(d)})
+    reviews = [config.review_path(sunday) for sunday in sundays if config.week_owner(sunday) == (d.year, d.month)]
+    return [config.daily_path(day) for day in get_month_dates(d)] + reviews + [config.monthly_path(d)]
+
+
+def _input_hashes(paths: list[Path], previous: dict) -> dict[str, list | None]:
+    """
+    [size, mtime_ns, hash] per input (None if missing), reading only files
+    whose stat changed since previous.
+    """
+    inputs = {}
+    for path in paths:
+        rel = path.relative_to(config.JOURNAL_DIR).as_posix()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            inputs[rel] = None
+            continue
+        old = previous.get(rel)
+        if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+            inputs[rel] = old
+        else:
+            inputs[rel] = [st.st_size, st.st_mtime_ns, io.file_hash(path)]
+    return inputs
+
+
+def _key(period: str, d: date, inputs: dict) -> str:
+    hashes = {rel: value[2] if value else None for rel, value in inputs.items()}
+    return io.content_hash(json.dumps([VIEW_VERSION, period, str(d), hashes], sort_keys=True))
+
+
+def _without_marker(content: str) -> str:
+    """Drop the canonical-format marker line the templates start with."""
+    first, _, rest = content.partition("\n")
+    return rest if first == parser.CANONICAL_MARKER else content
+
+
+def _prune() -> None:
+    """Remove all but the MAX_CACHED_VIEWS most recently rendered views."""
+    views = sorted(cache.cache_path(CACHE_NAME).with_suffix("").glob("*.json"),
+                   key=lambda path: path.stat().st_mtime_ns, reverse=True)
+    for path in views[MAX_CACHED_VIEWS:]:
+        path.unlink(missing_ok=True)
+    # Views were once all kept together in show.json
+    cache.cache_path(CACHE_NAME).unlink(missing_ok=True)
+
+
+def render_week(d: date, source: FileSource = None) -> str:
+    """
+    The weekly review template filled from the week's entries and its saved
+    review, if any. Daily entries are shown as text even in reference mode.
+    """
+    if source is None:
+        source = FileSource()
+    review_file = config.review_path(d)
+    review = source.parse(review_file) if source.exists(review_file) else None
+    return _without_marker(templates.weekly_review_template(
+        d=d,
+        daily_entries={day.strftime("%A, %B %d"): text for day, text in collect_daily_entries(d, source)},
+        weekly_reflection=review.get_section_text("weekly_reflection") if review else "",
+        weekly_summary=review.get_list_items("weekly_summary") if review else [],
+    ))
+
+
+def render_month(d: date, source: FileSource = None) -> str:
+    """The monthly review template filled from the month's files and its saved review, if any."""
+    if source is None:
+        source = FileSource()
+    weekly_reviews = find_weekly_reviews_for_month(d, source)
+    parsed_reviews = parse_weekly_reviews(weekly_reviews, source)
+    monthly_file = config.monthly_path(d)
+    monthly = source.parse(monthly_file) if source.exists(monthly_file) else None
+    return _without_marker(templates.monthly_review_template(
+        d=d,
+        consistency=calculate_consistency(d, weekly_reviews, source),
+        weekly_reflections=collect_weekly_reflections(d, parsed_reviews),
+        weekly_summaries=collect_weekly_summaries(d, parsed_reviews),
+        monthly_summary=monthly.get_list_items("monthly_summary") if monthly else [],
+        monthly_reflection=monthly.get_section_text("monthly_reflection") if monthly else "",
+    ))
+
+
+def view(period: str, target_date: date) -> str:
+    """
+    The aggregated view of the week or month containing target_date.
+
+    Each view is cached in its own file under .cache/show/, keyed by the
+    content hashes of its input files. Inputs whose size and mtime are
+    unchanged aren't read, so a repeat view (or any view of a closed month)
+    costs one stat per input and no parsing; an input rewritten with the same
+    bytes is hashed but the view is still served from the cache. Only the
+    MAX_CACHED_VIEWS most recently rendered views are kept.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period '{period}'; expected one of: {', '.join(PERIODS)}")
+    d = view_date(period, target_date)
+    name = f"{CACHE_NAME}/{period}-{d}"
+    cached = cache.load(name)
+
+    inputs = _input_hashes(input_paths(period, d), cached.get("inputs", {}))
+    key = _key(period, d, inputs)
+    if cached.get("key") == key:
+        if cached["inputs"] != inputs:
+            cache.save(name, dict(cached, inputs=inputs))
+        return cached["output"]
+
+    output = render_week(d) if period == "week" else render_month(d)
+    cache.save(name, {"key": key, "inputs": inputs, "output": output})
+    _prune()
+    return output
+
+
+def run(period: str, target_date: date = None):
+    """Print the aggregated week or month view without prompting or writing files."""
+    if target_date is None:
+        target_date = date.today() if period == "week" else config.detect_review_month()
+    print(view(period, target_date), end="")
@@ -0,0 +1,281 @@
+"""Static HTML site command."""
+
+import calendar
+import html
+import json
+import os
+import posixpath
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from journal import archive, config, io, metrics, parser, references
+from journal.models import ArchiveEntry
+
+
+# Bump to force a full rebuild when page layout changes
+RENDER_VERSION = 1
+
+MANIFEST_NAME = ".manifest.json"
+
+# Below this many pages a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+STYLE = """
+body { font-family: sans-serif; max-width: 46em; margin: 2em auto; padding: 0 1em; line-height: 1.5; }
+nav { display: flex; gap: 1em; border-bottom: 1px solid #ccc; padding-bottom: .5em; }
+table.calendar td, table.calendar th { width: 3em; text-align: center; }
+td.empty { color: #bbb; }
+"""
+
+BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+
+
+def page_title(entry: ArchiveEntry) -> str:
+    """Human-readable title for a journal file."""
+    if entry.kind == "daily":
+        return entry.date.strftime("%A, %B %d, %Y")
+    if entry.kind == "review":
+        return f"Week ending {entry.date.strftime('%B %d, %Y')}"
+    return entry.date.strftime("%B %Y")
+
+
+def page_path(entry: ArchiveEntry) -> str:
+    """Output path of a file's page, relative to the site root."""
+    return f"{entry.date.year}/{entry.date.month:02d}/{entry.path.stem}.html"
+
+
+def month_index_path(year: int, month: int) -> str:
+    """Output path of a month's calendar page, relative to the site root."""
+    return f"{year}/{month:02d}/index.html"
+
+
+def _link(from_page: str, to_page: str, text: str) -> str:
+    href = posixpath.relpath(to_page, posixpath.dirname(from_page) or ".")
+    return f'<a href="{html.escape(href)}">{html.escape(text)}</a>'
+
+
+def _inline(text: str) -> str:
+    return BOLD_PATTERN.sub(r"<strong>\1</strong>", html.escape(text))
+
+
+def render_body(text: str) -> str:
+    """Render journal markdown (headers, bullets, bold, separators) as HTML."""
+    out = []
+    paragraph = []
+    items = []
+
+    def flush():
+        if paragraph:
+            out.append("<p>" + "<br>\n".join(paragraph) + "</p>")
+            paragraph.clear()
+        if items:
+            out.append("<ul>\n" + "\n".join(f"<li>{i}</li>" for i in items) + "\n</ul>")
+            items.clear()
+
+    for raw in text.splitlines():
+        stripped = raw.strip()
+        if stripped == parser.CANONICAL_MARKER:
+            continue
+        if stripped.startswith(references.REFERENCE_PREFIX):
+            expanded, _ = references.expand(stripped)
+            flush()
+            out.append(render_body("\n".join(expanded)))
+        elif not stripped:
+            flush()
+        elif stripped.startswith("#"):
+            flush()
+            level = min(len(stripped) - len(stripped.lstrip("#")), 6)
+            out.append(f"<h{level}>{_inline(stripped.lstrip('#').strip())}</h{level}>")
+        elif len(stripped) >= 3 and all(c in "=-_" for c in stripped):
+            flush()
+            out.append("<hr>")
+        elif stripped.startswith("- "):
+            if paragraph:
+                flush()
+            items.append(_inline(stripped[2:]))
+        else:
+            if items:
+                flush()
+            paragraph.append(_inline(stripped))
+    flush()
+    return "\n".join(out)
+
+
+@metrics.timed("render")
+def render_page(title: str, nav: list[str], body: str) -> str:
+    """Wrap a page body in the shared layout."""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<nav>{" ".join(nav)}</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def _render_entry(job: tuple) -> bool:
+    """Render one journal file to its page. Runs in a worker process."""
+    journal_dir, src, out, title, nav = job
+    config.JOURNAL_DIR = Path(journal_dir)
+    text = Path(src).read_text(encoding="utf-8", errors="ignore")
+    return _write(Path(out), render_page(title, nav, render_body(text)))
+
+
+def _write(path: Path, content: str) -> bool:
+    """Write a page unless it already holds this content; returns whether it was written."""
+    return io.write_files({path: content})["written"] == 1
+
+
+def _input_hashes(entries: list[ArchiveEntry], previous: dict) -> dict[str, list]:
+    """[size, mtime_ns, hash] per input, rehashing only files whose stat changed."""
+    inputs = {}
+    for entry in entries:
+        rel = entry.path.relative_to(config.JOURNAL_DIR).as_posix()
+        st = entry.path.stat()
+        old = previous.get(rel)
+        if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+            inputs[rel] = old
+        else:
+            inputs[rel] = [st.st_size, st.st_mtime_ns, io.content_hash(entry.path.read_text(encoding="utf-8", errors="ignore"))]
+    return inputs
+
+
+def _key(*parts) -> str:
+    return io.content_hash(json.dumps([RENDER_VERSION, *parts], default=str))
+
+
+def _month_grid(year: int, month: int, by_date: dict, here: str) -> str:
+    """Calendar table for a month, linking days and the reviews of each week."""
+    rows = ["<tr>" + "".join(f"<th>{d}</th>" for d in ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Week")) + "</tr>"]
+    for week in calendar.Calendar(firstweekday=6).monthdatescalendar(year, month):
+        cells = []
+        for d in week:
+            daily = by_date.get(("daily", d))
+            if d.month != month:
+                cells.append(f'<td class="empty">{d.day}</td>')
+            elif daily:
+                cells.append(f"<td>{_link(here, page_path(daily), str(d.day))}</td>")
+            else:
+                cells.append(f"<td>{d.day}</td>")
+        review = by_date.get(("review", week[-1]))
+        if review and config.week_owner(week[-1]) == (year, month):
+            cells.append(f"<td>{_link(here, page_path(review), 'review')}</td>")
+        else:
+            cells.append("<td></td>")
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    return '<table class="calendar">\n' + "\n".join(rows) + "\n</table>"
+
+
+def build_site(outdir: Path, jobs: int | None = None) -> dict:
+    """
+    Render the archive into linked HTML pages under outdir.
+
+    Pages are rebuilt only when their inputs (file hash, neighbour links and,
+    for weekly reviews, that week's dailies) change since the last build, as
+    recorded in outdir/.manifest.json, and a rebuilt page is only written if
+    its content differs. Returns counts of written, unchanged and removed
+    pages.
+    """
+    manifest_path = outdir / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    old_pages = manifest.get("pages", {})
+
+    entries = list(archive.iter_entries())
+    inputs = _input_hashes(entries, manifest.get("inputs", {}))
+    by_date = {(e.kind, e.date): e for e in entries}
+
+    def input_hash(entry):
+        return inputs[entry.path.relative_to(config.JOURNAL_DIR).as_posix()][2]
+
+    pages = {}
+    render_jobs = []
+    index_pages = []
+
+    # One page per journal file, linked to its neighbours of the same kind
+    months = sorted({(e.date.year, e.date.month) for e in entries})
+    for kind in archive.KINDS:
+        same_kind = [e for e in entries if e.kind == kind]
+        for i, entry in enumerate(same_kind):
+            here = page_path(entry)
+            nav = [_link(here, "index.html", "Index"),
+                   _link(here, month_index_path(entry.date.year, entry.date.month), entry.date.strftime("%B %Y"))]
+            if i > 0:
+                nav.append(_link(here, page_path(same_kind[i - 1]), "← " + page_title(same_kind[i - 1])))
+            if i + 1 < len(same_kind):
+                nav.append(_link(here, page_path(same_kind[i + 1]), page_title(same_kind[i + 1]) + " →"))
+
+            deps = [input_hash(entry)]
+            if kind == "review":
+                deps += [input_hash(by_date[("daily", d)]) for d in config.get_week_dates(entry.date)
+                         if ("daily", d) in by_date]
+            pages[here] = _key(here, nav, deps)
+            render_jobs.append((str(config.JOURNAL_DIR), str(entry.path), str(outdir / here), page_title(entry), nav))
+
+    # A calendar page per month
+    for i, (year, month) in enumerate(months):
+        here = month_index_path(year, month)
+        nav = [_link(here, "index.html", "Index")]
+        if i > 0:
+            nav.append(_link(here, month_index_path(*months[i - 1]), "← " + date(*months[i - 1], 1).strftime("%B %Y")))
+        if i + 1 < len(months):
+            nav.append(_link(here, month_index_path(*months[i + 1]), date(*months[i + 1], 1).strftime("%B %Y") + " →"))
+        body = f"<h1>{date(year, month, 1).strftime('%B %Y')}</h1>\n" + _month_grid(year, month, by_date, here)
+        monthly = by_date.get(("monthly", date(year, month, 1)))
+        if monthly:
+            body += f"\n<p>{_link(here, page_path(monthly), 'Monthly review')}</p>"
+        pages[here] = _key(here, nav, body)
+        index_pages.append((here, date(year, month, 1).strftime("%B %Y"), nav, body))
+
+    # Root index listing every month by year
+    body = "<h1>Journal</h1>\n"
+    for year in sorted({y for y, _ in months}, reverse=True):
+        links = [_link("index.html", month_index_path(y, m), date(y, m, 1).strftime("%B")) for y, m in months if y == year]
+        body += f"<h2>{year}</h2>\n<p>{' &middot; '.join(links)}</p>\n"
+    pages["index.html"] = _key("index.html", body)
+    index_pages.append(("index.html", "Journal", [], body))
+
+    def stale(rel):
+        return old_pages.get(rel) != pages[rel] or not (outdir / rel).exists()
+
+    pending = [job for job in render_jobs if stale(Path(job[2]).relative_to(outdir).as_posix())]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_render_entry, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+    else:
+        results = [_render_entry(job) for job in pending]
+
+    # Stale pages that render to the same bytes are left untouched
+    written = sum(results)
+    for rel, title, nav, body in index_pages:
+        if stale(rel) and _write(outdir / rel, render_page(title, nav, body)):
+            written += 1
+
+    removed = 0
+    for rel in old_pages.keys() - pages.keys():
+        (outdir / rel).unlink(missing_ok=True)
+        removed += 1
+
+    _write(manifest_path, json.dumps({"inputs": inputs, "pages": pages}, separators=(",", ":")))
+    return {"written": written, "unchanged": len(pages) - written, "removed": removed}
+
+
+def run(outdir: Path, jobs: int | None = None):
+    """Build or update the static HTML site."""
+    counts = build_site(outdir, jobs=jobs)
+    print(f"Site: {counts['written']} pages written, {counts['unchanged']} unchanged, "
+          f"{counts['removed']} removed.")
+    print(f"Open: {outdir / 'index.html'}")
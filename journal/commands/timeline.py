@@ -0,0 +1,49 @@
+"""Summary timeline command."""
+
+from collections.abc import Iterator
+from datetime import date
+from journal import archive, config, parser, ui
+
+
+# Section holding each kind's summary bullets
+SUMMARY_SECTIONS = {
+    "review": "weekly_summary",
+    "monthly": "monthly_summary",
+}
+
+
+def entry_label(kind: str, d: date) -> str:
+    """Heading shown above an entry's bullets."""
+    if kind == "monthly":
+        return f"{d.strftime('%B %Y')} (month)"
+    return f"Week ending {d.strftime('%B %d, %Y')}"
+
+
+def timeline_lines(until: date | None = None) -> Iterator[str]:
+    """
+    Yield summary bullets of every weekly and monthly review, newest first.
+
+    Directories are listed a month at a time and each file is parsed only up
+    to its summary section, so nothing is read until a line is requested.
+    """
+    for entry in archive.iter_entries(reverse=True, kinds=tuple(SUMMARY_SECTIONS)):
+        if until is not None:
+            # A month's review only exists once its last week has closed
+            closed = entry.date
+            if entry.kind == "monthly":
+                closed = config.last_week_end_of_month(entry.date.year, entry.date.month)
+            if closed > until:
+                continue
+        section = SUMMARY_SECTIONS[entry.kind]
+        parsed = parser.parse_file(entry.path, sections={section})
+        bullets = parsed.get_list_items(section) if parsed else []
+        if bullets:
+            yield entry_label(entry.kind, entry.date)
+            for bullet in bullets:
+                yield f"  - {bullet}"
+            yield ""
+
+
+def run(target_date: date = None):
+    """Page through summary bullets, newest first."""
+    ui.page_output(timeline_lines(until=target_date))
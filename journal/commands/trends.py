@@ -0,0 +1,125 @@
+"""Term frequency trends command."""
+
+from collections import Counter
+from collections.abc import Callable
+from journal import archive, cache, config, parser, text
+
+
+CACHE_NAME = "trends"
+
+# Sections holding text copied from other files (daily text in weekly
+# reviews) or counted over them (a monthly review's consistency); counting
+# them would count words twice
+COPIED_SECTIONS = frozenset({"daily_entries", "daily_summaries", "consistency"})
+
+# Sections each kind of file owns, from the parser's canonical names: weekly
+# and monthly sections by prefix, and every other section to daily entries
+_OWNED = frozenset(parser.SECTION_ALIASES.values()) - COPIED_SECTIONS
+COUNTED_SECTIONS = {
+    "review": frozenset(name for name in _OWNED if name.startswith("weekly_")),
+    "monthly": frozenset(name for name in _OWNED if name.startswith("monthly_")),
+}
+COUNTED_SECTIONS["daily"] = _OWNED - COUNTED_SECTIONS["review"] - COUNTED_SECTIONS["monthly"]
+
+# Bump when what is counted changes, so cached counts are rebuilt
+CACHE_VERSION = 2
+
+
+def entry_month(kind: str, d) -> str:
+    """Month (YYYY-MM) an entry counts toward; weeks go to the month owning them."""
+    if kind == "review":
+        year, month = config.week_owner(d)
+        return f"{year}-{month:02d}"
+    return f"{d.year}-{d.month:02d}"
+
+
+def count_terms(path, kind: str) -> Counter:
+    """Term counts over the sections a file of this kind owns."""
+    parsed = parser.parse_file(path, sections=COUNTED_SECTIONS[kind])
+    counts = Counter()
+    if parsed:
+        for name in parsed.sections.keys() & COUNTED_SECTIONS[kind]:
+            counts.update(text.tokenize(parsed.get_section_text(name)))
+    return counts
+
+
+def _merge(totals: dict, counts: dict, sign: int) -> None:
+    for term, n in counts.items():
+        value = totals.get(term, 0) + sign * n
+        if value > 0:
+            totals[term] = value
+        else:
+            totals.pop(term, None)
+
+
+def monthly_totals(cancelled: Callable[[], bool] | None = None) -> dict[str, Counter]:
+    """
+    Term counts per month across the archive.
+
+    Each file's counts are cached with its size and mtime, alongside running
+    monthly totals. A new, edited or deleted file adjusts its month's totals
+    by its own counts, so only changed files are ever reread.
+
+    cancelled is checked before each file; once it returns True the files
+    updated so far are saved (deleted files are only dropped after a full
+    pass) and the partial totals returned.
+    """
+    data = cache.load(CACHE_NAME)
+    if data.get("version") != CACHE_VERSION:
+        data = {}
+    files = data.get("files", {})
+    months = data.get("months", {})
+    changed = False
+    seen = set()
+
+    complete = True
+    for entry in archive.iter_entries():
+        if cancelled and cancelled():
+            complete = False
+            break
+        rel = entry.path.relative_to(config.JOURNAL_DIR).as_posix()
+        seen.add(rel)
+        st = entry.path.stat()
+        old = files.get(rel)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+            continue
+        if old:
+            _merge(months.setdefault(old["month"], {}), old["counts"], -1)
+        month = entry_month(entry.kind, entry.date)
+        counts = dict(count_terms(entry.path, entry.kind))
+        _merge(months.setdefault(month, {}), counts, 1)
+        files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "month": month, "counts": counts}
+        changed = True
+
+    if complete:
+        for rel in files.keys() - seen:
+            old = files.pop(rel)
+            _merge(months.setdefault(old["month"], {}), old["counts"], -1)
+            changed = True
+
+    months = {m: totals for m, totals in months.items() if totals}
+    if changed:
+        cache.save(CACHE_NAME, {"version": CACHE_VERSION, "files": files, "months": months})
+    return {m: Counter(totals) for m, totals in sorted(months.items())}
+
+
+def run(words: list[str] = None, top: int = 10):
+    """Show how often words appear per month, or each month's top words."""
+    months = monthly_totals()
+    if not months:
+        print("  (No entries found)")
+        return
+
+    if not words:
+        print(f"=== Top {top} terms per month ===\n")
+        for month, totals in months.items():
+            terms = ", ".join(f"{term} ({n})" for term, n in totals.most_common(top))
+            print(f"{month}  {terms}")
+        return
+
+    terms = [t for w in words for t in text.tokenize(w)] or [w.lower() for w in words]
+    width = max(len(t) for t in terms)
+    print("=== Term frequency per month ===\n")
+    print("month    " + "  ".join(t.rjust(width) for t in terms))
+    for month, totals in months.items():
+        print(f"{month}  " + "  ".join(str(totals[t]).rjust(width) for t in terms))
@@ -1,8 +1,45 @@
 """Weekly review command."""
 
 from datetime import date
-from journal import config, parser, templates, ui, io
-from .base import run_with_existing_check
+from pathlib import Path
+from journal import config, references, templates, ui, io
+from .base import ArchiveSnapshot, FileSource, load_batch, run_with_existing_check, should_write
+
+
+def collect_daily_entries(target_date: date, source: FileSource = None) -> list[tuple[date, str]]:
+    """
+    Get (date, journal text) for each day of the week that has an entry.
+
+    Without a source, texts come from the week's file of the expansion cache
+    (see references.journal_texts), so days already parsed, e.g. in the
+    background while a daily entry was being written, are not parsed again.
+    """
+    if source is None:
+        texts = references.journal_texts(config.get_week_dates(target_date))
+        return [(d, text) for d, text in texts.items() if text]
+
+    entries = []
+    for d in config.get_week_dates(target_date):
+        daily_path = config.daily_path(d)
+        if source.exists(daily_path):
+            parsed = source.parse(daily_path)
+            if parsed:
+                journal_text = parsed.get_section_text("journal")
+                if journal_text:
+                    entries.append((d, journal_text))
+    return entries
+
+
+def template_entries(entries: list[tuple[date, str]]) -> dict[str, str]:
+    """Map day labels to journal text, or to references in reference mode."""
+    daily_entries = {}
+    for d, journal_text in entries:
+        label = d.strftime("%A, %B %d")
+        if config.WEEKLY_REFERENCES:
+            daily_entries[label] = references.make_reference(d, journal_text)
+        else:
+            daily_entries[label] = journal_text
+    return daily_entries
 
 
 def run(target_date: date = None):
@@ -15,29 +52,19 @@ def run(target_date: date = None):
     def create_weekly_review():
         print("=== Weekly Review ===\n")
 
-        week_dates = config.get_week_dates(target_date)
-
         print("=== Daily Entries ===")
-        daily_entries = {}
-
-        for d in week_dates:
-            daily_path = config.daily_path(d)
-            if daily_path.exists():
-                parsed = parser.parse_file(daily_path)
-                if parsed:
-                    journal_text = parsed.get_section_text("journal")
-                    if journal_text:
-                        label = d.strftime("%A, %B %d")
-                        daily_entries[label] = journal_text
-                        print(f"\n{'-' * 40}")
-                        print(label)
-                        print(journal_text)
-
-        if not daily_entries:
+        entries = collect_daily_entries(target_date)
+
+        for d, journal_text in entries:
+            print(f"\n{'-' * 40}")
+            print(d.strftime("%A, %B %d"))
+            print(journal_text)
+
+        if not entries:
             print("  (No daily entries found)")
 
         print("\n=== Weekly Reflection ===")
-        weekly_reflection = input("How did this week go? ").strip()
+        weekly_reflection = ui.prompt("How did this week go? ")
 
         weekly_summary = ui.get_multi_line_input(
             "\n=== Weekly Summary ===\nWrite 3-5 bullets synthesizing the week:"
@@ -45,7 +72,7 @@ def run(target_date: date = None):
 
         content = templates.weekly_review_template(
             d=target_date,
-            daily_entries=daily_entries,
+            daily_entries=template_entries(entries),
             weekly_reflection=weekly_reflection,
             weekly_summary=weekly_summary,
         )
@@ -55,3 +82,35 @@ def run(target_date: date = None):
         print(f"\nWeekly review saved to: {filepath}")
 
     run_with_existing_check(filepath, "Weekly review", create_weekly_review)
+
+
+def run_batch(batch_file: Path, overwrite: bool = False, source: FileSource = None):
+    """
+    Create weekly reviews from a JSONL batch without prompting.
+
+    Existing reviews are skipped unless overwrite (or the line's own
+    "overwrite") is set. All reviews share one archive scan.
+    """
+    items = load_batch(batch_file)
+    if source is None:
+        source = ArchiveSnapshot()
+
+    pending = {}
+    for item in items:
+        filepath = config.review_path(item["date"])
+        replace = overwrite if item["overwrite"] is None else bool(item["overwrite"])
+        if not should_write(filepath, "Weekly review", source, replace):
+            continue
+
+        content = templates.weekly_review_template(
+            d=item["date"],
+            daily_entries=template_entries(collect_daily_entries(item["date"], source)),
+            weekly_reflection=item["reflection"],
+            weekly_summary=item["summary"],
+        )
+        pending[filepath] = content
+        source.added(filepath)
+
+    # Reviews don't depend on each other, so they are written together
+    counts = io.write_files(pending)
+    print(f"Batch: {counts['written']} weekly review(s) written, {counts['skipped']} unchanged.")
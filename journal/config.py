@@ -3,11 +3,10 @@ Configuration for journal system.
 Paths, constants, and editor settings.
 """
 
-import calendar
 import os
-from collections import Counter
 from pathlib import Path
 from datetime import date, timedelta
+from .dates import get_sunday, get_week_dates, week_owner, last_week_end_of_month, detect_review_month
 
 
 # Base directory for all journal files
@@ -16,55 +15,9 @@ JOURNAL_DIR = Path.home() / ".entries_encrypted/"
 # Editor: respect $EDITOR, fall back to vim
 EDITOR = os.environ.get("EDITOR", "vim")
 
-
-def get_sunday(d: date) -> date:
-    """Get the Sunday that starts the week containing date d."""
-    # weekday(): Monday=0, Sunday=6
-    # We want Sunday as start of week
-    days_since_sunday = (d.weekday() + 1) % 7
-    return d - timedelta(days=days_since_sunday)
-
-
-def get_week_dates(d: date) -> list[date]:
-    """Get all dates (Sun-Sat) for the week containing date d."""
-    sunday = get_sunday(d)
-    return [sunday + timedelta(days=i) for i in range(7)]
-
-
-def week_owner(d: date) -> tuple[int, int]:
-    """Get the (year, month) that owns the week containing date d.
-
-    A week belongs to whichever month holds most of its seven days. A week
-    spans at most two months, so there is always a strict majority.
-    """
-    counts = Counter((day.year, day.month) for day in get_week_dates(d))
-    return counts.most_common(1)[0][0]
-
-
-def last_week_end_of_month(year: int, month: int) -> date:
-    """Get the Saturday ending the last week that belongs to the given month."""
-    last_day = date(year, month, calendar.monthrange(year, month)[1])
-    saturday = get_sunday(last_day) + timedelta(days=6)
-    if week_owner(saturday) != (year, month):
-        saturday -= timedelta(days=7)
-    return saturday
-
-
-def detect_review_month(today: date = None) -> date:
-    """Get the first of the most recent month whose weeks have all ended.
-
-    Monthly reviews aggregate weekly reviews, so a month is only ready once
-    every week belonging to it is over. Running this on Aug 1 targets July,
-    not the August that just started.
-    """
-    if today is None:
-        today = date.today()
-
-    year, month = week_owner(today)
-    while last_week_end_of_month(year, month) > today:
-        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
-
-    return date(year, month, 1)
+# Weekly reviews: store compact references to daily entries instead of copying
+# their text (set $JOURNAL_WEEKLY_REFERENCES=1 to enable)
+WEEKLY_REFERENCES = os.environ.get("JOURNAL_WEEKLY_REFERENCES") == "1"
 
 
 def _journal_path(d: date, prefix: str, ext: str = "md") -> Path:
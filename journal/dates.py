@@ -0,0 +1,59 @@
+"""
+Calendar rules for weeks and review months.
+Kept free of anything but datetime so the status check can import them
+without the rest of the package; config re-exports every function here.
+"""
+
+from datetime import date, timedelta
+
+
+def get_sunday(d: date) -> date:
+    """Get the Sunday that starts the week containing date d."""
+    # weekday(): Monday=0, Sunday=6
+    # We want Sunday as start of week
+    days_since_sunday = (d.weekday() + 1) % 7
+    return d - timedelta(days=days_since_sunday)
+
+
+def get_week_dates(d: date) -> list[date]:
+    """Get all dates (Sun-Sat) for the week containing date d."""
+    sunday = get_sunday(d)
+    return [sunday + timedelta(days=i) for i in range(7)]
+
+
+def week_owner(d: date) -> tuple[int, int]:
+    """Get the (year, month) that owns the week containing date d.
+
+    A week belongs to whichever month holds most of its seven days. A week
+    spans at most two months, so there is always a strict majority, and it
+    is the month of the week's middle day (Wednesday).
+    """
+    wednesday = get_sunday(d) + timedelta(days=3)
+    return wednesday.year, wednesday.month
+
+
+def last_week_end_of_month(year: int, month: int) -> date:
+    """Get the Saturday ending the last week that belongs to the given month."""
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    last_day = next_month - timedelta(days=1)
+    saturday = get_sunday(last_day) + timedelta(days=6)
+    if week_owner(saturday) != (year, month):
+        saturday -= timedelta(days=7)
+    return saturday
+
+
+def detect_review_month(today: date = None) -> date:
+    """Get the first of the most recent month whose weeks have all ended.
+
+    Monthly reviews aggregate weekly reviews, so a month is only ready once
+    every week belonging to it is over. Running this on Aug 1 targets July,
+    not the August that just started.
+    """
+    if today is None:
+        today = date.today()
+
+    year, month = week_owner(today)
+    while last_week_end_of_month(year, month) > today:
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+
+    return date(year, month, 1)
@@ -0,0 +1,163 @@
+"""
+Filesystem-operation accounting.
+Counts stat, directory listing, open, read and write calls, plus journal
+file parses, while recording is active. Enable for a whole command with
+$JOURNAL_IO_STATS=1, or wrap code in `recording()` (e.g. in tests).
+"""
+
+import builtins
+import io as _io
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from . import parser
+
+
+ENV_VAR = "JOURNAL_IO_STATS"
+
+
+@dataclass
+class IOStats:
+    """Operation and byte counts for one recording."""
+    stats: int = 0
+    listdirs: int = 0
+    opens: int = 0
+    reads: int = 0
+    bytes_read: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    parses: int = 0
+
+    def add(self, name: str, n: int = 1) -> None:
+        with _lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def as_dict(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def summary(self) -> str:
+        return (f"I/O: {self.stats} stats, {self.listdirs} listdirs, {self.opens} opens, "
+                f"{self.reads} reads ({self.bytes_read} bytes), "
+                f"{self.writes} writes ({self.bytes_written} bytes), {self.parses} parses")
+
+
+_lock = threading.Lock()
+
+
+def _size(data) -> int:
+    if isinstance(data, str):
+        return len(data.encode("utf-8", errors="replace"))
+    if isinstance(data, list):
+        return sum(_size(item) for item in data)
+    return len(data)
+
+
+class _CountingFile:
+    """File object proxy that counts reads and writes."""
+
+    def __init__(self, f, stats: IOStats):
+        self._f = f
+        self._stats = stats
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        self._stats.add("reads")
+        self._stats.add("bytes_read", _size(data))
+        return data
+
+    def readline(self, *args):
+        data = self._f.readline(*args)
+        self._stats.add("reads")
+        self._stats.add("bytes_read", _size(data))
+        return data
+
+    def readlines(self, *args):
+        data = self._f.readlines(*args)
+        self._stats.add("reads")
+        self._stats.add("bytes_read", _size(data))
+        return data
+
+    def write(self, data):
+        self._stats.add("writes")
+        self._stats.add("bytes_written", _size(data))
+        return self._f.write(data)
+
+    def __iter__(self):
+        for line in self._f:
+            self._stats.add("bytes_read", _size(line))
+            yield line
+
+    def __enter__(self):
+        self._f.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._f.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+@contextmanager
+def recording():
+    """
+    Count filesystem operations made anywhere in the process while active.
+
+    Yields the IOStats being filled in. os.stat covers Path.stat/exists/is_file,
+    io.open covers open(), Path.open and Path.read_text/write_text.
+    """
+    stats = IOStats()
+    real_stat, real_scandir, real_listdir = os.stat, os.scandir, os.listdir
+    real_open = _io.open
+    real_parse = parser.parse_file
+
+    def stat(*args, **kwargs):
+        stats.add("stats")
+        return real_stat(*args, **kwargs)
+
+    def scandir(*args, **kwargs):
+        stats.add("listdirs")
+        return real_scandir(*args, **kwargs)
+
+    def listdir(*args, **kwargs):
+        stats.add("listdirs")
+        return real_listdir(*args, **kwargs)
+
+    def open_(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        stats.add("opens")
+        return _CountingFile(f, stats)
+
+    def parse_file(*args, **kwargs):
+        stats.add("parses")
+        return real_parse(*args, **kwargs)
+
+    os.stat, os.scandir, os.listdir = stat, scandir, listdir
+    _io.open = builtins.open = open_
+    parser.parse_file = parse_file
+    try:
+        yield stats
+    finally:
+        os.stat, os.scandir, os.listdir = real_stat, real_scandir, real_listdir
+        _io.open = builtins.open = real_open
+        parser.parse_file = real_parse
+
+
+def enabled() -> bool:
+    """Whether $JOURNAL_IO_STATS asks for per-command accounting."""
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+@contextmanager
+def report_if_enabled(label: str):
+    """Record a command's I/O and print a summary to stderr when enabled."""
+    if not enabled():
+        yield None
+        return
+    with recording() as stats:
+        try:
+            yield stats
+        finally:
+            print(f"[{label}] {stats.summary()}", file=sys.stderr)
@@ -3,17 +3,154 @@ File I/O operations.
 Reading and writing journal files.
 """
 
+import hashlib
+import os
+import stat
 from pathlib import Path
-from . import config
+from . import config, metrics
 
 
-def write_file(filepath: Path, content: str) -> None:
-    """Write content to file, creating directories as needed."""
+def content_hash(content: str) -> str:
+    """Hex SHA-256 digest of text content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def file_hash(filepath: Path) -> str:
+    """Hex SHA-256 digest of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@metrics.timed("write", touches=True)
+def write_atomic(filepath: Path, content: str) -> None:
+    """Write content via a temp file in the same directory and rename it into place."""
+    config.ensure_dir(filepath)
+    _replace_atomic(filepath, content.encode("utf-8"))
+
+
+# (size, mtime_ns, sha256) of files this process has hashed or written
+_hashes: dict[Path, tuple[int, int, str]] = {}
+
+
+def _target(filepath: Path) -> tuple[Path, int | None]:
+    """
+    The file a write replaces, with symlinks resolved so the link is kept and
+    its target updated, and that file's permission bits (None if it doesn't
+    exist yet).
+    """
+    try:
+        st = os.lstat(filepath)
+    except FileNotFoundError:
+        return filepath, None
+    if stat.S_ISLNK(st.st_mode):
+        filepath = Path(os.path.realpath(filepath))
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            return filepath, None
+    return filepath, stat.S_IMODE(st.st_mode)
+
+
+def _replace_atomic(filepath: Path, data: bytes) -> os.stat_result:
+    """
+    Write bytes via a temp file in the (existing) directory and rename into place.
+
+    The new file keeps the permissions of the file it replaces; a new file
+    gets the usual umask-derived mode.
+    """
+    target, mode = _target(filepath)
+    tmp = target.parent / f".{target.name}.{os.urandom(4).hex()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, target)
+        return st
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _existing_hash(filepath: Path, size: int) -> tuple[bool, str | None]:
+    """
+    Whether filepath exists, and its hash if it could equal content of size.
+
+    The hash is None if the file is missing or its size differs. The file is
+    only read when its size and mtime don't match a hash already known.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        return False, None
+    with f:
+        st = os.fstat(f.fileno())
+        if st.st_size != size:
+            return True, None
+        known = _hashes.get(filepath)
+        if known and known[:2] == (st.st_size, st.st_mtime_ns):
+            return True, known[2]
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _hashes[filepath] = (st.st_size, st.st_mtime_ns, digest)
+    return True, digest
+
+
+def _write_if_changed(filepath: Path, content: str) -> str:
+    """Write content unless the file already holds it; returns "unchanged", "updated" or "created"."""
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    existed, existing = _existing_hash(filepath, len(data))
+    if existing == digest:
+        return "unchanged"
+    st = _replace_atomic(filepath, data)
+    _hashes[filepath] = (st.st_size, st.st_mtime_ns, digest)
+    return "updated" if existed else "created"
+
+
+@metrics.timed("write", touches=True)
+def write_file(filepath: Path, content: str) -> bool:
+    """
+    Write content to file atomically, creating directories as needed.
+    A file that already holds exactly this content is left untouched, so its
+    mtime (and everything keyed on it) stays the same. Returns whether the
+    file was written.
+    """
     config.ensure_dir(filepath)
-    filepath.write_text(content, encoding="utf-8")
-    print(f"Created: {filepath}")
+    status = _write_if_changed(filepath, content)
+    print(f"{status.capitalize()}: {filepath}")
+    return status != "unchanged"
+
+
+@metrics.timed("write")
+def write_files(files: dict[Path, str]) -> dict[str, int]:
+    """
+    Write several files, skipping those whose content is unchanged.
+
+    Files are grouped by directory so each directory is created once, and
+    every write is atomic. Returns counts of "written" and "skipped" files.
+    """
+    by_dir = {}
+    for filepath, content in files.items():
+        by_dir.setdefault(filepath.parent, []).append((filepath, content))
+
+    counts = {"written": 0, "skipped": 0}
+    for directory, batch in by_dir.items():
+        directory.mkdir(parents=True, exist_ok=True)
+        for filepath, content in batch:
+            if _write_if_changed(filepath, content) == "unchanged":
+                counts["skipped"] += 1
+            else:
+                counts["written"] += 1
+    return counts
 
 
+@metrics.timed("read", touches=True)
 def read_file(filepath: Path) -> str | None:
     """Read file content, returning None if file doesn't exist."""
     if not filepath.exists():
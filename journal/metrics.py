@@ -0,0 +1,268 @@
+"""
+Command latency metrics.
+Times the phases of each command run (scan, read, parse, render, write),
+leaving out time spent in the editor and at prompts, and appends one
+compact record per run to a size-capped log under JOURNAL_DIR.
+"""
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from . import config
+
+
+LOG_NAME = ".metrics.jsonl"
+
+# The log is trimmed to its newest half once it grows past this
+MAX_LOG_BYTES = 256 * 1024
+
+# Phases reported per run; "interactive" is measured only to be excluded
+PHASES = ("scan", "read", "parse", "render", "write")
+
+# Set $JOURNAL_METRICS=0 to stop recording
+ENV_VAR = "JOURNAL_METRICS"
+
+
+class Run:
+    """Phase timings for one command run. Nested phases are exclusive."""
+
+    def __init__(self, command: str):
+        self.command = command
+        # Only the thread running the command is timed
+        self.thread = threading.get_ident()
+        self.seconds = dict.fromkeys(PHASES + ("interactive",), 0.0)
+        self.touched = set()
+        self._stack = []
+        self._mark = time.perf_counter()
+
+    def _switch(self, now: float) -> None:
+        if self._stack:
+            self.seconds[self._stack[-1]] += now - self._mark
+        self._mark = now
+
+    def enter(self, phase: str) -> None:
+        self._switch(time.perf_counter())
+        self._stack.append(phase)
+
+    def exit(self) -> None:
+        self._switch(time.perf_counter())
+        self._stack.pop()
+
+
+_current: Run | None = None
+
+
+@contextmanager
+def phase(name: str):
+    """Attribute the enclosed time to a phase of the current run, if any."""
+    run = _current
+    if run is None or run.thread != threading.get_ident():
+        yield
+        return
+    run.enter(name)
+    try:
+        yield
+    finally:
+        run.exit()
+
+
+def timed(name: str, touches: bool = False):
+    """
+    Decorator attributing a function's time to a phase.
+
+    With touches=True, a path passed as the first argument is counted as a
+    file the command touched.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            run = _current
+            if run is None or run.thread != threading.get_ident():
+                return fn(*args, **kwargs)
+            if touches and args and isinstance(args[0], (str, os.PathLike)):
+                run.touched.add(str(args[0]))
+            run.enter(name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                run.exit()
+        return wrapper
+    return decorate
+
+
+def enabled() -> bool:
+    """Whether command runs are recorded ($JOURNAL_METRICS, default on)."""
+    return os.environ.get(ENV_VAR, "1") not in ("", "0")
+
+
+def log_path() -> Path:
+    """Path of the metrics log."""
+    return config.JOURNAL_DIR / LOG_NAME
+
+
+def read_records() -> list[dict]:
+    """All records in the metrics log, oldest first, skipping damaged lines."""
+    records = []
+    try:
+        with open(log_path(), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return records
+
+
+def _last_record() -> dict | None:
+    """The newest record, read from the end of the log."""
+    try:
+        with open(log_path(), "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            lines = f.read().splitlines()
+        return json.loads(lines[-1]) if lines else None
+    except (OSError, ValueError):
+        return None
+
+
+def archive_size() -> int:
+    """
+    Number of journal files in the archive.
+    Counted at most once a day; other runs reuse the newest record's count.
+    """
+    from . import archive
+
+    last = _last_record()
+    if last and "archive" in last and date.fromtimestamp(last["t"]) == date.today():
+        return last["archive"]
+    return sum(1 for _ in archive.iter_entries())
+
+
+def _append(record: dict) -> None:
+    path = log_path()
+    config.ensure_dir(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        size = f.tell()
+
+    if size > MAX_LOG_BYTES:
+        from . import io
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        io.write_atomic(path, "".join(lines[len(lines) // 2:]))
+
+
+@contextmanager
+def recording(command: str):
+    """Time a command run and append its record to the metrics log."""
+    global _current
+    if not enabled() or _current is not None:
+        yield None
+        return
+
+    run = Run(command)
+    start = time.perf_counter()
+    _current = run
+    try:
+        yield run
+    finally:
+        _current = None
+        wall = time.perf_counter() - start
+        total = wall - run.seconds["interactive"]
+        record = {
+            "t": int(time.time()),
+            "cmd": command,
+            "ms": {p: round(run.seconds[p] * 1000, 2) for p in PHASES if run.seconds[p]},
+            "total": round(total * 1000, 2),
+            "files": len(run.touched),
+        }
+        try:
+            record["archive"] = archive_size()
+            _append(record)
+        except OSError:
+            pass
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def trend_ms_per_1000_files(records: list[dict]) -> float | None:
+    """Least-squares slope of total latency against archive size."""
+    points = [(r["archive"], r["total"]) for r in records if "archive" in r]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var * 1000
+
+
+def summarize(records: list[dict]) -> dict[str, dict]:
+    """Per-command count, latency percentiles, phase medians and trend."""
+    by_command = {}
+    for record in records:
+        by_command.setdefault(record["cmd"], []).append(record)
+
+    summary = {}
+    for command, runs in sorted(by_command.items()):
+        totals = [r["total"] for r in runs]
+        phases = {}
+        for p in PHASES:
+            values = [r["ms"].get(p, 0.0) for r in runs]
+            if any(values):
+                phases[p] = percentile(values, 0.5)
+        summary[command] = {
+            "count": len(runs),
+            "p50": percentile(totals, 0.5),
+            "p90": percentile(totals, 0.9),
+            "p99": percentile(totals, 0.99),
+            "sum": sum(totals),
+            "phases": phases,
+            "trend": trend_ms_per_1000_files(runs),
+            "last": datetime.fromtimestamp(runs[-1]["t"]).strftime("%Y-%m-%d"),
+        }
+    return summary
+
+
+def prometheus_text(summary: dict[str, dict], archive_files: int | None) -> str:
+    """Render a summary in the Prometheus textfile exposition format."""
+    lines = [
+        "# HELP journal_command_duration_seconds Command latency excluding editor and prompt time.",
+        "# TYPE journal_command_duration_seconds summary",
+    ]
+    for command, s in summary.items():
+        label = command.replace("\\", "\\\\").replace('"', '\\"')
+        for key, quantile in (("p50", "0.5"), ("p90", "0.9"), ("p99", "0.99")):
+            lines.append(f'journal_command_duration_seconds{{command="{label}",quantile="{quantile}"}} {s[key] / 1000:.6f}')
+        lines.append(f'journal_command_duration_seconds_sum{{command="{label}"}} {s["sum"] / 1000:.6f}')
+        lines.append(f'journal_command_duration_seconds_count{{command="{label}"}} {s["count"]}')
+
+    lines += [
+        "# HELP journal_command_phase_seconds Median time per phase of each command.",
+        "# TYPE journal_command_phase_seconds gauge",
+    ]
+    for command, s in summary.items():
+        label = command.replace("\\", "\\\\").replace('"', '\\"')
+        for p, ms in s["phases"].items():
+            lines.append(f'journal_command_phase_seconds{{command="{label}",phase="{p}"}} {ms / 1000:.6f}')
+
+    if archive_files is not None:
+        lines += [
+            "# HELP journal_archive_files Journal files in the archive.",
+            "# TYPE journal_archive_files gauge",
+            f"journal_archive_files {archive_files}",
+        ]
+    return "\n".join(lines) + "\n"
@@ -3,6 +3,7 @@ Data models for journal system.
 ParsedFile dataclass and related types.
 """
 
+from datetime import date
 from pathlib import Path
 from dataclasses import dataclass, field
 
@@ -14,10 +15,27 @@ class ParsedFile:
     sections: dict[str, list[str]] = field(default_factory=dict)
     raw_lines: list[str] = field(default_factory=list)
     front_matter: dict[str, str] = field(default_factory=dict)
+    # Whether the file carries the canonical-format marker
+    canonical: bool = False
+    # Dates of referenced daily entries that changed since the file was written
+    drift: list[date] = field(default_factory=list)
+    _expanded: set[str] = field(default_factory=set, repr=False, compare=False)
 
     def get_section(self, name: str) -> list[str]:
-        """Get section content by canonical name."""
-        return self.sections.get(name, [])
+        """Get section content by canonical name.
+
+        Daily references (weekly reviews in reference mode) are expanded to
+        the referenced journal text the first time the section is read.
+        """
+        lines = self.sections.get(name, [])
+        if name not in self._expanded:
+            self._expanded.add(name)
+            from .references import REFERENCE_PREFIX, expand_lines
+            if any(line.startswith(REFERENCE_PREFIX) for line in lines):
+                lines, drifted = expand_lines(lines)
+                self.sections[name] = lines
+                self.drift.extend(d for d in drifted if d not in self.drift)
+        return lines
 
     def get_section_text(self, name: str) -> str:
         """Get section as joined text, stripped."""
@@ -38,3 +56,11 @@ class ParsedFile:
     def get_front_matter(self, key: str) -> str | None:
         """Get a value from the YAML front matter."""
         return self.front_matter.get(key)
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """A journal file found in the archive."""
+    kind: str   # "daily", "review" or "monthly"
+    date: date  # entry date; the first of the month for monthly reviews
+    path: Path
@@ -4,8 +4,11 @@ Handles section extraction with fallbacks for format variations.
 """
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
+from . import metrics
 from .models import ParsedFile
+from .references import REFERENCE_PREFIX
 
 
 # Section header patterns - normalize these to canonical names
@@ -18,6 +21,7 @@ SECTION_ALIASES = {
     # Weekly review sections
     "weekly reflection": "weekly_reflection",
     "weekly summary": "weekly_summary",
+    "daily entries": "daily_entries",
     "daily summaries": "daily_summaries",
 
     # Monthly review sections
@@ -26,6 +30,29 @@ SECTION_ALIASES = {
     "monthly summary": "monthly_summary",
 }
 
+# First line of files in the current template format (after any front
+# matter). Such files are split on exact canonical headers only.
+CANONICAL_MARKER = "<!-- journal: canonical v1 -->"
+
+# Header title written for each canonical section
+CANONICAL_HEADERS = {
+    "journal": "Journal entry",
+    "summary": "Summary",
+    "weekly_reflection": "Weekly reflection",
+    "weekly_summary": "Weekly summary",
+    "daily_entries": "Daily entries",
+    "daily_summaries": "Daily summaries",
+    "consistency": "Consistency",
+    "monthly_reflection": "Monthly reflection",
+    "monthly_summary": "Monthly summary",
+}
+
+_CANONICAL_HEADER_LINES = {f"## {title}:": name for name, title in CANONICAL_HEADERS.items()}
+
+# Characters of a line searched for a header name; far longer than any
+# alias plus its markers
+MAX_HEADER_SCAN = 256
+
 
 def normalize_header(line: str) -> str | None:
     """
@@ -39,7 +66,7 @@ def normalize_header(line: str) -> str | None:
     
     # If there's a colon, only look at the part before it for matching
     if ":" in cleaned:
-        prefix = cleaned.split(":")[0].strip()
+        prefix = cleaned.partition(":")[0].strip()
         prefix_with_colon = prefix + ":"
         # Try with colon first (some aliases include it)
         if prefix_with_colon.rstrip(":") in SECTION_ALIASES:
@@ -52,55 +79,55 @@ def normalize_header(line: str) -> str | None:
     return SECTION_ALIASES.get(cleaned_no_colon)
 
 
-def is_section_header(line: str) -> bool:
-    """Check if line looks like a section header."""
-    stripped = line.strip()
-    if not stripped:
-        return False
-    
-    # Check for common header patterns
-    if stripped.startswith("#"):
-        return True
-    if stripped.startswith("[") and stripped.endswith("]"):
-        return True
-    # All caps line ending with colon
-    if stripped.rstrip(":").isupper() and ":" in stripped:
-        return True
-    
-    # Check if it matches a known alias (check prefix before colon)
-    if ":" in stripped:
-        prefix = stripped.split(":")[0].strip()
-        if normalize_header(prefix + ":"):
-            return True
-    
-    # Standalone line matching alias
-    if normalize_header(stripped):
-        return True
-    
-    return False
-
-
 def is_separator(line: str) -> bool:
     """Check if line is a visual separator (===, ---, etc)."""
     stripped = line.strip()
-    if len(stripped) < 3:
-        return False
-    return all(c in "=-_" for c in stripped)
+    return len(stripped) >= 3 and not stripped.strip("=-_")
 
 
-def parse_file(filepath: Path) -> ParsedFile | None:
+def is_metadata(stripped: str) -> bool:
+    """Check if a stripped line is a metadata reference like [weekly_file:...]."""
+    return (stripped.startswith("[") and stripped.endswith("]") and ":" in stripped
+            and stripped[:len("[completed")].lower() != "[completed")
+
+
+def header_name(stripped: str) -> str | None:
     """
-    Parse a journal file into sections.
-    Returns None if file doesn't exist.
+    Canonical section name of a stripped line if it is a section header.
+
+    Same answer as the header heuristics it replaced (ALL-CAPS, [bracket] and
+    alias lines, then normalize_header), but only the first MAX_HEADER_SCAN
+    characters are looked at: a longer line
+    can only be a header if it has a colon within them (an inline value).
+    Work per line is therefore bounded however long the line is.
     """
-    if not filepath.exists():
+    if not stripped or stripped.startswith("- "):
+        return None
+    colon = stripped.find(":", 0, MAX_HEADER_SCAN)
+    if colon >= 0:
+        return normalize_header(stripped[:colon + 1])
+    if len(stripped) > MAX_HEADER_SCAN:
         return None
+    return normalize_header(stripped)
+
+
+@metrics.timed("parse", touches=True)
+def parse_file(filepath: Path, sections: set[str] | None = None) -> ParsedFile | None:
+    """
+    Parse a journal file into sections.
+    Returns None if file doesn't exist.
 
+    If sections is given, only those canonical sections are kept, and parsing
+    stops as soon as all of them have been read.
+    """
     result = ParsedFile(filepath=filepath)
 
+    # Opening directly saves a separate exists() stat per parse
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        with metrics.phase("read"), open(filepath, "r", encoding="utf-8", errors="ignore") as f:
             result.raw_lines = f.readlines()
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"Warning: Could not read {filepath}: {e}")
         return None
@@ -127,53 +154,98 @@ def parse_file(filepath: Path) -> ParsedFile | None:
                 key, value = line.split(":", 1)
                 result.front_matter[key.strip()] = value.strip()
 
+    body = result.raw_lines[content_start_idx:]
+    if body and body[0].strip() == CANONICAL_MARKER:
+        result.canonical = True
+        split = iter_canonical_sections(body[1:])
+    else:
+        split = iter_lenient_sections(body)
+
+    for name, content in split:
+        if name is None:
+            continue
+        result.sections[name] = content
+        if sections is not None and sections <= result.sections.keys():
+            break
+
+    if sections is not None:
+        result.sections = {k: v for k, v in result.sections.items() if k in sections}
+    
+    return result
+
+
+def iter_lenient_sections(lines: list[str]) -> Iterator[tuple[str | None, list[str]]]:
+    """
+    Split lines into (section, content) pairs in file order, tolerating
+    legacy formats: alias, ALL-CAPS and [bracket] headers, separators and
+    [weekly_file:...] metadata lines.
+
+    Lines before the first recognized header come first, under None. Each
+    line is stripped once and inspected a bounded number of times, so time
+    and memory grow linearly with the file, however it is shaped.
+    """
     current_section = None
     current_content = []
 
-    for line in result.raw_lines[content_start_idx:]:
+    for line in lines:
+        stripped = line.strip()
+
         # Skip separators
-        if is_separator(line):
+        if len(stripped) >= 3 and not stripped.strip("=-_"):
+            continue
+
+        # Daily references are content; ParsedFile expands them on access
+        if stripped.startswith(REFERENCE_PREFIX):
+            current_content.append(stripped)
             continue
-        
+
         # Skip metadata references like [weekly_file:...]
-        stripped = line.strip()
-        if stripped.startswith("[") and ":" in stripped and stripped.endswith("]"):
-            if not stripped.lower().startswith("[completed"):
-                continue
-        
-        # Check for section header
-        if is_section_header(line):
-            # Save previous section
-            if current_section:
-                result.sections[current_section] = current_content
-            
-            # Start new section
-            canonical = normalize_header(line)
-            if canonical:
-                current_section = canonical
-                current_content = []
-                
-                # Check for inline value (e.g., "Sleep quality: O")
-                if ":" in line:
-                    parts = line.split(":", 1)
-                    if len(parts) > 1:
-                        inline_value = parts[1].strip()
-                        if inline_value:
-                            current_content.append(inline_value)
-            else:
-                # Unknown header - keep content with previous section
-                if current_section:
-                    current_content.append(line)
+        if is_metadata(stripped):
+            continue
+
+        # Check for section header; unknown headers are kept as content
+        canonical = header_name(stripped)
+        if canonical:
+            yield current_section, current_content
+            current_section = canonical
+            current_content = []
+
+            # Check for inline value (e.g., "Sleep quality: O")
+            inline_value = stripped.partition(":")[2].strip()
+            if inline_value:
+                current_content.append(inline_value)
         else:
             # Regular content line
-            if current_section:
-                current_content.append(line.rstrip("\n"))
-    
-    # Save final section
-    if current_section:
-        result.sections[current_section] = current_content
-    
-    return result
+            current_content.append(line.rstrip("\n"))
+
+    # Final section
+    yield current_section, current_content
+
+
+def iter_canonical_sections(lines: list[str]) -> Iterator[tuple[str | None, list[str]]]:
+    """
+    Split a normalized file into (section, content) pairs in file order.
+
+    Only exact canonical header lines ("## Journal entry:") start a section;
+    separators are skipped as in the lenient parser and every other line is
+    content. Lines before the first header come first, under None.
+    """
+    current_section = None
+    current_content = []
+
+    for line in lines:
+        if line.startswith("## "):
+            name = _CANONICAL_HEADER_LINES.get(line.rstrip())
+            if name:
+                yield current_section, current_content
+                current_section = name
+                current_content = []
+                continue
+        if is_separator(line):
+            continue
+        current_content.append(line.rstrip("\n"))
+
+    yield current_section, current_content
 
 
 def find_daily_files(d) -> list[Path]:
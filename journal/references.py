@@ -0,0 +1,171 @@
+"""
+References to daily entries.
+Weekly reviews in reference mode store a date and content hash per day
+instead of a copy of the journal text, and expand them when read.
+"""
+
+import re
+from datetime import date
+from . import cache, config, io
+
+
+# Line format: [daily_ref: YYYY-MM-DD <hash>]
+REFERENCE_PREFIX = "[daily_ref:"
+REFERENCE_PATTERN = re.compile(r"^\[daily_ref:\s*(\d{4}-\d{2}-\d{2})\s+([0-9a-f]+)\]$")
+
+# Hex digits of the content hash kept in a reference
+HASH_LENGTH = 16
+
+# The expansion cache holds one file per week, as references/<Sunday>
+CACHE_NAME = "references"
+
+# Only the most recently updated weeks are kept
+MAX_CACHED_WEEKS = 8
+
+# In-process copy of the loaded week files, keyed by cache file path so that
+# switching JOURNAL_DIR never serves another archive's entries
+_loaded: dict[str, dict] = {}
+
+
+def make_reference(d: date, journal_text: str) -> str:
+    """Build the reference line standing in for a day's journal text."""
+    return f"{REFERENCE_PREFIX} {d} {io.content_hash(journal_text)[:HASH_LENGTH]}]"
+
+
+def parse_reference(line: str) -> tuple[date, str] | None:
+    """Extract (date, hash) from a reference line, or None if it isn't one."""
+    match = REFERENCE_PATTERN.match(line.strip())
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(1)), match.group(2)
+    except ValueError:
+        return None
+
+
+def _week_name(d: date) -> str:
+    return f"{CACHE_NAME}/{config.get_sunday(d)}"
+
+
+def _week_cache(name: str) -> dict:
+    key = str(cache.cache_path(name))
+    if key not in _loaded:
+        _loaded[key] = cache.load(name)
+    return _loaded[key]
+
+
+def _prune() -> None:
+    """Remove all but the MAX_CACHED_WEEKS most recently updated week files."""
+    weeks = sorted(cache.cache_path(CACHE_NAME).with_suffix("").glob("*.json"),
+                   key=lambda path: path.stat().st_mtime_ns, reverse=True)
+    for path in weeks[MAX_CACHED_WEEKS:]:
+        _loaded.pop(str(path), None)
+        path.unlink(missing_ok=True)
+    # Every day's text was once kept together in references.json
+    cache.cache_path(CACHE_NAME).unlink(missing_ok=True)
+
+
+def journal_texts(dates) -> dict[date, str | None]:
+    """
+    Get the current journal text of several daily entries.
+    Each is served from its week's expansion cache file while the daily
+    file's size and mtime are unchanged, and parsed otherwise; each week file
+    that changed is saved once for the lot, so only the weeks asked about are
+    ever rewritten. A missing daily entry maps to None.
+    """
+    from . import parser
+
+    texts = {}
+    changed = set()
+    for d in dates:
+        path = config.daily_path(d)
+        try:
+            st = path.stat()
+        except OSError:
+            texts[d] = None
+            continue
+
+        name = _week_name(d)
+        entries = _week_cache(name)
+        entry = entries.get(str(d))
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            texts[d] = entry["text"]
+            continue
+
+        parsed = parser.parse_file(path)
+        texts[d] = parsed.get_section_text("journal") if parsed else ""
+        entries[str(d)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "text": texts[d]}
+        changed.add(name)
+
+    for name in sorted(changed):
+        cache.save(name, _week_cache(name))
+    if changed:
+        _prune()
+    return texts
+
+
+def journal_text(d: date) -> str | None:
+    """Get the current journal text of a daily entry, or None if it doesn't exist."""
+    return journal_texts([d])[d]
+
+
+def expand(line: str) -> tuple[list[str], date | None]:
+    """
+    Expand a reference line into the referenced journal text.
+
+    Returns (lines, drifted_date). drifted_date is set when the daily entry is
+    missing or its text no longer matches the hash stored in the reference;
+    the expansion then carries a note saying so.
+    """
+    ref = parse_reference(line)
+    if ref is None:
+        return [line], None
+
+    d, digest = ref
+    text = journal_text(d)
+    if text is None:
+        return [f"(missing daily entry for {d})"], d
+
+    lines = text.split("\n")
+    if not io.content_hash(text).startswith(digest):
+        lines.append(f"(changed since this review was written: daily entry for {d})")
+        return lines, d
+    return lines, None
+
+
+def find_drift(lines: list[str]) -> list[date]:
+    """
+    Dates referenced in lines whose daily entry is missing or no longer
+    matches its reference hash.
+
+    Each daily is parsed directly and the expansion cache is neither read
+    nor saved, so this is safe to call from several worker processes.
+    """
+    from . import parser
+
+    drifted = []
+    for line in lines:
+        ref = parse_reference(line)
+        if ref is None:
+            continue
+        d, digest = ref
+        parsed = parser.parse_file(config.daily_path(d))
+        text = parsed.get_section_text("journal") if parsed else None
+        if (text is None or not io.content_hash(text).startswith(digest)) and d not in drifted:
+            drifted.append(d)
+    return drifted
+
+
+def expand_lines(lines: list[str]) -> tuple[list[str], list[date]]:
+    """Expand every reference line in a section, returning (lines, drifted dates)."""
+    expanded = []
+    drifted = []
+    for line in lines:
+        if not line.startswith(REFERENCE_PREFIX):
+            expanded.append(line)
+            continue
+        new_lines, drift = expand(line)
+        expanded.extend(new_lines)
+        if drift is not None:
+            drifted.append(drift)
+    return expanded, drifted
@@ -0,0 +1,108 @@
+"""
+Review status for shell prompts and status bars.
+Answers whether today's entry, this week's review and the pending monthly
+review exist with one stat each, cheaply enough to run every few seconds:
+nothing else from the package is imported, and the calendar computation
+(which needs datetime) runs once a day, its answer memoized in a one-line
+file under JOURNAL_DIR/.cache.
+"""
+
+import os
+import sys
+import time
+
+
+# Time `journal.py status` may add to a bare `python3 -S` start (checked by
+# tests/test_status.py)
+LATENCY_BUDGET_MS = 10
+
+# Same as config.JOURNAL_DIR, without importing config (and pathlib with it)
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".entries_encrypted")
+
+# "YYYY-MM-DD daily review monthly month-label", paths relative to the journal directory
+MEMO_NAME = "status"
+
+# day -> (daily, weekly review, monthly review, review month label)
+_targets: dict[str, tuple[str, str, str, str]] = {}
+
+
+def journal_dir() -> str:
+    """config.JOURNAL_DIR if config is loaded (it may point elsewhere), else the default."""
+    config = sys.modules.get("journal.config")
+    return str(config.JOURNAL_DIR) if config else DEFAULT_JOURNAL_DIR
+
+
+def _compute(day: str) -> tuple[str, str, str, str]:
+    from datetime import date, timedelta
+    from .dates import detect_review_month, get_sunday
+
+    today = date.fromisoformat(day)
+    saturday = get_sunday(today) + timedelta(days=6)
+    month = detect_review_month(today)
+    # Same layout as config.daily_path, config.review_path and
+    # config.monthly_path (see config._journal_path), spelled out here so
+    # config and pathlib aren't imported; tests/test_status.py checks they agree
+    return (
+        f"{today.year}/{today.month:02d}/daily-{today}.md",
+        f"{saturday.year}/{saturday.month:02d}/review-{saturday}.md",
+        f"{month.year}/{month.month:02d}/monthly-{month.year}-{month.month:02d}.md",
+        month.strftime("%b").lower(),
+    )
+
+
+def targets(day: str, root: str = None) -> tuple[str, str, str, str]:
+    """
+    The files status checks on a day (YYYY-MM-DD) and the review month's label.
+
+    Memoized in the process and in the memo file, which holds the answer for
+    the last day asked about; it is only written if the journal directory
+    exists, so an unmounted volume is never created.
+    """
+    if day in _targets:
+        return _targets[day]
+    if root is None:
+        root = journal_dir()
+    memo = os.path.join(root, ".cache", MEMO_NAME)
+    try:
+        with open(memo, encoding="utf-8") as f:
+            fields = f.read().rstrip("\n").split(" ", 4)
+    except OSError:
+        fields = []
+    if len(fields) == 5 and fields[0] == day:
+        found = tuple(fields[1:])
+    else:
+        found = _compute(day)
+        if os.path.isdir(root):
+            try:
+                os.makedirs(os.path.dirname(memo), exist_ok=True)
+                with open(memo + ".tmp", "w", encoding="utf-8") as f:
+                    f.write(" ".join((day, *found)) + "\n")
+                os.replace(memo + ".tmp", memo)
+            except OSError:
+                pass
+    _targets[day] = found
+    return found
+
+
+def status(today=None) -> dict[str, bool]:
+    """
+    Whether today's daily entry ("day"), this week's review ("week") and the
+    pending monthly review ("month", see config.detect_review_month) exist.
+    today is a date (default: the current local date).
+    """
+    day = str(today) if today is not None else time.strftime("%Y-%m-%d")
+    root = journal_dir()
+    daily, review, monthly, _ = targets(day, root)
+    return {
+        "day": os.path.exists(os.path.join(root, daily)),
+        "week": os.path.exists(os.path.join(root, review)),
+        "month": os.path.exists(os.path.join(root, monthly)),
+    }
+
+
+def status_line(today=None) -> str:
+    """One line for a prompt, e.g. "day:done week:todo sep:done"."""
+    day = str(today) if today is not None else time.strftime("%Y-%m-%d")
+    done = status(day)
+    labels = {"day": "day", "week": "week", "month": targets(day)[3]}
+    return " ".join(f"{labels[k]}:{'done' if done[k] else 'todo'}" for k in ("day", "week", "month"))
@@ -4,15 +4,22 @@ Generates content for new entries.
 """
 
 from datetime import date, timedelta
+from . import metrics
+from .parser import CANONICAL_MARKER
 
 
+@metrics.timed("render")
 def daily_journal_template(
     d: date
 ) -> str:
-    """Generate daily journal template."""
+    """
+    Generate daily journal template.
 
-    return f"""
-# Daily Entry - {d.strftime("%A, %B %d, %Y")}
+    The body is typed by hand in the editor, so it carries no canonical
+    marker: a typed "Summary: ..." line is read as a header, as in older files.
+    """
+
+    return f"""# Daily Entry - {d.strftime("%A, %B %d, %Y")}
 
 ---
 
@@ -21,6 +28,7 @@ def daily_journal_template(
 """
 
 
+@metrics.timed("render")
 def weekly_review_template(
     d: date,
     daily_entries: dict[str, str],
@@ -28,7 +36,8 @@ def weekly_review_template(
     weekly_summary: list[str],
 ) -> str:
     """Generate weekly review content."""
-    content = f"""# Weekly Review - {d.strftime("%B %d, %Y")}
+    content = f"""{CANONICAL_MARKER}
+# Weekly Review - {d.strftime("%B %d, %Y")}
 """
     content += "\n## Daily entries:\n"
     if daily_entries:
@@ -49,6 +58,7 @@ def weekly_review_template(
     return content
 
 
+@metrics.timed("render")
 def monthly_review_template(
     d: date,
     consistency: dict,
@@ -60,7 +70,8 @@ def monthly_review_template(
     """Generate monthly review content."""
     month_name = d.strftime("%B %Y")
 
-    content = f"""# Monthly Review
+    content = f"""{CANONICAL_MARKER}
+# Monthly Review
 Month: {month_name}
 
 ## Consistency:
@@ -0,0 +1,26 @@
+"""
+Text utilities.
+Tokenizing journal prose for search and statistics.
+"""
+
+import re
+
+
+WORD_PATTERN = re.compile(r"[a-z][a-z']+")
+
+# Common words that carry no theme
+STOPWORDS = frozenset("""
+a about after again all also am an and any are as at be because been before
+being but by can could did do does doing don't down during each few for from
+got had has have having he her here hers him his how i i'm if in into is it
+it's its just like me more most my no nor not now of off on once only or other
+our out over own really same she so some still such than that the their them
+then there these they this those through to too today under until up very was
+we went were what when where which while who why will with would you your
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of three or more letters, minus stopwords."""
+    words = (word.strip("'") for word in WORD_PATTERN.findall(text.lower()))
+    return [word for word in words if len(word) > 2 and word not in STOPWORDS]
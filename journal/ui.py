@@ -3,11 +3,14 @@ User interaction utilities.
 Prompts, menus, and editor integration.
 """
 
+import os
+import shlex
 import subprocess
 import sys
 import threading
+from collections.abc import Iterable
 from pathlib import Path
-from . import config
+from . import config, metrics
 
 
 def start_background_timer(minutes=15):
@@ -40,6 +43,13 @@ def cancel_timer(timer):
     timer.cancel()
 
 
+@metrics.timed("interactive")
+def prompt(text: str) -> str:
+    """Ask for a single line of input."""
+    return input(text).strip()
+
+
+@metrics.timed("interactive")
 def get_multi_line_input(prompt: str) -> list[str]:
     """Get multi-line bullet point input from user."""
     print(f"\n{prompt}")
@@ -55,6 +65,7 @@ def get_multi_line_input(prompt: str) -> list[str]:
     return items
 
 
+@metrics.timed("interactive")
 def open_in_editor(filepath: Path, daily_entry: bool = False, timer_minutes: int = 0) -> None:
     """Open file in user's editor.
 
@@ -88,6 +99,7 @@ def open_in_editor(filepath: Path, daily_entry: bool = False, timer_minutes: int
         cancel_timer(timer)
 
 
+@metrics.timed("interactive")
 def handle_existing_file(filepath: Path, file_type: str) -> str:
     """
     Handle case where file already exists.
@@ -108,3 +120,44 @@ def handle_existing_file(filepath: Path, file_type: str) -> str:
         return 'recreate'
     else:
         return 'quit'
+
+
+def page_output(lines: Iterable[str]) -> None:
+    """
+    Stream lines through $PAGER (default: less) as they are produced.
+
+    Lines are pulled from the iterable only as fast as the pager accepts them,
+    and quitting the pager stops iteration. Without a terminal, lines go
+    straight to stdout.
+    """
+    if not sys.stdout.isatty():
+        try:
+            for line in lines:
+                sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # Downstream closed (e.g. `| head`); silence the flush at exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+
+    # Only producing the lines is the command's own time; writes block while
+    # the user reads, so they and the final wait count as interactive
+    pager = shlex.split(os.environ.get("PAGER") or "less")
+    proc = subprocess.Popen(pager, stdin=subprocess.PIPE, text=True, encoding="utf-8")
+    try:
+        for line in lines:
+            with metrics.phase("interactive"):
+                proc.stdin.write(line + "\n")
+                proc.stdin.flush()
+        proc.stdin.close()
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        if hasattr(lines, "close"):
+            lines.close()
+        with metrics.phase("interactive"):
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            proc.wait()
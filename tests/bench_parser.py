@@ -0,0 +1,68 @@
+"""Parser scaling benchmark, from 1 KB to 50 MB per input shape.
+
+Run with: python3 tests/bench_parser.py [--max-mb 50] [--shape NAME]
+
+Prints parse time, throughput and peak traced memory per size. Linear
+scaling shows as a flat ns/byte column; the last column is each size's
+ns/byte relative to the 1 MB run.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from journal import parser
+from test_parser_scaling import CORPUS, fuzz
+
+SIZES = [1 << 10, 10 << 10, 100 << 10, 1 << 20, 10 << 20, 50 << 20]
+
+
+def measure(path: Path) -> tuple[float, int]:
+    """Parse time in seconds (best of up to 3 runs), and peak traced memory."""
+    runs = 3 if path.stat().st_size < (10 << 20) else 1
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        parser.parse_file(path)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    parser.parse_file(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--max-mb", type=float, default=50)
+    ap.add_argument("--shape", choices=[*CORPUS, "fuzz"], action="append")
+    args = ap.parse_args()
+
+    shapes = dict(CORPUS, fuzz=fuzz)
+    sizes = [s for s in SIZES if s <= args.max_mb * (1 << 20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.md"
+        for name in args.shape or shapes:
+            print(f"\n{name}")
+            print(f"{'size':>10} {'ms':>10} {'MB/s':>8} {'ns/byte':>8} {'peak MB':>8} {'vs 1MB':>7}")
+            baseline = None
+            for size in sizes:
+                path.write_text(shapes[name](size))
+                actual = path.stat().st_size
+                seconds, peak = measure(path)
+                ns_per_byte = seconds * 1e9 / actual
+                if size == 1 << 20:
+                    baseline = ns_per_byte
+                relative = f"{ns_per_byte / baseline:.2f}" if baseline else "-"
+                print(f"{actual:>10} {seconds * 1000:>10.2f} {actual / seconds / 1e6:>8.1f} "
+                      f"{ns_per_byte:>8.1f} {peak / 1e6:>8.1f} {relative:>7}")
+
+
+if __name__ == "__main__":
+    main()
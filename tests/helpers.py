@@ -0,0 +1,35 @@
+"""Helpers shared by the tests for writing journal files under config.JOURNAL_DIR."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, references, templates
+
+
+def write(path: Path, text: str) -> Path:
+    """Write text to path, creating its directory."""
+    config.ensure_dir(path)
+    path.write_text(text)
+    return path
+
+
+def write_daily(d: date, text: str) -> Path:
+    """Write a daily entry from the template with text as its journal section."""
+    return write(config.daily_path(d), templates.daily_journal_template(d) + text + "\n")
+
+
+def write_review(saturday: date, entries: list[tuple[date, str]] = (), reflection: str = "Fine.",
+                 summary: list[str] = ("one",), as_references: bool = False) -> Path:
+    """
+    Write the weekly review ending on saturday from the template, with
+    (date, journal text) entries, stored as daily references if as_references.
+    """
+    daily_entries = {
+        d.strftime("%A, %B %d"): references.make_reference(d, text) if as_references else text
+        for d, text in entries
+    }
+    return write(config.review_path(saturday),
+                 templates.weekly_review_template(saturday, daily_entries, reflection, list(summary)))
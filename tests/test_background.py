@@ -0,0 +1,210 @@
+"""Tests for cache refreshing while the editor is open.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import cache, config, instrument, metrics, references
+from helpers import write_daily
+
+background = importlib.import_module("journal.commands.background")
+day = importlib.import_module("journal.commands.day")
+lookback = importlib.import_module("journal.commands.lookback")
+related = importlib.import_module("journal.commands.related")
+trends = importlib.import_module("journal.commands.trends")
+week_review = importlib.import_module("journal.commands.week_review")
+
+
+class TestBackgroundRefresh(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+        references._loaded.clear()
+        self.addCleanup(references._loaded.clear)
+
+        for d in range(12, 17):
+            write_daily(date(2026, 7, d), f"Entry for July {d}")
+
+    def run_worker(self, target_date):
+        worker = background.Worker(target_date)
+        worker.start()
+        worker.join()
+        return worker
+
+    def test_week_review_finds_dailies_warm(self):
+        self.run_worker(date(2026, 7, 16))
+        references._loaded.clear()
+
+        with mock.patch("sys.stdout"), mock.patch("builtins.input", return_value=""), \
+                instrument.recording() as stats:
+            week_review.run(target_date=date(2026, 7, 18))
+
+        self.assertEqual(stats.parses, 0, stats.summary())
+        self.assertIn("Entry for July 14", config.review_path(date(2026, 7, 18)).read_text())
+
+    def test_day_session_rewrites_only_its_weeks_cache(self):
+        # Earlier weeks already expanded, e.g. by site or show
+        for d in range(1, 11):
+            write_daily(date(2026, 6, d), f"Entry for June {d}")
+        references.journal_texts([date(2026, 6, d) for d in range(1, 11)])
+        weeks = config.JOURNAL_DIR / ".cache" / references.CACHE_NAME
+        before = {p.name: p.stat().st_mtime_ns for p in weeks.iterdir()}
+
+        write_daily(date(2026, 7, 16), "Edited while the editor was open")
+        self.run_worker(date(2026, 7, 16))
+
+        after = {p.name: p.stat().st_mtime_ns for p in weeks.iterdir()}
+        changed = sorted(name for name in after if after[name] != before.get(name))
+        self.assertEqual(changed, ["2026-07-12.json"])
+        self.assertLessEqual(len(after), references.MAX_CACHED_WEEKS)
+
+    def test_only_existing_indexes_are_refreshed(self):
+        worker = self.run_worker(date(2026, 7, 16))
+        self.assertEqual(worker.done, ["daily texts"])
+        self.assertFalse(cache.cache_path(trends.CACHE_NAME).exists())
+
+        trends.monthly_totals()
+        write_daily(date(2026, 7, 17), "garden")
+        worker = self.run_worker(date(2026, 7, 16))
+
+        self.assertEqual(worker.done, ["daily texts", "trends"])
+        self.assertEqual(trends.monthly_totals()["2026-07"]["garden"], 1)
+
+    def test_stop_waits_for_the_current_task_only(self):
+        trends.monthly_totals()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_texts(dates):
+            started.set()
+            release.wait(5)
+            return {}
+
+        with mock.patch.object(references, "journal_texts", side_effect=slow_texts):
+            worker = background.Worker(date(2026, 7, 16))
+            worker.start()
+            started.wait(5)
+            threading.Timer(0.05, release.set).start()
+            worker.stop()
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(worker.done, ["daily texts"])
+
+    def touch_archive(self):
+        """Give every file a new mtime, as `normalize --apply` would."""
+        for path in config.JOURNAL_DIR.glob("20*/*/*.md"):
+            os.utime(path, ns=(path.stat().st_mtime_ns + 10**9,) * 2)
+
+    def test_stop_interrupts_an_archive_rescan(self):
+        for d in range(1, 29):
+            write_daily(date(2026, 6, d), f"garden {d}")
+        trends.monthly_totals()
+        self.touch_archive()
+
+        started = threading.Event()
+        calls = []
+        real_count = trends.count_terms
+
+        def slow_count(*args):
+            calls.append(args)
+            started.set()
+            time.sleep(0.01)
+            return real_count(*args)
+
+        with mock.patch.object(trends, "count_terms", side_effect=slow_count):
+            worker = background.Worker(date(2026, 7, 16))
+            worker.start()
+            started.wait(5)
+            worker.stop()
+
+        self.assertLess(len(calls), 10)
+
+        # What was saved is consistent: finishing the refresh matches a rebuild
+        partial = trends.monthly_totals()
+        cache.cache_path(trends.CACHE_NAME).unlink()
+        self.assertEqual(partial, trends.monthly_totals())
+
+    def test_cancelled_refreshes_leave_indexes_consistent(self):
+        for month in range(1, 7):
+            write_daily(date(2025, month, 16), f"garden {month}")
+        lookback.load_index()
+        index = related.TermIndex.load()
+        index.refresh()
+        index.save()
+        self.touch_archive()
+        write_daily(date(2025, 3, 17), "rowing")
+        config.daily_path(date(2025, 5, 16)).unlink()
+
+        def cancel_after(n):
+            checks = iter(range(n + 1))
+            return lambda: next(checks, n) >= n
+
+        lookback.load_index(cancelled=cancel_after(2))
+        index = related.TermIndex.load()
+        index.refresh(cancelled=cancel_after(3))
+        index.save()
+
+        def finished():
+            index = related.TermIndex.load()
+            index.refresh()
+            return lookback.load_index(), {rel: doc["terms"] for rel, doc in index.docs.items()}
+
+        resumed = finished()
+        for name in (lookback.CACHE_NAME, related.CACHE_NAME):
+            cache.cache_path(name).unlink()
+        rebuilt = finished()
+        self.assertEqual(resumed[0]["days"], rebuilt[0]["days"])
+        self.assertEqual(resumed[0]["weeks"], rebuilt[0]["weeks"])
+        self.assertEqual(sorted(resumed[1]), sorted(rebuilt[1]))
+
+    def test_day_stops_worker_when_editor_exits(self):
+        seen = []
+        week_cache = f"{references.CACHE_NAME}/2026-07-12"
+
+        def editor(*args, **kwargs):
+            seen.append(threading.active_count())
+            # Stay "in the editor" until the worker has cached the week
+            deadline = time.monotonic() + 5
+            while not cache.cache_path(week_cache).exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        with mock.patch("builtins.print"), mock.patch("journal.ui.open_in_editor", side_effect=editor):
+            before = threading.active_count()
+            day.run(target_date=date(2026, 7, 17))
+
+        self.assertEqual(seen, [before + 1])
+        self.assertEqual(threading.active_count(), before)
+        self.assertIn("2026-07-13", cache.load(week_cache))
+
+    def test_disabled_by_environment(self):
+        with mock.patch.dict("os.environ", {background.ENV_VAR: "0"}):
+            with background.refreshing(date(2026, 7, 16)) as worker:
+                self.assertIsNone(worker)
+
+    def test_worker_time_is_not_attributed_to_the_command(self):
+        with mock.patch.dict("os.environ", {metrics.ENV_VAR: "1"}), \
+                metrics.recording("day") as run:
+            self.run_worker(date(2026, 7, 16))
+
+        self.assertEqual(run.seconds["parse"], 0.0)
+        self.assertEqual(run._stack, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the hash-manifest incremental backup.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import cache, config, metrics
+from helpers import write
+
+backup = importlib.import_module("journal.commands.backup")
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name) / "journal"
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+        self.dest = Path(self._tmp.name) / "mirror"
+
+        for day in (3, 4, 5):
+            write(config.daily_path(date(2026, 8, day)), f"Entry {day}\n")
+
+    def test_first_run_copies_everything(self):
+        self.assertEqual(backup.backup(self.dest)["copied"], 3)
+        self.assertEqual(
+            (self.dest / "2026/08/daily-2026-08-04.md").read_text(), "Entry 4\n"
+        )
+
+    def test_no_change_run_only_stats(self):
+        backup.backup(self.dest)
+
+        with mock.patch.object(backup.io, "file_hash") as file_hash:
+            counts = backup.backup(self.dest)
+
+        file_hash.assert_not_called()
+        self.assertEqual(counts, {"copied": 0, "unchanged": 3, "deleted": 0})
+
+    def test_touched_but_identical_file_is_not_copied(self):
+        backup.backup(self.dest)
+        path = config.daily_path(date(2026, 8, 3))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertEqual(backup.backup(self.dest)["copied"], 0)
+
+    def test_changed_file_is_copied(self):
+        backup.backup(self.dest)
+        write(config.daily_path(date(2026, 8, 3)), "Rewritten entry\n")
+
+        self.assertEqual(backup.backup(self.dest)["copied"], 1)
+        self.assertEqual(
+            (self.dest / "2026/08/daily-2026-08-03.md").read_text(), "Rewritten entry\n"
+        )
+
+    def test_deletion_is_recorded_and_copy_kept(self):
+        backup.backup(self.dest)
+        config.daily_path(date(2026, 8, 5)).unlink()
+
+        self.assertEqual(backup.backup(self.dest)["deleted"], 1)
+        log = (self.dest / backup.DELETIONS_LOG).read_text()
+        self.assertIn("2026/08/daily-2026-08-05.md", log)
+        self.assertTrue((self.dest / "2026/08/daily-2026-08-05.md").exists())
+
+    def test_caches_are_not_backed_up(self):
+        cache.save("example", {"a": 1})
+
+        backup.backup(self.dest)
+        self.assertFalse((self.dest / cache.CACHE_DIRNAME).exists())
+
+    def test_metrics_log_does_not_defeat_a_no_change_run(self):
+        with metrics.recording("day"):
+            pass
+        backup.backup(self.dest)
+        with metrics.recording("day"):
+            pass
+
+        counts = backup.backup(self.dest)
+
+        self.assertTrue(metrics.log_path().exists())
+        self.assertEqual(counts["copied"], 0)
+        self.assertFalse((self.dest / metrics.LOG_NAME).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
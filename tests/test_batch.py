@@ -0,0 +1,127 @@
+"""Tests for non-interactive batch reviews.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import json
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, instrument, parser, templates
+
+base = importlib.import_module("journal.commands.base")
+month_review = importlib.import_module("journal.commands.month_review")
+week_review = importlib.import_module("journal.commands.week_review")
+
+
+class TestBatchReviews(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name) / "journal"
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        # Daily entries for every week July 2026 owns (Jun 28 - Aug 1)
+        d = date(2026, 6, 28)
+        while d <= date(2026, 8, 1):
+            path = config.daily_path(d)
+            config.ensure_dir(path)
+            path.write_text(templates.daily_journal_template(d) + f"Entry for {d}\n")
+            d += timedelta(days=1)
+
+        # Batch runs never prompt
+        patcher = mock.patch("builtins.input", side_effect=AssertionError("prompted"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_batch(self, name, items):
+        path = Path(self._tmp.name) / name
+        path.write_text("".join(json.dumps(item) + "\n" for item in items))
+        return path
+
+    def week_batch(self):
+        return self.write_batch("weeks.jsonl", [
+            {"date": str(date(2026, 7, 4) + timedelta(weeks=i)),
+             "reflection": f"Week {i} went fine.", "summary": [f"bullet {i}"]}
+            for i in range(5)
+        ])
+
+    def run_quietly(self, fn, *args, **kwargs):
+        with mock.patch("sys.stdout"), instrument.recording() as stats:
+            fn(*args, **kwargs)
+        return stats
+
+    def test_week_batch_writes_every_review(self):
+        self.run_quietly(week_review.run_batch, self.week_batch())
+
+        parsed = parser.parse_file(config.review_path(date(2026, 7, 18)))
+        self.assertEqual(parsed.get_section_text("weekly_reflection"), "Week 2 went fine.")
+        self.assertEqual(parsed.get_list_items("weekly_summary"), ["bullet 2"])
+        self.assertIn("Entry for 2026-07-15", parsed.get_section_text("daily_entries"))
+
+    def test_week_batch_scans_the_archive_once(self):
+        stats = self.run_quietly(week_review.run_batch, self.week_batch())
+
+        # Root, year and three month directories; no per-file existence checks
+        self.assertLessEqual(stats.listdirs, 5, stats.summary())
+        self.assertLessEqual(stats.stats, 5, stats.summary())
+        self.assertEqual(stats.parses, 35, stats.summary())
+
+    def test_existing_reviews_are_skipped_unless_overwrite(self):
+        self.run_quietly(week_review.run_batch, self.week_batch())
+        batch = self.write_batch("again.jsonl", [
+            {"date": "2026-07-11", "reflection": "Changed.", "summary": []},
+            {"date": "2026-07-18", "reflection": "Changed.", "summary": [], "overwrite": True},
+        ])
+        self.run_quietly(week_review.run_batch, batch)
+
+        def reflection(saturday):
+            return parser.parse_file(config.review_path(saturday)).get_section_text("weekly_reflection")
+
+        self.assertEqual(reflection(date(2026, 7, 11)), "Week 1 went fine.")
+        self.assertEqual(reflection(date(2026, 7, 18)), "Changed.")
+
+        self.run_quietly(week_review.run_batch, batch, overwrite=True)
+        self.assertEqual(reflection(date(2026, 7, 11)), "Changed.")
+
+    def test_month_batch_aggregates_weekly_reviews(self):
+        self.run_quietly(week_review.run_batch, self.week_batch())
+        batch = self.write_batch("months.jsonl", [
+            {"date": "2026-07-15", "reflection": "A good month.", "summary": ["garden"]},
+        ])
+        self.run_quietly(month_review.run_batch, batch)
+
+        parsed = parser.parse_file(config.monthly_path(date(2026, 7, 1)))
+        self.assertEqual(parsed.get_section_text("monthly_reflection"), "A good month.")
+        self.assertEqual(parsed.get_list_items("monthly_summary"), ["garden"])
+        self.assertEqual(parsed.get_list_items("consistency")[:2], ["Daily entries: 31", "Weekly reviews: 5"])
+
+    def test_invalid_line_names_its_location(self):
+        batch = self.write_batch("bad.jsonl", [{"reflection": "no date"}])
+
+        with self.assertRaisesRegex(ValueError, "bad.jsonl:1"):
+            week_review.run_batch(batch)
+
+    def test_nulls_are_empty_and_other_types_are_rejected(self):
+        batch = self.write_batch("nulls.jsonl", [{"date": "2026-07-04", "reflection": None, "summary": None}])
+        [item] = base.load_batch(batch)
+        self.assertEqual((item["reflection"], item["summary"]), ("", []))
+
+        for bad in ({"reflection": 3}, {"summary": ["ok", {"nested": 1}]}, {"overwrite": "yes"}):
+            with self.subTest(bad=bad):
+                batch = self.write_batch("bad.jsonl", [{"date": "2026-07-04"}, {"date": "2026-07-11", **bad}])
+                with self.assertRaisesRegex(ValueError, "bad.jsonl:2: "):
+                    base.load_batch(batch)
+
+
+if __name__ == "__main__":
+    unittest.main()
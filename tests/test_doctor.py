@@ -0,0 +1,136 @@
+"""Tests for the archive health check.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, references, templates
+
+doctor = importlib.import_module("journal.commands.doctor")
+
+TODAY = date(2026, 10, 19)
+
+
+class TestDoctor(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        # A healthy September: dailies, a review for each owned week, a monthly review
+        for saturday in (date(2026, 9, 5), date(2026, 9, 12), date(2026, 9, 19), date(2026, 9, 26)):
+            self.write(config.daily_path(saturday), templates.daily_journal_template(saturday) + "Walked.\n")
+            self.write(config.review_path(saturday), templates.weekly_review_template(saturday, {}, "Fine.", ["one"]))
+        self.write(config.monthly_path(date(2026, 9, 1)), templates.monthly_review_template(
+            date(2026, 9, 1), {"daily_entries": 4, "weekly_reviews": 4}, [], [], ["garden"], "Good."))
+
+    def write(self, path, text):
+        config.ensure_dir(path)
+        path.write_text(text)
+        return path
+
+    def checks(self, **kwargs):
+        report = doctor.diagnose(today=TODAY, **kwargs)
+        return {(i["path"], i["check"]) for i in report["issues"]}
+
+    def test_healthy_archive_has_no_issues(self):
+        report = doctor.diagnose(today=TODAY)
+
+        self.assertEqual(report["issues"], [])
+        self.assertEqual(report["files"], 9)
+
+    def test_finds_each_kind_of_problem(self):
+        self.write(config.daily_path(date(2026, 10, 5)), templates.daily_journal_template(date(2026, 10, 5)))
+        self.write(config.JOURNAL_DIR / "2026/10/daily-2026-10-6.md", "JOURNAL ENTRY:\nhi\n")
+        self.write(config.JOURNAL_DIR / "2026/09/daily-2026-10-07.md", "JOURNAL ENTRY:\nhi\n")
+        self.write(config.JOURNAL_DIR / "2026/09/review-2026-09-24.md", "WEEKLY REFLECTION:\nagain\n")
+        self.write(config.daily_path(date(2026, 8, 3)), "JOURNAL ENTRY:\none\n\nJOURNAL ENTRY:\ntwo\n")
+        self.write(config.review_path(date(2026, 7, 18)), "WEEKLY REFLECTION:\nnothing to review\n")
+
+        self.assertEqual(self.checks(), {
+            ("2026/10/daily-2026-10-05.md", "empty-journal"),
+            ("2026/10/daily-2026-10-6.md", "misnamed"),
+            ("2026/09/daily-2026-10-07.md", "misnamed"),
+            ("2026/09/review-2026-09-24.md", "misnamed"),
+            ("2026/09/review-2026-09-24.md", "duplicate"),
+            ("2026/08/daily-2026-08-03.md", "content-loss"),
+            ("2026/07/review-2026-07-18.md", "orphaned-review"),
+            ("2026/07/review-2026-07-18.md", "missing-monthly"),
+        })
+
+    def test_reference_drift_is_reported(self):
+        d = date(2026, 9, 7)
+        daily = self.write(config.daily_path(d), templates.daily_journal_template(d) + "Rowed.\n")
+        self.write(config.review_path(d), templates.weekly_review_template(
+            date(2026, 9, 12), {"Monday, September 07": references.make_reference(d, "Rowed.")}, "Fine.", ["one"]))
+        self.assertEqual(self.checks(), set())
+
+        # Only the daily changes; the review is still checked again
+        daily.write_text(templates.daily_journal_template(d) + "Rowed twice.\n")
+
+        self.assertEqual(self.checks(), {("2026/09/review-2026-09-12.md", "drift")})
+
+    def test_drift_check_saves_no_expansion_cache(self):
+        d = date(2026, 9, 7)
+        self.write(config.daily_path(d), templates.daily_journal_template(d) + "Rowed.\n")
+        self.write(config.review_path(d), templates.weekly_review_template(
+            date(2026, 9, 12), {"Monday, September 07": references.make_reference(d, "Rowed.")}, "Fine.", ["one"]))
+
+        self.checks()
+
+        self.assertFalse((config.JOURNAL_DIR / ".cache" / references.CACHE_NAME).exists())
+
+    def test_unfinished_month_needs_no_monthly_review(self):
+        self.write(config.daily_path(date(2026, 10, 5)), templates.daily_journal_template(date(2026, 10, 5)) + "Hi.\n")
+        self.write(config.review_path(date(2026, 10, 10)), templates.weekly_review_template(date(2026, 10, 10), {}, "", []))
+
+        self.assertEqual(self.checks(), set())
+
+    def test_dotfiles_and_caches_are_ignored(self):
+        self.write(config.JOURNAL_DIR / ".metrics.jsonl", "{}\n")
+        self.write(config.JOURNAL_DIR / ".cache" / "related.json", "{}")
+        self.write(config.JOURNAL_DIR / "2026/09/.daily-2026-09-05.md.swp", "")
+
+        self.assertEqual(self.checks(), set())
+
+    def test_unchanged_clean_files_are_skipped(self):
+        broken = self.write(config.daily_path(date(2026, 10, 5)), templates.daily_journal_template(date(2026, 10, 5)))
+        doctor.diagnose(today=TODAY)
+
+        with mock.patch.object(doctor, "check_file", wraps=doctor.check_file) as spy:
+            report = doctor.diagnose(today=TODAY)
+
+        # Only the file with an issue is checked again
+        self.assertEqual(report["checked"], 1)
+        self.assertEqual([call.args[0][1] for call in spy.call_args_list], ["2026/10/daily-2026-10-05.md"])
+
+        broken.write_text(templates.daily_journal_template(date(2026, 10, 5)) + "Fixed.\n")
+        doctor.diagnose(today=TODAY)
+        self.assertEqual(doctor.diagnose(today=TODAY)["checked"], 0)
+
+    def test_parallel_run_matches_serial(self):
+        for i in range(1, 32):
+            d = date(2026, 8, 1 + i % 31)
+            self.write(config.daily_path(d), templates.daily_journal_template(d) + ("" if i % 5 else "Hi.\n"))
+
+        serial = doctor.diagnose(jobs=1, today=TODAY)
+        config.JOURNAL_DIR.joinpath(".cache", "doctor.json").unlink()
+        parallel = doctor.diagnose(jobs=2, today=TODAY)
+
+        self.assertEqual(parallel["issues"], serial["issues"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for write-if-changed file output.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import instrument, io
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        io._hashes.clear()
+        self.addCleanup(io._hashes.clear)
+
+    def age(self, path):
+        """Backdate a file so a rewrite would show in its mtime."""
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        return path.stat().st_mtime_ns
+
+    def test_identical_content_is_not_rewritten(self):
+        path = self.dir / "2026" / "08" / "daily-2026-08-03.md"
+        with mock.patch("builtins.print"):
+            self.assertTrue(io.write_file(path, "Went hiking.\n"))
+            mtime = self.age(path)
+            self.assertFalse(io.write_file(path, "Went hiking.\n"))
+
+        self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+    def test_changed_content_is_replaced(self):
+        path = self.dir / "daily.md"
+        path.write_text("Went hiking.\n")
+
+        with mock.patch("builtins.print") as out:
+            self.assertTrue(io.write_file(path, "Went sailing.\n"))
+
+        self.assertEqual(path.read_text(), "Went sailing.\n")
+        out.assert_called_with(f"Updated: {path}")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["daily.md"])
+
+    def test_known_hash_skips_reading_the_file(self):
+        path = self.dir / "daily.md"
+        with mock.patch("builtins.print"):
+            io.write_file(path, "Went hiking.\n")
+
+        with instrument.recording() as stats:
+            io.write_files({path: "Went hiking.\n"})
+
+        self.assertEqual(stats.reads, 0, stats.summary())
+        self.assertEqual(stats.writes, 0, stats.summary())
+
+    def test_rewrite_keeps_the_file_mode(self):
+        path = self.dir / "review-2026-08-08.md"
+        path.write_text("old\n")
+        for mode in (0o644, 0o640):
+            with self.subTest(mode=oct(mode)):
+                path.chmod(mode)
+                with mock.patch("builtins.print"):
+                    io.write_file(path, f"new {mode}\n")
+                self.assertEqual(path.stat().st_mode & 0o777, mode)
+
+    def test_new_file_follows_the_umask(self):
+        old_umask = os.umask(0o027)
+        self.addCleanup(os.umask, old_umask)
+
+        path = self.dir / "daily-2026-08-03.md"
+        with mock.patch("builtins.print"):
+            io.write_file(path, "Went hiking.\n")
+
+        self.assertEqual(path.stat().st_mode & 0o777, 0o640)
+
+    def test_symlinked_entry_updates_its_target(self):
+        target = self.dir / "elsewhere" / "daily-2026-08-03.md"
+        target.parent.mkdir()
+        target.write_text("old\n")
+        link = self.dir / "daily-2026-08-03.md"
+        link.symlink_to(target)
+
+        with mock.patch("builtins.print"):
+            io.write_file(link, "new\n")
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(target.read_text(), "new\n")
+        self.assertEqual(sorted(p.name for p in target.parent.iterdir()), ["daily-2026-08-03.md"])
+
+    def test_batch_counts_written_and_skipped(self):
+        a, b, c = self.dir / "07" / "a.md", self.dir / "07" / "b.md", self.dir / "08" / "c.md"
+        io.write_files({a: "one\n", b: "two\n"})
+
+        counts = io.write_files({a: "one\n", b: "changed\n", c: "three\n"})
+
+        self.assertEqual(counts, {"written": 2, "skipped": 1})
+        self.assertEqual(b.read_text(), "changed\n")
+        self.assertEqual(c.read_text(), "three\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
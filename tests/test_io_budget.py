@@ -0,0 +1,117 @@
+"""I/O budget tests: commands must not re-scan or re-read the archive.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import builtins
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, instrument, references, templates
+
+month_review = importlib.import_module("journal.commands.month_review")
+week_review = importlib.import_module("journal.commands.week_review")
+
+
+class IOBudgetTestCase(unittest.TestCase):
+    """A journal with every daily entry and weekly review for July 2026."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+        references._loaded.clear()
+        self.addCleanup(references._loaded.clear)
+
+        d = date(2026, 6, 28)
+        while d <= date(2026, 8, 1):
+            path = config.daily_path(d)
+            config.ensure_dir(path)
+            path.write_text(templates.daily_journal_template(d) + f"Entry for {d}\n")
+            if d.weekday() == 5:
+                review = config.review_path(d)
+                config.ensure_dir(review)
+                review.write_text(templates.weekly_review_template(d, {}, "Fine.", ["a", "b"]))
+            d += timedelta(days=1)
+
+        # Interactive prompts answer with empty input
+        patcher = mock.patch("builtins.input", return_value="")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_quietly(self, fn, **kwargs):
+        with mock.patch("sys.stdout"), instrument.recording() as stats:
+            fn(**kwargs)
+        return stats
+
+
+class TestMonthReviewBudget(IOBudgetTestCase):
+    def test_full_month(self):
+        # July 2026 owns 5 weeks (Jun 28 - Aug 1) and has 31 daily entries
+        stats = self.run_quietly(month_review.run, target_date=date(2026, 7, 1))
+
+        # One open per weekly review, plus writing the monthly review
+        self.assertLessEqual(stats.opens, 6, stats.summary())
+        self.assertLessEqual(stats.parses, 5, stats.summary())
+        # One existence check per day and per week, plus the monthly review
+        self.assertLessEqual(stats.stats, 31 + 5 + 4, stats.summary())
+
+
+class TestWeekReviewBudget(IOBudgetTestCase):
+    def test_full_week(self):
+        config.review_path(date(2026, 7, 18)).unlink()
+
+        stats = self.run_quietly(week_review.run, target_date=date(2026, 7, 18))
+
+        # One open per daily entry, plus the daily text cache and writing the review
+        self.assertLessEqual(stats.opens, 9, stats.summary())
+        self.assertLessEqual(stats.parses, 7, stats.summary())
+        self.assertLessEqual(stats.stats, 7 + 4, stats.summary())
+
+    def test_warm_week(self):
+        config.review_path(date(2026, 7, 18)).unlink()
+        references.journal_texts(config.get_week_dates(date(2026, 7, 18)))
+        references._loaded.clear()
+
+        stats = self.run_quietly(week_review.run, target_date=date(2026, 7, 18))
+
+        # Daily entries come from the cache: no parses, just a stat each
+        self.assertEqual(stats.parses, 0, stats.summary())
+        self.assertLessEqual(stats.opens, 2, stats.summary())
+        self.assertLessEqual(stats.stats, 7 + 4, stats.summary())
+
+
+class TestRecording(unittest.TestCase):
+    def test_counts_opens_and_bytes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "file.txt"
+            path.write_text("hello")
+            with instrument.recording() as stats:
+                path.exists()
+                path.read_text()
+
+        self.assertEqual(stats.stats, 1)
+        self.assertEqual(stats.opens, 1)
+        self.assertEqual(stats.bytes_read, 5)
+
+    def test_restores_originals(self):
+        real_open, real_stat = builtins.open, os.stat
+        with instrument.recording():
+            pass
+        self.assertIs(builtins.open, real_open)
+        self.assertIs(os.stat, real_stat)
+
+
+if __name__ == "__main__":
+    unittest.main()
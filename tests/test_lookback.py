@@ -0,0 +1,93 @@
+"""Tests for the on-this-day lookback.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, instrument
+from helpers import write_daily
+
+lookback = importlib.import_module("journal.commands.lookback")
+day = importlib.import_module("journal.commands.day")
+
+
+class TestLookback(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+    def test_same_day_and_iso_week_in_earlier_years(self):
+        write_daily(date(2024, 10, 19), "Rain all day.")
+        write_daily(date(2025, 10, 19), "Apple picking.")
+        write_daily(date(2025, 10, 14), "Same ISO week.")
+        write_daily(date(2025, 10, 20), "Next ISO week.")
+        write_daily(date(2026, 10, 18), "This year.")
+
+        same_day, same_week = lookback.lookback(date(2026, 10, 19))
+
+        self.assertEqual(same_day, [date(2025, 10, 19), date(2024, 10, 19)])
+        # 2026-10-19 is in ISO week 43: Oct 20-26 in 2025, Oct 21-27 in 2024
+        self.assertEqual(same_week, [date(2025, 10, 20)])
+
+    def test_lines_show_journal_text(self):
+        write_daily(date(2025, 10, 19), "Apple picking.")
+
+        text = "\n".join(lookback.lookback_lines(date(2026, 10, 19)))
+
+        self.assertIn("Sunday, October 19, 2025", text)
+        self.assertIn("Apple picking.", text)
+
+    def test_new_entries_are_picked_up(self):
+        write_daily(date(2025, 10, 19), "First.")
+        lookback.lookback(date(2026, 10, 19))
+        write_daily(date(2024, 10, 19), "Added later.")
+
+        same_day, _ = lookback.lookback(date(2026, 10, 19))
+
+        self.assertEqual(same_day, [date(2025, 10, 19), date(2024, 10, 19)])
+
+    def test_lookup_reads_only_matching_files(self):
+        for year in range(2016, 2026):
+            for d in range(1, 29):
+                write_daily(date(year, 10, d), "x")
+        lookback.lookback(date(2026, 10, 19))
+
+        with instrument.recording() as stats:
+            lookback.lookback_lines(date(2026, 10, 19))
+
+        # Index hit: the root is listed for its years, and each candidate
+        # month directory is stat'ed but not listed
+        self.assertLessEqual(stats.listdirs, 1, stats.summary())
+        self.assertLessEqual(stats.stats, 12, stats.summary())
+        self.assertEqual(stats.parses, 10 + 10 * 6, stats.summary())
+
+    def test_day_shows_lookback_before_editor(self):
+        write_daily(date(2025, 10, 19), "Apple picking.")
+        events = []
+
+        def editor(*args, **kwargs):
+            events.append("editor")
+
+        with mock.patch("builtins.print", side_effect=lambda *a, **k: events.append(" ".join(map(str, a)))), \
+                mock.patch("journal.ui.open_in_editor", side_effect=editor):
+            day.run(target_date=date(2026, 10, 19), lookback=True)
+
+        shown = next(i for i, e in enumerate(events) if "Apple picking." in e)
+        self.assertLess(shown, events.index("editor"))
+
+
+if __name__ == "__main__":
+    unittest.main()
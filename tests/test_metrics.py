@@ -0,0 +1,99 @@
+"""Tests for command latency metrics.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, metrics, parser, templates, ui
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        self.daily = config.daily_path(date(2026, 8, 3))
+        config.ensure_dir(self.daily)
+        self.daily.write_text(templates.daily_journal_template(date(2026, 8, 3)) + "Entry\n")
+
+    def test_run_records_phases_and_files(self):
+        with metrics.recording("example"):
+            parser.parse_file(self.daily)
+
+        [record] = metrics.read_records()
+        self.assertEqual(record["cmd"], "example")
+        self.assertIn("parse", record["ms"])
+        self.assertIn("read", record["ms"])
+        self.assertEqual(record["files"], 1)
+        self.assertEqual(record["archive"], 1)
+
+    def test_prompt_time_is_excluded(self):
+        def slow_input(_):
+            time.sleep(0.2)
+            return ""
+
+        with mock.patch("builtins.input", side_effect=slow_input), metrics.recording("example"):
+            ui.prompt("?")
+
+        [record] = metrics.read_records()
+        self.assertLess(record["total"], 100)
+
+    def test_pager_time_is_excluded(self):
+        def lines():
+            for i in range(3):
+                time.sleep(0.05)
+                yield f"line {i}"
+
+        with mock.patch("sys.stdout.isatty", return_value=True), \
+                mock.patch.dict("os.environ", {"PAGER": f"{sys.executable} -c 'import sys, time; sys.stdin.read(); time.sleep(0.3)'"}), \
+                metrics.recording("example"):
+            ui.page_output(lines())
+
+        [record] = metrics.read_records()
+        self.assertGreaterEqual(record["total"], 150)
+        self.assertLess(record["total"], 400)
+
+    def test_log_is_size_capped(self):
+        with mock.patch.object(metrics, "MAX_LOG_BYTES", 2000):
+            for _ in range(100):
+                with metrics.recording("example"):
+                    pass
+
+        self.assertLessEqual(metrics.log_path().stat().st_size, 2000)
+        self.assertGreater(len(metrics.read_records()), 5)
+
+    def test_summary_percentiles_and_prometheus_export(self):
+        records = [
+            {"t": 1_790_000_000, "cmd": "day", "ms": {"parse": 1.0}, "total": float(ms), "files": 1, "archive": 100 + ms}
+            for ms in range(1, 101)
+        ]
+        summary = metrics.summarize(records)["day"]
+
+        self.assertEqual((summary["p50"], summary["p90"], summary["p99"]), (50.0, 90.0, 99.0))
+        self.assertAlmostEqual(summary["trend"], 1000.0)
+
+        text = metrics.prometheus_text({"day": summary}, 200)
+        self.assertIn('journal_command_duration_seconds{command="day",quantile="0.9"} 0.090000', text)
+        self.assertIn('journal_command_duration_seconds_count{command="day"} 100', text)
+        self.assertIn("journal_archive_files 200", text)
+
+    def test_no_recording_outside_a_run(self):
+        parser.parse_file(self.daily)
+        self.assertFalse(metrics.log_path().exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
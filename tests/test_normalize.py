@@ -0,0 +1,205 @@
+"""Tests for the canonical file format and the normalize command.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, parser, templates
+
+normalize = importlib.import_module("journal.commands.normalize")
+
+
+LEGACY_DAILY = """---
+mood: fine
+---
+# Daily Entry - Monday, August 03, 2026
+====================
+[weekly_file: review-2026-08-08.md]
+
+JOURNAL ENTRY:
+Went hiking.
+Saw a heron.
+
+Summary: long walk
+"""
+
+LEGACY_REVIEW = """# Weekly Review
+--------------------
+DAILY ENTRIES:
+**Monday, August 03**
+Went hiking.
+
+WEEKLY REFLECTION:
+Quiet week.
+
+WEEKLY SUMMARY:
+- one
+- two
+"""
+
+
+def lenient_sections(path):
+    """Sections as the lenient splitter reads them, ignoring any marker."""
+    lines = path.read_text().splitlines(keepends=True)
+    _, body = normalize.split_front_matter(lines)
+    if body and body[0].strip() == parser.CANONICAL_MARKER:
+        body = body[1:]
+    return {name: content for name, content in parser.iter_lenient_sections(body) if name}
+
+
+class TestCanonicalFormat(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def write(self, name, text):
+        path = self.dir / name
+        path.write_text(text)
+        return path
+
+    def test_templates_parse_identically_on_both_paths(self):
+        files = [
+            self.write("review.md", templates.weekly_review_template(
+                date(2026, 8, 8), {"Monday, August 03": "Went hiking."}, "Fine.", ["one", "two"])),
+            self.write("monthly.md", templates.monthly_review_template(
+                date(2026, 7, 1), {"daily_entries": 31, "weekly_reviews": 5},
+                [(date(2026, 7, 4), "Busy.")], [(date(2026, 7, 4), ["a"])], ["garden"], "A good month.")),
+        ]
+        for path in files:
+            parsed = parser.parse_file(path)
+            self.assertTrue(parsed.canonical, path.name)
+            self.assertEqual(parsed.sections, lenient_sections(path), path.name)
+
+    def test_legacy_files_keep_their_sections(self):
+        for name, text in (("daily.md", LEGACY_DAILY), ("review.md", LEGACY_REVIEW)):
+            path = self.write(name, text)
+            before = parser.parse_file(path)
+            self.assertFalse(before.canonical)
+
+            normalize.normalize_file((str(path), True))
+            after = parser.parse_file(path)
+
+            self.assertTrue(after.canonical, name)
+            self.assertEqual(after.sections, before.sections, name)
+            self.assertEqual(after.front_matter, before.front_matter, name)
+
+    def test_hand_typed_daily_headers_are_recognized(self):
+        path = self.write("daily.md", templates.daily_journal_template(date(2026, 8, 3))
+                          + "Went hiking.\n\nSummary: great day\n")
+
+        parsed = parser.parse_file(path)
+
+        self.assertFalse(parsed.canonical)
+        self.assertEqual(parsed.get_section_text("journal"), "Went hiking.")
+        self.assertEqual(parsed.get_section_text("summary"), "great day")
+
+    def test_separators_and_metadata_lines_are_kept(self):
+        path = self.write("daily.md", LEGACY_DAILY)
+
+        text = normalize.canonical_text(path.read_text().splitlines(keepends=True))
+
+        self.assertIn("====================\n[weekly_file: review-2026-08-08.md]\n", text)
+        self.assertIn("## Journal entry:\nWent hiking.\nSaw a heron.\n\n## Summary:\nlong walk\n", text)
+        self.assertEqual(text.count("\n"), LEGACY_DAILY.count("\n") + 2)  # marker, inline value
+
+    def test_metadata_inside_a_section_is_refused(self):
+        path = self.write("review.md", "WEEKLY REFLECTION:\nQuiet.\n[weekly_file: review.md]\n")
+
+        _, status, _ = normalize.normalize_file((str(path), True))
+
+        self.assertEqual(status, "skipped: metadata line inside the weekly_reflection section: "
+                                 "[weekly_file: review.md]")
+
+    def test_canonical_files_are_left_alone(self):
+        path = self.write("review.md", templates.weekly_review_template(
+            date(2026, 8, 8), {"Monday, August 03": "Went hiking."}, "Fine.", ["one"]))
+        original = path.read_text()
+
+        _, status, diff = normalize.normalize_file((str(path), True))
+
+        self.assertEqual(status, "canonical")
+        self.assertEqual(diff, "")
+        self.assertEqual(path.read_text(), original)
+
+    def test_repeated_sections_are_refused(self):
+        path = self.write("daily.md", "JOURNAL ENTRY:\nfirst\n\nJOURNAL ENTRY:\nsecond\n")
+
+        _, status, _ = normalize.normalize_file((str(path), True))
+
+        self.assertEqual(status, "skipped: repeated section(s): journal")
+        self.assertEqual(path.read_text(), "JOURNAL ENTRY:\nfirst\n\nJOURNAL ENTRY:\nsecond\n")
+
+    def test_canonical_headers_ignore_legacy_heuristics(self):
+        path = self.write("daily.md", f"{parser.CANONICAL_MARKER}\n## Journal entry:\nSUMMARY:\nnot a header\n")
+
+        parsed = parser.parse_file(path)
+
+        self.assertEqual(parsed.sections, {"journal": ["SUMMARY:", "not a header"]})
+
+
+class TestNormalizeCommand(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        self.daily = config.daily_path(date(2026, 8, 3))
+        config.ensure_dir(self.daily)
+        self.daily.write_text(LEGACY_DAILY)
+
+    def test_dry_run_prints_diff_without_writing(self):
+        with mock.patch("builtins.print") as out:
+            normalize.run()
+
+        printed = "".join(str(call.args[0]) for call in out.call_args_list if call.args)
+        self.assertIn(f"+{parser.CANONICAL_MARKER}", printed)
+        self.assertEqual(self.daily.read_text(), LEGACY_DAILY)
+
+    def test_apply_rewrites_in_place(self):
+        with mock.patch("builtins.print"):
+            normalize.run(apply=True)
+            results = normalize.normalize_archive()
+
+        self.assertTrue(parser.parse_file(self.daily).canonical)
+        self.assertEqual([status for _, status, _ in results], ["canonical"])
+
+    def test_parallel_run_matches_serial(self):
+        def archive(root):
+            config.JOURNAL_DIR = root
+            for i in range(40):
+                d = date(2026, 6, 1) + timedelta(days=i)
+                text = LEGACY_DAILY if i % 4 else "JOURNAL ENTRY:\nfirst\n\nJOURNAL ENTRY:\nsecond\n"
+                config.ensure_dir(config.daily_path(d))
+                config.daily_path(d).write_text(text.replace("Went hiking.", f"Day {i}."))
+            return root
+
+        serial_dir = archive(Path(self._tmp.name) / "serial")
+        serial = normalize.normalize_archive(apply=True, jobs=1)
+        parallel_dir = archive(Path(self._tmp.name) / "parallel")
+        parallel = normalize.normalize_archive(apply=True, jobs=2)
+
+        def relative(results, root):
+            return [(Path(path).relative_to(root), status, diff.replace(str(root), "")) for path, status, diff in results]
+
+        self.assertEqual(relative(parallel, parallel_dir), relative(serial, serial_dir))
+        self.assertEqual(
+            {p.relative_to(parallel_dir): p.read_text() for p in parallel_dir.rglob("*.md")},
+            {p.relative_to(serial_dir): p.read_text() for p in serial_dir.rglob("*.md")},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""Parser scaling tests: parse time and memory must grow linearly with file size.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import parser
+
+
+def _repeat(block: str, size: int) -> str:
+    return block * max(1, size // len(block))
+
+
+# Adversarial file shapes; each returns text of roughly `size` bytes
+CORPUS = {
+    # One enormous line full of colons (split(":") once built a list per colon)
+    "colon line": lambda size: ":" * size + "\n",
+    # One enormous line of prose
+    "long line": lambda size: _repeat("word ", size) + "\n",
+    # A header with a huge inline value
+    "long inline value": lambda size: "Summary: " + _repeat("x", size) + "\n",
+    # Thousands of alternating real headers
+    "header storm": lambda size: _repeat("JOURNAL ENTRY:\nx\nSUMMARY:\ny\n", size),
+    # Pasted logs: ALL-CAPS lines ending in colons look like headers
+    "pasted log": lambda size: _repeat("ERROR: DISK FULL ON /DEV/SDA1:\n", size),
+    # Bracketed metadata-like lines
+    "brackets": lambda size: _repeat("[note: " + "a" * 50 + "]\n", size),
+    # A long list
+    "list": lambda size: _repeat("- item: with a colon\n", size),
+    # Separators and markdown headers of every depth
+    "markup": lambda size: _repeat("=====\n###### Weekly reflection\n----------\n", size),
+    # Front matter that never closes
+    "open front matter": lambda size: "---\n" + _repeat("key: value\n", size),
+}
+
+# Line shapes mixed at random by fuzz()
+LINES = [
+    "", "x", "---", "===", "___", "- ", "- Daily entries: 31", "#", "##", "## Journal entry:",
+    "JOURNAL ENTRY:", "Journal", "journal entry", "[Summary]", "[weekly_file: a.md]",
+    "[completed: yes]", "[daily_ref: 2026-08-03 0123456789abcdef]", ":", "::::", "A:B:C:D",
+    "WEEKLY SUMMARY: done", "   Weekly reflection:   ", "#### consistency ####", "-= summary =-",
+    "Monthly summary: " + "y" * 300, "z" * 300 + ": Summary", "\t\tSUMMARY\t",
+]
+
+
+def fuzz(size: int, seed: int = 0) -> str:
+    """Random mix of header-like, separator-like and plain lines."""
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size:
+        line = rng.choice(LINES)
+        if rng.random() < 0.05:
+            line *= rng.randint(2, 50)
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+# Growth factor between the small and large input; quadratic work would
+# show up as a ratio near GROWTH ** 2
+GROWTH = 8
+SMALL = 16 * 1024
+
+# Allowed ratio of large-to-small cost, with room for timer noise
+MAX_TIME_RATIO = GROWTH * 3
+MAX_MEMORY_RATIO = GROWTH * 2
+
+
+def parse_cost(path: Path, runs: int = 3) -> tuple[float, int]:
+    """Best-of-runs parse time in seconds, and peak traced memory in bytes."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        parser.parse_file(path)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        parser.parse_file(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+class TestLinearScaling(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def assert_linear(self, name, generate):
+        costs = []
+        for size in (SMALL, SMALL * GROWTH):
+            path = Path(self._tmp.name) / f"{size}.md"
+            path.write_text(generate(size))
+            costs.append(parse_cost(path))
+        (t_small, m_small), (t_large, m_large) = costs
+
+        # Floor the small time so sub-millisecond noise can't inflate the ratio
+        self.assertLess(t_large / max(t_small, 1e-3), MAX_TIME_RATIO,
+                        f"{name}: {t_small * 1000:.1f} ms -> {t_large * 1000:.1f} ms")
+        self.assertLess(m_large / max(m_small, 64 * 1024), MAX_MEMORY_RATIO,
+                        f"{name}: {m_small} -> {m_large} bytes")
+
+    def test_corpus(self):
+        for name, generate in CORPUS.items():
+            with self.subTest(name):
+                self.assert_linear(name, generate)
+
+    def test_fuzz(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assert_linear(f"fuzz {seed}", lambda size: fuzz(size, seed))
+
+
+def is_section_header(line: str) -> bool:
+    """
+    The header heuristic parse_file used before header_name, kept as the
+    reference header_name must agree with.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return False
+
+    # List items are content, even when they read like a header
+    # ("- Daily entries: 31" in a monthly review's consistency section)
+    if stripped.startswith("- "):
+        return False
+
+    # Check for common header patterns
+    if stripped.startswith("#"):
+        return True
+    if stripped.startswith("[") and stripped.endswith("]"):
+        return True
+    # All caps line ending with colon
+    if stripped.rstrip(":").isupper() and ":" in stripped:
+        return True
+
+    # Check if it matches a known alias (check prefix before colon)
+    if ":" in stripped:
+        prefix = stripped.partition(":")[0].strip()
+        if parser.normalize_header(prefix + ":"):
+            return True
+
+    # Standalone line matching alias
+    if parser.normalize_header(stripped):
+        return True
+
+    return False
+
+
+class TestHeaderName(unittest.TestCase):
+    def test_matches_header_heuristics(self):
+        lines = LINES + [line * 3 for line in LINES] + fuzz(20_000, seed=7).splitlines()
+        for line in lines:
+            stripped = line.strip()
+            if len(stripped) > parser.MAX_HEADER_SCAN and ":" not in stripped[:parser.MAX_HEADER_SCAN]:
+                continue
+            expected = parser.normalize_header(line) if is_section_header(line) else None
+            self.assertEqual(parser.header_name(stripped), expected, repr(line))
+
+    def test_long_inline_value_is_kept(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "daily.md"
+            path.write_text("Summary: " + "x" * 100_000 + "\n")
+            parsed = parser.parse_file(path)
+
+        self.assertEqual(parsed.get_section_text("summary"), "x" * 100_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
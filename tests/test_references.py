@@ -0,0 +1,115 @@
+"""Tests for reference-mode weekly reviews.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import cache, config, parser, references, templates
+from helpers import write_daily, write_review
+
+
+class TestReferenceMode(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+        references._loaded.clear()
+        self.addCleanup(references._loaded.clear)
+
+    def test_review_stores_reference_not_text(self):
+        write_daily(date(2026, 8, 3), "Went hiking.")
+        review = write_review(date(2026, 8, 8), [(date(2026, 8, 3), "Went hiking.")], as_references=True)
+
+        self.assertNotIn("Went hiking.", review.read_text())
+        self.assertIn("[daily_ref: 2026-08-03 ", review.read_text())
+
+    def test_parsing_expands_references(self):
+        write_daily(date(2026, 8, 3), "Went hiking.")
+        review = write_review(date(2026, 8, 8), [(date(2026, 8, 3), "Went hiking.")], as_references=True)
+
+        parsed = parser.parse_file(review)
+        self.assertIn("Went hiking.", parsed.get_section_text("daily_entries"))
+        self.assertEqual(parsed.get_list_items("weekly_summary"), ["one"])
+        self.assertEqual(parsed.drift, [])
+
+    def test_changed_daily_is_flagged_as_drift(self):
+        daily = write_daily(date(2026, 8, 3), "Went hiking.")
+        review = write_review(date(2026, 8, 8), [(date(2026, 8, 3), "Went hiking.")], as_references=True)
+        daily.write_text(templates.daily_journal_template(date(2026, 8, 3)) + "Stayed home.\n")
+
+        parsed = parser.parse_file(review)
+        text = parsed.get_section_text("daily_entries")
+        self.assertIn("Stayed home.", text)
+        self.assertIn("changed since this review was written", text)
+        self.assertEqual(parsed.drift, [date(2026, 8, 3)])
+
+    def test_missing_daily_is_flagged_as_drift(self):
+        review = write_review(date(2026, 8, 8), [(date(2026, 8, 3), "Went hiking.")], as_references=True)
+
+        parsed = parser.parse_file(review)
+        self.assertIn("missing daily entry", parsed.get_section_text("daily_entries"))
+        self.assertEqual(parsed.drift, [date(2026, 8, 3)])
+
+    def test_repeat_expansion_served_from_persistent_cache(self):
+        write_daily(date(2026, 8, 3), "Went hiking.")
+        review = write_review(date(2026, 8, 8), [(date(2026, 8, 3), "Went hiking.")], as_references=True)
+        parser.parse_file(review).get_section("daily_entries")
+
+        # A fresh process only has the on-disk cache
+        references._loaded.clear()
+        real_parse = parser.parse_file
+        with mock.patch.object(parser, "parse_file", side_effect=real_parse) as spy:
+            text = parser.parse_file(review).get_section_text("daily_entries")
+
+        self.assertIn("Went hiking.", text)
+        self.assertEqual(spy.call_count, 1)  # the review itself, not the daily
+
+    def test_expansion_cache_is_kept_per_week_and_capped(self):
+        weeks = config.JOURNAL_DIR / ".cache" / references.CACHE_NAME
+        past = time.time_ns() - 100 * 10**9
+        with mock.patch.object(references, "MAX_CACHED_WEEKS", 2):
+            for i, day in enumerate((3, 10, 17)):
+                write_daily(date(2026, 8, day), f"Day {day}.")
+                references.journal_text(date(2026, 8, day))
+                sunday = config.get_sunday(date(2026, 8, day))
+                os.utime(weeks / f"{sunday}.json", ns=(past + i * 10**9,) * 2)
+            write_daily(date(2026, 8, 4), "Day 4.")
+            references.journal_text(date(2026, 8, 4))
+
+        cached = sorted(p.name for p in weeks.iterdir())
+        self.assertEqual(cached, ["2026-08-02.json", "2026-08-16.json"])
+        self.assertEqual(set(cache.load(f"{references.CACHE_NAME}/2026-08-02")), {"2026-08-04"})
+
+        # An evicted week is read again from its daily files
+        references._loaded.clear()
+        self.assertEqual(references.journal_text(date(2026, 8, 10)), "Day 10.")
+
+
+class TestDailyEntriesHeader(unittest.TestCase):
+    def test_consistency_bullet_is_not_a_header(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "monthly-2026-07.md"
+            path.write_text(templates.monthly_review_template(
+                date(2026, 7, 1), {"daily_entries": 31, "weekly_reviews": 5}, [], [], [], ""
+            ))
+            parsed = parser.parse_file(path)
+
+        self.assertNotIn("daily_entries", parsed.sections)
+        self.assertEqual(parsed.get_list_items("consistency")[:2], ["Daily entries: 31", "Weekly reviews: 5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
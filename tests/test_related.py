@@ -0,0 +1,107 @@
+"""Tests for the related entries finder.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config
+from helpers import write_daily
+
+related = importlib.import_module("journal.commands.related")
+
+
+class TestRelated(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        write_daily(date(2026, 7, 6), "Planted tomatoes in the garden, watered the seedlings.")
+        write_daily(date(2026, 7, 14), "Long meeting about the quarterly deadline at work.")
+        write_daily(date(2026, 7, 21), "Spreadsheet errors, payroll software crashed.")
+        write_daily(date(2026, 8, 4), "The garden tomatoes are ripening, more seedlings.")
+        write_daily(date(2026, 8, 20), "Harvested tomatoes from the garden.")
+
+    def test_most_similar_earlier_week_ranks_first(self):
+        results = related.find_related(date(2026, 8, 4), k=3)
+
+        self.assertEqual(results[0][1], date(2026, 7, 11))
+        self.assertEqual(results[0][2], ["2026/07/daily-2026-07-06.md"])
+
+    def test_only_earlier_weeks_are_returned(self):
+        results = related.find_related(date(2026, 8, 4), k=10)
+
+        self.assertTrue(all(saturday < date(2026, 8, 8) for _, saturday, _ in results))
+        self.assertNotIn("2026/08/daily-2026-08-20.md", [rel for _, _, rels in results for rel in rels])
+
+    def test_unrelated_entries_are_not_candidates(self):
+        results = related.find_related(date(2026, 8, 4), k=10)
+
+        self.assertNotIn("2026/07/daily-2026-07-21.md", [rel for _, _, rels in results for rel in rels])
+
+    def test_entries_of_one_week_are_listed_together(self):
+        write_daily(date(2026, 7, 8), "Staked the garden tomatoes.")
+
+        results = related.find_related(date(2026, 8, 4), k=10)
+
+        weeks = [saturday for _, saturday, _ in results]
+        self.assertEqual(len(weeks), len(set(weeks)))
+        self.assertEqual(sorted(results[0][2]), ["2026/07/daily-2026-07-06.md", "2026/07/daily-2026-07-08.md"])
+
+    def test_cache_only_rereads_changed_files(self):
+        related.find_related(date(2026, 8, 4))
+        write_daily(date(2026, 7, 14), "Garden tomatoes all afternoon.")
+
+        real_parse = related.parser.parse_file
+        with mock.patch.object(related.parser, "parse_file", side_effect=real_parse) as spy:
+            results = related.find_related(date(2026, 8, 4), k=3)
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertIn("2026/07/daily-2026-07-14.md", [rel for _, _, rels in results for rel in rels])
+
+    def test_query_only_decodes_its_own_postings(self):
+        related.find_related(date(2026, 8, 4))
+
+        index = related.TermIndex.load()
+        index.refresh()
+        index.top_k(related.week_query(index, date(2026, 8, 4)), date(2026, 8, 2), 5)
+
+        decoded = [t for t, p in index._postings.items() if isinstance(p, set)]
+        self.assertLessEqual(len(decoded), related.MAX_QUERY_TERMS)
+        self.assertLess(len(decoded), len(index._postings))
+
+    def test_terms_of_edited_and_deleted_entries_are_pruned(self):
+        related.find_related(date(2026, 8, 4))
+        self.assertIn("payroll", related.TermIndex.load().term_ids)
+        write_daily(date(2026, 7, 14), "Garden tomatoes all afternoon.")
+        config.daily_path(date(2026, 7, 21)).unlink()
+
+        related.find_related(date(2026, 8, 4))
+        index = related.TermIndex.load()
+
+        for term in ("quarterly", "payroll", "spreadsheet"):
+            self.assertNotIn(term, index.term_ids)
+        self.assertEqual(sorted(t for t in index.vocab if t), sorted(index.term_ids))
+        for t, p in index._postings.items():
+            self.assertEqual(len(index.posting(t)), index.df[t])
+
+        # Freed ids are reused rather than growing the vocabulary
+        size = len(index.vocab)
+        write_daily(date(2026, 7, 22), "Quarterly payroll spreadsheet.")
+        related.find_related(date(2026, 8, 4))
+        self.assertEqual(len(related.TermIndex.load().vocab), size)
+
+if __name__ == "__main__":
+    unittest.main()
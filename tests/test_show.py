@@ -0,0 +1,128 @@
+"""Tests for the read-only week and month views.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, instrument, parser, references, templates
+from helpers import write_daily, write_review
+
+show = importlib.import_module("journal.commands.show")
+
+
+class TestShow(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+    def test_week_matches_review_template(self):
+        write_daily(date(2026, 10, 12), "Monday things.")
+        write_review(date(2026, 10, 17), reflection="Good week.", summary=["Shipped"])
+
+        text = show.view("week", date(2026, 10, 14))
+
+        self.assertEqual(text, templates.weekly_review_template(
+            d=date(2026, 10, 17),
+            daily_entries={"Monday, October 12": "Monday things."},
+            weekly_reflection="Good week.",
+            weekly_summary=["Shipped"],
+        ).replace(parser.CANONICAL_MARKER + "\n", ""))
+
+    def test_views_show_text_without_marker(self):
+        write_daily(date(2026, 10, 12), "Monday things.")
+
+        with mock.patch.object(config, "WEEKLY_REFERENCES", True):
+            week = show.view("week", date(2026, 10, 12))
+        month = show.view("month", date(2026, 10, 12))
+
+        self.assertIn("Monday things.", week)
+        self.assertNotIn(references.REFERENCE_PREFIX, week)
+        for text in (week, month):
+            self.assertNotIn(parser.CANONICAL_MARKER, text)
+
+    def test_each_view_is_cached_on_its_own_and_capped(self):
+        views = config.JOURNAL_DIR / ".cache" / "show"
+        past = time.time_ns() - 100 * 10**9
+        with mock.patch.object(show, "MAX_CACHED_VIEWS", 3):
+            for i, day in enumerate(range(1, 29, 7)):
+                show.view("week", date(2026, 9, day))
+                # Distinct render times, older than anything written next
+                saturday = show.view_date("week", date(2026, 9, day))
+                os.utime(views / f"week-{saturday}.json", ns=(past + i * 10**9,) * 2)
+            show.view("month", date(2026, 9, 1))
+
+        cached = sorted(p.name for p in views.iterdir())
+        self.assertEqual(cached, ["month-2026-09-01.json", "week-2026-09-19.json", "week-2026-09-26.json"])
+
+    def test_month_aggregates_weekly_reviews(self):
+        write_daily(date(2026, 9, 2), "x")
+        write_review(date(2026, 9, 12), reflection="Calm.", summary=["Rested"])
+
+        text = show.view("month", date(2026, 9, 20))
+
+        self.assertIn("Month: September 2026", text)
+        self.assertIn("- Daily entries: 1", text)
+        self.assertIn("### Week ending September 12\nCalm.", text)
+        self.assertIn("- Rested", text)
+
+    def test_repeat_view_reads_nothing(self):
+        for day in range(1, 31):
+            write_daily(date(2026, 9, day), f"Day {day}.")
+        first = show.view("month", date(2026, 9, 1))
+
+        with instrument.recording() as stats:
+            again = show.view("month", date(2026, 9, 1))
+
+        self.assertEqual(again, first)
+        self.assertEqual(stats.parses, 0, stats.summary())
+        self.assertEqual(stats.opens, 1, stats.summary())  # the cache itself
+
+    def test_rewrite_with_same_content_is_a_hit(self):
+        path = write_daily(date(2026, 10, 12), "Same.")
+        show.view("week", date(2026, 10, 12))
+        os.utime(path, ns=(0, 0))
+
+        with instrument.recording() as stats:
+            show.view("week", date(2026, 10, 12))
+
+        self.assertEqual(stats.parses, 0, stats.summary())
+
+    def test_changed_and_new_inputs_rerender(self):
+        path = write_daily(date(2026, 10, 12), "Before.")
+        self.assertIn("Before.", show.view("week", date(2026, 10, 12)))
+
+        path.write_text(templates.daily_journal_template(date(2026, 10, 12)) + "After, longer.\n")
+        write_daily(date(2026, 10, 13), "New day.")
+        text = show.view("week", date(2026, 10, 12))
+
+        self.assertIn("After, longer.", text)
+        self.assertIn("New day.", text)
+
+    def test_writes_nothing_to_the_archive(self):
+        write_daily(date(2026, 10, 12), "x")
+        before = sorted(p for p in config.JOURNAL_DIR.rglob("*") if ".cache" not in p.parts)
+
+        show.view("week", date(2026, 10, 12))
+        show.view("month", date(2026, 10, 12))
+
+        after = sorted(p for p in config.JOURNAL_DIR.rglob("*") if ".cache" not in p.parts)
+        self.assertEqual(after, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
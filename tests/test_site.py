@@ -0,0 +1,100 @@
+"""Tests for the incremental static site build.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config
+from helpers import write_daily, write_review
+
+site = importlib.import_module("journal.commands.site")
+
+
+class TestSiteBuild(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name) / "journal"
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+        self.out = Path(self._tmp.name) / "site"
+
+        for day in (2, 3, 4):
+            write_daily(date(2026, 8, day), f"Entry {day}")
+        write_review(date(2026, 8, 8), reflection="Good week.", summary=["a"])
+
+    def build(self):
+        return site.build_site(self.out, jobs=1)
+
+    def test_full_build_renders_linked_pages(self):
+        counts = self.build()
+
+        # 3 dailies, 1 review, 1 month calendar, 1 root index
+        self.assertEqual(counts["written"], 6)
+        page = (self.out / "2026/08/daily-2026-08-03.html").read_text()
+        self.assertIn("Entry 3", page)
+        self.assertIn('href="daily-2026-08-02.html"', page)
+        self.assertIn('href="daily-2026-08-04.html"', page)
+        self.assertIn('href="2026/08/index.html"', (self.out / "index.html").read_text())
+        self.assertIn("review-2026-08-08.html", (self.out / "2026/08/index.html").read_text())
+
+    def test_unchanged_rebuild_writes_nothing(self):
+        self.build()
+        self.assertEqual(self.build(), {"written": 0, "unchanged": 6, "removed": 0})
+
+    def test_edit_rewrites_page_but_not_identical_weekly_review(self):
+        self.build()
+        review = self.out / "2026/08/review-2026-08-08.html"
+        before = review.stat().st_mtime_ns
+        write_daily(date(2026, 8, 3), "Edited")
+
+        # The review is re-rendered, but it doesn't show the edited text, so
+        # its page comes out the same and is left untouched
+        self.assertEqual(self.build()["written"], 1)
+        self.assertIn("Edited", (self.out / "2026/08/daily-2026-08-03.html").read_text())
+        self.assertEqual(review.stat().st_mtime_ns, before)
+
+    def test_new_entry_rewrites_neighbour_and_month_index(self):
+        self.build()
+        write_daily(date(2026, 8, 5), "Entry 5")
+
+        # The new page, the previous day's "next" link and the month calendar
+        self.assertEqual(self.build()["written"], 3)
+
+    def test_deleted_entry_removes_its_page(self):
+        self.build()
+        config.daily_path(date(2026, 8, 4)).unlink()
+
+        self.assertEqual(self.build()["removed"], 1)
+        self.assertFalse((self.out / "2026/08/daily-2026-08-04.html").exists())
+
+    def test_parallel_build_matches_serial(self):
+        for i in range(40):
+            d = date(2026, 6, 1) + timedelta(days=i)
+            write_daily(d, f"Entry {i}")
+        write_review(date(2026, 6, 6), [(date(2026, 6, 1), "Entry 0")], summary=["a"], as_references=True)
+
+        # Parallel first, so the workers expand the review's reference themselves
+        parallel = site.build_site(Path(self._tmp.name) / "parallel", jobs=2)
+        serial = site.build_site(Path(self._tmp.name) / "serial", jobs=1)
+
+        def pages(root):
+            return {p.relative_to(root): p.read_text() for p in root.rglob("*.html")}
+
+        self.assertEqual(parallel, serial)
+        self.assertGreaterEqual(serial["written"], site.PARALLEL_THRESHOLD)
+        self.assertEqual(pages(Path(self._tmp.name) / "parallel"), pages(Path(self._tmp.name) / "serial"))
+        self.assertIn("Entry 0", pages(Path(self._tmp.name) / "parallel")[Path("2026/06/review-2026-06-06.html")])
+
+
+if __name__ == "__main__":
+    unittest.main()
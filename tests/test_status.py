@@ -0,0 +1,132 @@
+"""Tests for the prompt status check.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from journal import config, instrument, status
+
+
+class TestStatus(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+    def touch(self, path):
+        config.ensure_dir(path)
+        path.write_text("x")
+
+    def test_targets_match_config_paths(self):
+        # Sundays, Saturdays, month and year boundaries
+        for today in (date(2026, 10, 19), date(2026, 8, 1), date(2026, 8, 2), date(2027, 1, 1), date(2026, 12, 31)):
+            daily, review, monthly, _ = status.targets(str(today))
+            self.assertEqual(config.JOURNAL_DIR / daily, config.daily_path(today))
+            self.assertEqual(config.JOURNAL_DIR / review, config.review_path(today))
+            self.assertEqual(config.JOURNAL_DIR / monthly, config.monthly_path(config.detect_review_month(today)))
+
+    def test_default_dir_matches_config(self):
+        self.assertEqual(Path(status.DEFAULT_JOURNAL_DIR), Path.home() / ".entries_encrypted/")
+
+    def test_reports_each_file(self):
+        today = date(2026, 10, 19)
+        self.assertEqual(status.status_line(today), "day:todo week:todo sep:todo")
+
+        self.touch(config.daily_path(today))
+        self.touch(config.monthly_path(date(2026, 9, 1)))
+
+        self.assertEqual(status.status(today), {"day": True, "week": False, "month": True})
+        self.assertEqual(status.status_line(today), "day:done week:todo sep:done")
+
+    def test_three_stats_and_no_reads(self):
+        today = date(2026, 10, 19)
+        status.status(today)
+
+        with instrument.recording() as stats:
+            status.status(today)
+
+        self.assertLessEqual(stats.stats, 3, stats.summary())
+        self.assertEqual(stats.opens + stats.listdirs + stats.parses, 0, stats.summary())
+
+    def test_calendar_is_memoized_on_disk(self):
+        status.targets("2026-10-19")
+        status._targets.clear()
+
+        with mock.patch.object(status, "_compute") as compute:
+            self.assertEqual(status.targets("2026-10-19")[3], "sep")
+        compute.assert_not_called()
+
+    def test_memo_is_not_written_without_a_journal_directory(self):
+        missing = Path(self._tmp.name) / "unmounted"
+        status._targets.clear()
+
+        status.targets("2026-10-19", str(missing))
+
+        self.assertFalse(missing.exists())
+
+    def run_python(self, *args):
+        # Bytecode is cached as in normal use, and the journal directory
+        # exists so the calendar memo is used
+        env = dict(os.environ, HOME=self._tmp.name)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        os.makedirs(os.path.join(self._tmp.name, ".entries_encrypted"), exist_ok=True)
+        return subprocess.run([sys.executable, "-S", *args], cwd=ROOT, env=env,
+                              capture_output=True, text=True, check=True)
+
+    def test_does_not_load_the_rest_of_the_package(self):
+        code = "import sys; from journal import status; status.status(); print(' '.join(sorted(sys.modules)))"
+        self.run_python("-c", code)
+        loaded = set(self.run_python("-c", code).stdout.split())
+
+        self.assertIn("journal.status", loaded)
+        for module in ("journal.config", "journal.parser", "journal.templates", "journal.ui", "pathlib", "datetime"):
+            self.assertNotIn(module, loaded)
+
+    def test_package_exports_every_submodule_lazily(self):
+        import journal
+
+        submodules = {p.stem for p in (ROOT / "journal").glob("*.py")} - {"__init__"}
+        self.assertEqual(set(journal.__all__), submodules | {"commands"})
+        code = "import journal; print(journal.metrics.__name__, journal.instrument.__name__)"
+        self.assertEqual(self.run_python("-c", code).stdout.split(), ["journal.metrics", "journal.instrument"])
+
+    def test_latency_budget(self):
+        self.assertEqual(self.run_python("journal.py", "status").stdout.count(":"), 3)
+
+        def added_ms():
+            # Best of interleaved runs, so the comparison isn't skewed by load
+            # from the rest of the suite
+            bare, command = [], []
+            for _ in range(15):
+                for times, args in ((bare, ("-c", "pass")), (command, ("journal.py", "status"))):
+                    start = time.perf_counter()
+                    self.run_python(*args)
+                    times.append(time.perf_counter() - start)
+            return (min(command) - min(bare)) * 1000
+
+        # Load can only add time, so one round within budget is enough
+        rounds = []
+        for _ in range(3):
+            rounds.append(added_ms())
+            if rounds[-1] < status.LATENCY_BUDGET_MS:
+                break
+        self.assertLess(min(rounds), status.LATENCY_BUDGET_MS, f"rounds: {rounds}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for the summary timeline.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, parser, templates
+
+timeline = importlib.import_module("journal.commands.timeline")
+
+
+class TestTimeline(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        # Three years of weekly reviews, one bullet each
+        saturday = date(2024, 1, 6)
+        while saturday < date(2027, 1, 1):
+            path = config.review_path(saturday)
+            config.ensure_dir(path)
+            path.write_text(templates.weekly_review_template(saturday, {}, "ok", [f"week {saturday}"]))
+            saturday += timedelta(days=7)
+        path = config.monthly_path(date(2026, 12, 1))
+        path.write_text(templates.monthly_review_template(
+            date(2026, 12, 1), {"daily_entries": 0, "weekly_reviews": 0}, [], [], ["december"], ""
+        ))
+
+    def test_newest_first(self):
+        lines = list(islice(timeline.timeline_lines(), 8))
+
+        self.assertEqual(lines[:3], ["December 2026 (month)", "  - december", ""])
+        self.assertEqual(lines[3:5], ["Week ending December 26, 2026", "  - week 2026-12-26"])
+        self.assertEqual(lines[6:8], ["Week ending December 19, 2026", "  - week 2026-12-19"])
+
+    def test_first_lines_read_only_a_few_files(self):
+        real_parse = parser.parse_file
+        with mock.patch.object(parser, "parse_file", side_effect=real_parse) as spy:
+            list(islice(timeline.timeline_lines(), 9))
+
+        self.assertLessEqual(spy.call_count, 3)
+
+    def test_until_skips_newer_entries(self):
+        lines = list(islice(timeline.timeline_lines(until=date(2025, 6, 10)), 2))
+
+        self.assertEqual(lines, ["Week ending June 07, 2025", "  - week 2025-06-07"])
+
+    def test_parse_stops_after_requested_sections(self):
+        path = config.review_path(date(2025, 6, 7))
+        parsed = parser.parse_file(path, sections={"weekly_reflection"})
+
+        self.assertEqual(list(parsed.sections), ["weekly_reflection"])
+        self.assertEqual(parsed.get_section_text("weekly_reflection"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
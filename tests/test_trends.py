@@ -0,0 +1,102 @@
+"""Tests for incrementally maintained term trends.
+
+Run with: python3 -m unittest discover tests
+"""
+
+import importlib
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from journal import config, parser, templates
+from helpers import write_daily, write_review
+
+trends = importlib.import_module("journal.commands.trends")
+
+
+class TestMonthlyTotals(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+        original = config.JOURNAL_DIR
+        config.JOURNAL_DIR = Path(self._tmp.name)
+        self.addCleanup(lambda: setattr(config, "JOURNAL_DIR", original))
+
+        write_daily(date(2026, 7, 6), "garden garden coffee")
+        write_daily(date(2026, 8, 4), "garden")
+
+    def test_counted_sections_follow_the_parser(self):
+        known = set(parser.SECTION_ALIASES.values())
+
+        self.assertLessEqual(trends.COPIED_SECTIONS, known)
+        self.assertEqual(set().union(*trends.COUNTED_SECTIONS.values()), known - trends.COPIED_SECTIONS)
+        self.assertEqual(trends.COUNTED_SECTIONS, {
+            "daily": {"journal", "summary"},
+            "review": {"weekly_reflection", "weekly_summary"},
+            "monthly": {"monthly_reflection", "monthly_summary"},
+        })
+
+    def test_counts_per_month(self):
+        months = trends.monthly_totals()
+
+        self.assertEqual(months["2026-07"]["garden"], 2)
+        self.assertEqual(months["2026-07"]["coffee"], 1)
+        self.assertEqual(months["2026-08"]["garden"], 1)
+
+    def test_headers_are_not_counted(self):
+        # "Daily Entry" and "Journal entry:" come from the template
+        self.assertNotIn("entry", trends.monthly_totals()["2026-07"])
+
+    def test_weekly_review_counts_toward_owning_month(self):
+        # Week Jul 26 - Aug 1 2026 is owned by July
+        write_review(date(2026, 8, 1), reflection="piano", summary=[])
+
+        self.assertEqual(trends.monthly_totals()["2026-07"]["piano"], 1)
+
+    def test_text_repeated_in_reviews_is_counted_once(self):
+        # The weekly review copies the daily's text, and the monthly review
+        # repeats the weekly reflection and summary
+        saturday = date(2026, 7, 11)
+        write_review(saturday, [(date(2026, 7, 6), "garden garden coffee")], "Quiet days.", ["Weeded"])
+        path = config.monthly_path(saturday)
+        path.write_text(templates.monthly_review_template(
+            saturday, {"daily_entries": 1, "weekly_reviews": 1}, [(date(2026, 7, 5), "Quiet days.")],
+            [(date(2026, 7, 5), ["Weeded"])], ["Harvest"], "Slow month."))
+
+        july = trends.monthly_totals()["2026-07"]
+
+        self.assertEqual(july["garden"], 2)
+        self.assertEqual(july["quiet"], 1)
+        self.assertEqual(july["weeded"], 1)
+        self.assertEqual(july["harvest"], 1)
+        for template_word in ("daily", "entries", "weekly", "reviews", "week", "ending", "july"):
+            self.assertNotIn(template_word, july)
+
+    def test_edit_updates_totals_from_that_file_only(self):
+        trends.monthly_totals()
+        write_daily(date(2026, 7, 6), "coffee coffee coffee")
+
+        real_parse = trends.parser.parse_file
+        with mock.patch.object(trends.parser, "parse_file", side_effect=real_parse) as spy:
+            months = trends.monthly_totals()
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(months["2026-07"]["coffee"], 3)
+        self.assertNotIn("garden", months["2026-07"])
+        self.assertEqual(months["2026-08"]["garden"], 1)
+
+    def test_deleted_file_is_subtracted(self):
+        trends.monthly_totals()
+        config.daily_path(date(2026, 8, 4)).unlink()
+
+        self.assertNotIn("2026-08", trends.monthly_totals())
+
+
+if __name__ == "__main__":
+    unittest.main()